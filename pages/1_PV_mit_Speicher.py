@@ -8,6 +8,10 @@ import streamlit.components.v1 as components
 import base64
 from pathlib import Path
 
+from schaltplaene.render.app_cache import (
+    PNG_DPI, PNG_DPI_STANDARD, gemeinsamer_cache, render_executor, sitzungs_id, svg_ablegen,
+    svg_laden, svgz_laden, vorschau_html
+)
 from schaltplaene.templates.pv_speicher_system_ueberschuss import PvSpeicherSystemUeberschuss
 
 st.title("🔋 PV-Anlage mit Speicher")
@@ -126,8 +130,8 @@ if 'generated_mit_speicher' not in st.session_state:
 if generate_clicked or not st.session_state['generated_mit_speicher']:
     with st.spinner("Generiere Schaltplan..."):
         try:
-            # Template erstellen
-            template = PvSpeicherSystemUeberschuss(
+            # Template-Parameter
+            parameter = dict(
                 f1_nennstrom_a=f1_nennstrom,
                 f2_nennstrom_a=f2_nennstrom,
                 f2_charakteristik=f2_charakteristik,
@@ -139,18 +143,15 @@ if generate_clicked or not st.session_state['generated_mit_speicher']:
                 pv_leistung=f"{pv_leistung_kwp}kWp"
             )
             
-            # Schaltplan erstellen
-            drawing = template.erstelle_schaltplan(titel=titel)
-            
-            # SVG generieren
-            svg_data = drawing.get_imagedata('svg')
-            
-            # PNG generieren
-            png_data = drawing.get_imagedata('png')
-            
-            # In Session State speichern
-            st.session_state['svg_data'] = svg_data
-            st.session_state['png_data'] = png_data
+            # SVG über das Layout-Skelett des Templates (nur Beschriftungen werden
+            # eingesetzt), gerendert im gemeinsamen Executor (thread-sicher, fair).
+            # In Session State nur Schlüssel, Parameter und Titel speichern, die
+            # Bilddaten liegen im gemeinsamen Cache aller Sitzungen
+            st.session_state['svg_schluessel'] = svg_ablegen(
+                PvSpeicherSystemUeberschuss, parameter, titel
+            )
+            st.session_state['parameter'] = parameter
+            st.session_state['titel'] = titel
             st.session_state['generated_mit_speicher'] = True
             
             st.success("✅ Schaltplan erfolgreich generiert!")
@@ -161,31 +162,57 @@ if generate_clicked or not st.session_state['generated_mit_speicher']:
 
 # Anzeige des generierten Schaltplans
 if st.session_state.get('generated_mit_speicher', False):
+    svg_schluessel = st.session_state['svg_schluessel']
+    svg_parameter = st.session_state['parameter']
+    svg_titel = st.session_state['titel']
+    svg_sitzung = sitzungs_id()
+    svgz_data = svgz_laden(svg_schluessel, PvSpeicherSystemUeberschuss, svg_parameter, svg_titel)
+    
     col1, col2 = st.columns([3, 1])
     
     with col1:
         st.subheader("📊 Vorschau")
-        # SVG als HTML anzeigen für beste Qualität
-        svg_str = st.session_state['svg_data'].decode('utf-8')
-        components.html(f'<div style="width:100%; overflow:auto;">{svg_str}</div>', height=1400, scrolling=False)
+        # SVG als HTML anzeigen für beste Qualität; übertragen wird nur das
+        # komprimierte SVG (SVGZ), der Browser entpackt es selbst
+        components.html(vorschau_html(svgz_data), height=1400, scrolling=False)
     
     with col2:
         st.subheader("💾 Downloads")
         
-        # SVG Download
+        # SVG Download: Bilddaten erst beim Klick, nicht bei jedem Rerun
         st.download_button(
             label="⬇️ SVG herunterladen",
-            data=st.session_state['svg_data'],
+            data=lambda: svg_laden(
+                svg_schluessel, PvSpeicherSystemUeberschuss, svg_parameter, svg_titel, svg_sitzung
+            ),
             file_name=f"pv_speicher_system_{wechselrichter_kw}kW_{batterie_kwh}kWh.svg",
             mime="image/svg+xml",
             use_container_width=True
         )
+        st.download_button(
+            label="⬇️ SVGZ herunterladen (komprimiert)",
+            data=svgz_data,
+            file_name=f"pv_speicher_system_{wechselrichter_kw}kW_{batterie_kwh}kWh.svgz",
+            mime="application/gzip",
+            use_container_width=True
+        )
         
-        # PNG Download
+        # PNG Download: Die Rasterung ist der teuerste Schritt und läuft erst
+        # beim Klick (Ergebnis landet im gemeinsamen Render-Cache); große
+        # Auflösungen werden gekachelt mit begrenztem Speicher gerastert
+        png_dpi = st.selectbox("PNG-Auflösung (DPI)", PNG_DPI,
+                               index=PNG_DPI.index(PNG_DPI_STANDARD))
+        png_template = PvSpeicherSystemUeberschuss(**svg_parameter)
+        png_executor = render_executor()
+        png_cache = gemeinsamer_cache()
         st.download_button(
             label="⬇️ PNG herunterladen",
-            data=st.session_state['png_data'],
-            file_name=f"pv_speicher_system_{wechselrichter_kw}kW_{batterie_kwh}kWh.png",
+            data=lambda: png_executor.ausfuehren(
+                svg_sitzung, png_template.rendere,
+                ("png",), titel=svg_titel, dpi=png_dpi, transparent=False,
+                png_modus="palette", cache=png_cache
+            )['png'],
+            file_name=f"pv_speicher_system_{wechselrichter_kw}kW_{batterie_kwh}kWh_{png_dpi}dpi.png",
             mime="image/png",
             use_container_width=True
         )
@@ -194,7 +221,7 @@ if st.session_state.get('generated_mit_speicher', False):
         st.markdown("""
         **Dateiformat-Infos:**
         - **SVG**: Vektorgrafik, beliebig skalierbar
-        - **PNG**: Rastergrafik, 300 DPI
+        - **PNG**: Rastergrafik, 150-1200 DPI (Palette, kleine Datei)
         """)
         
         st.markdown("---")
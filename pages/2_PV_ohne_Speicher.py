@@ -8,6 +8,10 @@ import streamlit.components.v1 as components
 import base64
 from pathlib import Path
 
+from schaltplaene.render.app_cache import (
+    PNG_DPI, PNG_DPI_STANDARD, gemeinsamer_cache, render_executor, sitzungs_id, svg_ablegen,
+    svg_laden, svgz_laden, vorschau_html
+)
 from schaltplaene.templates.pv_system_ueberschuss import PvSystemUeberschuss
 
 st.title("☀️ PV-Anlage ohne Speicher")
@@ -107,8 +111,8 @@ if 'generated_ohne_speicher' not in st.session_state:
 if generate_clicked or not st.session_state['generated_ohne_speicher']:
     with st.spinner("Generiere Schaltplan..."):
         try:
-            # Template erstellen
-            template = PvSystemUeberschuss(
+            # Template-Parameter
+            parameter = dict(
                 f1_nennstrom_a=f1_nennstrom,
                 f2_nennstrom_a=f2_nennstrom,
                 f2_charakteristik=f2_charakteristik,
@@ -118,18 +122,15 @@ if generate_clicked or not st.session_state['generated_ohne_speicher']:
                 pv_leistung=f"{pv_leistung_kwp}kWp"
             )
             
-            # Schaltplan erstellen
-            drawing = template.erstelle_schaltplan(titel=titel)
-            
-            # SVG generieren
-            svg_data = drawing.get_imagedata('svg')
-            
-            # PNG generieren
-            png_data = drawing.get_imagedata('png')
-            
-            # In Session State speichern
-            st.session_state['svg_data_ohne'] = svg_data
-            st.session_state['png_data_ohne'] = png_data
+            # SVG über das Layout-Skelett des Templates (nur Beschriftungen werden
+            # eingesetzt), gerendert im gemeinsamen Executor (thread-sicher, fair).
+            # In Session State nur Schlüssel, Parameter und Titel speichern, die
+            # Bilddaten liegen im gemeinsamen Cache aller Sitzungen
+            st.session_state['svg_schluessel_ohne'] = svg_ablegen(
+                PvSystemUeberschuss, parameter, titel
+            )
+            st.session_state['parameter_ohne'] = parameter
+            st.session_state['titel_ohne'] = titel
             st.session_state['generated_ohne_speicher'] = True
             
             st.success("✅ Schaltplan erfolgreich generiert!")
@@ -140,31 +141,57 @@ if generate_clicked or not st.session_state['generated_ohne_speicher']:
 
 # Anzeige des generierten Schaltplans
 if st.session_state.get('generated_ohne_speicher', False):
+    svg_schluessel = st.session_state['svg_schluessel_ohne']
+    svg_parameter = st.session_state['parameter_ohne']
+    svg_titel = st.session_state['titel_ohne']
+    svg_sitzung = sitzungs_id()
+    svgz_data = svgz_laden(svg_schluessel, PvSystemUeberschuss, svg_parameter, svg_titel)
+    
     col1, col2 = st.columns([3, 1])
     
     with col1:
         st.subheader("📊 Vorschau")
-        # SVG als HTML anzeigen für beste Qualität
-        svg_str = st.session_state['svg_data_ohne'].decode('utf-8')
-        components.html(f'<div style="width:100%; overflow:auto;">{svg_str}</div>', height=1400, scrolling=False)
+        # SVG als HTML anzeigen für beste Qualität; übertragen wird nur das
+        # komprimierte SVG (SVGZ), der Browser entpackt es selbst
+        components.html(vorschau_html(svgz_data), height=1400, scrolling=False)
     
     with col2:
         st.subheader("💾 Downloads")
         
-        # SVG Download
+        # SVG Download: Bilddaten erst beim Klick, nicht bei jedem Rerun
         st.download_button(
             label="⬇️ SVG herunterladen",
-            data=st.session_state['svg_data_ohne'],
+            data=lambda: svg_laden(
+                svg_schluessel, PvSystemUeberschuss, svg_parameter, svg_titel, svg_sitzung
+            ),
             file_name=f"pv_system_{wechselrichter_kw}kW.svg",
             mime="image/svg+xml",
             use_container_width=True
         )
+        st.download_button(
+            label="⬇️ SVGZ herunterladen (komprimiert)",
+            data=svgz_data,
+            file_name=f"pv_system_{wechselrichter_kw}kW.svgz",
+            mime="application/gzip",
+            use_container_width=True
+        )
         
-        # PNG Download
+        # PNG Download: Die Rasterung ist der teuerste Schritt und läuft erst
+        # beim Klick (Ergebnis landet im gemeinsamen Render-Cache); große
+        # Auflösungen werden gekachelt mit begrenztem Speicher gerastert
+        png_dpi = st.selectbox("PNG-Auflösung (DPI)", PNG_DPI,
+                               index=PNG_DPI.index(PNG_DPI_STANDARD))
+        png_template = PvSystemUeberschuss(**svg_parameter)
+        png_executor = render_executor()
+        png_cache = gemeinsamer_cache()
         st.download_button(
             label="⬇️ PNG herunterladen",
-            data=st.session_state['png_data_ohne'],
-            file_name=f"pv_system_{wechselrichter_kw}kW.png",
+            data=lambda: png_executor.ausfuehren(
+                svg_sitzung, png_template.rendere,
+                ("png",), titel=svg_titel, dpi=png_dpi, transparent=False,
+                png_modus="palette", cache=png_cache
+            )['png'],
+            file_name=f"pv_system_{wechselrichter_kw}kW_{png_dpi}dpi.png",
             mime="image/png",
             use_container_width=True
         )
@@ -173,7 +200,7 @@ if st.session_state.get('generated_ohne_speicher', False):
         st.markdown("""
         **Dateiformat-Infos:**
         - **SVG**: Vektorgrafik, beliebig skalierbar
-        - **PNG**: Rastergrafik, 300 DPI
+        - **PNG**: Rastergrafik, 150-1200 DPI (Palette, kleine Datei)
         """)
         
         st.markdown("---")
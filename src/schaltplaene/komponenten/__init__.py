@@ -2,20 +2,45 @@
 Wiederverwendbare elektrische Komponenten für Schaltpläne.
 """
 
-from .zaehler import Zaehler, ZaehlerPfeil, ZaehlerTarif
-from .enums import ComponentFlow
-from .schalter import Schalter
-from .leitungsschutzschalter import Leitungsschutzschalter
-from .fehlerstromschutzschalter import FISchutzschalter
-from .schmelzsicherung import Schmelzsicherung
-from .pv_module import PVModul
-from .wechselrichter import Wechselrichter
-from .batterie import Batterie
-from .ueberspannungsschutz import Ueberspannungsschutz
-from .verbrauch import Verbrauch
-from .netz import Netz
-from .erdung import Erdung
-from .pe_line import PELine, pe_line_between
+import importlib
+
+# Lazy imports (PEP 562): Die Komponenten-Module importieren Schemdraw und
+# damit Matplotlib. Sie werden erst beim ersten Zugriff auf eine Komponente
+# geladen, ``import schaltplaene.komponenten`` bleibt dadurch schnell.
+_MODULE = {
+    "Zaehler": "zaehler",
+    "ZaehlerPfeil": "zaehler",
+    "ZaehlerTarif": "zaehler",
+    "Schalter": "schalter",
+    "ComponentFlow": "enums",
+    "Leitungsschutzschalter": "leitungsschutzschalter",
+    "FISchutzschalter": "fehlerstromschutzschalter",
+    "Schmelzsicherung": "schmelzsicherung",
+    "PVModul": "pv_module",
+    "Wechselrichter": "wechselrichter",
+    "Batterie": "batterie",
+    "Ueberspannungsschutz": "ueberspannungsschutz",
+    "Verbrauch": "verbrauch",
+    "Netz": "netz",
+    "Erdung": "erdung",
+    "PELine": "pe_line",
+    "pe_line_between": "pe_line",
+}
+
+
+def __getattr__(name):
+    modul = _MODULE.get(name)
+    if modul is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    wert = getattr(importlib.import_module(f".{modul}", __name__), name)
+    # Im Modul ablegen, damit __getattr__ pro Name nur einmal läuft
+    globals()[name] = wert
+    return wert
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Zaehler",
@@ -3,12 +3,104 @@
 Batteriespeicher für PV-Anlagen und andere Anwendungen.
 """
 
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
 from schemdraw import segments
 
+# Versuche relative Imports, falle zurück auf absolute (für direkte Ausführung)
+try:
+    from .geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+except ImportError:
+    from geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+
+
+@lru_cache(maxsize=None)
+def _symbol(debug: bool) -> Symbol:
+    """
+    Linien und Anker der Batterie ohne Beschriftung.
+    
+    Hängt nur vom Debug-Modus ab, wird einmal berechnet und von allen
+    Instanzen geteilt.
+    """
+    linien = []
+    zusatz = []
+    anker = {}
+    
+    # Geometrische Parameter
+    breite = 1.0
+    hoehe = 1.0
+    
+    # Rechteck (Gehäuse)
+    linien.append(linie([
+        (-breite/2, -hoehe/2),
+        (breite/2, -hoehe/2),
+        (breite/2, hoehe/2),
+        (-breite/2, hoehe/2),
+        (-breite/2, -hoehe/2)
+    ]))
+    
+    # Batteriesymbol in der Mitte (um 90° gegen UZS gedreht)
+    # Fettes gefülltes Rechteck (negative Elektrode / Minus) - unten
+    minus_breite = 0.25
+    minus_hoehe = 0.04  # Dicke des Rechtecks
+    minus_y = -0.05
+    linien.append(linie([
+        (-minus_breite/2, minus_y - minus_hoehe/2),
+        (minus_breite/2, minus_y - minus_hoehe/2),
+        (minus_breite/2, minus_y + minus_hoehe/2),
+        (-minus_breite/2, minus_y + minus_hoehe/2),
+        (-minus_breite/2, minus_y - minus_hoehe/2)
+    ], fill='black'))
+    
+    # Dünner längerer Strich (positive Elektrode / Plus) - oben
+    plus_breite = 0.45
+    plus_dicke = 1  # Normale Linienstärke
+    plus_y = 0.05
+    linien.append(linie([
+        (-plus_breite/2, plus_y),
+        (plus_breite/2, plus_y)
+    ], lw=plus_dicke))
+    
+    # Stummel als Anschlüsse (kurz, nicht bis zum Rand)
+    stummel_laenge = 0.2
+    
+    # Unterer Stummel (von Minus-Elektrode nach unten)
+    linien.append(linie([
+        (0, minus_y),
+        (0, minus_y - stummel_laenge)
+    ]))
+    
+    # Oberer Stummel (von Plus-Elektrode nach oben)
+    linien.append(linie([
+        (0, plus_y),
+        (0, plus_y + stummel_laenge)
+    ]))
+    
+    # Ankerpunkte auf allen vier Seiten
+    anker['W'] = (-breite/2, 0)  # West (links)
+    anker['E'] = (breite/2, 0)   # East (rechts)
+    anker['N'] = (0, hoehe/2)    # North (oben)
+    anker['S'] = (0, -hoehe/2)   # South (unten)
+    anker['plus'] = (breite/2, 0)   # Plus-Pol (rechts)
+    anker['minus'] = (-breite/2, 0) # Minus-Pol (links)
+    
+    # Debug: Anchors anzeigen
+    if debug:
+        for name, pos in [('W', (-breite/2, 0)), 
+                         ('E', (breite/2, 0)),
+                         ('N', (0, hoehe/2)),
+                         ('S', (0, -hoehe/2))]:
+            zusatz.append(segments.SegmentCircle(pos, 0.05, fill='red'))
+            zusatz.append(segments.SegmentText(
+                (pos[0] * 1.2, pos[1] * 1.2), name, fontsize=6, align=('center', 'center'), color='red'
+            ))
+    
+    return Geometrie.aus_linien(linien, anker).symbol(*zusatz)
+
 
-class Batterie(elm.Element):
+class Batterie(GeteilteGeometrie, elm.Element):
     """
     Batteriespeicher nach DIN EN 60617.
     
@@ -32,99 +124,45 @@ class Batterie(elm.Element):
         
         super().__init__(**kwargs)
         
-        # Geometrische Parameter
-        breite = 1.0
-        hoehe = 1.0
-        
-        # Rechteck (Gehäuse)
-        self.segments.append(segments.Segment([
-            (-breite/2, -hoehe/2),
-            (breite/2, -hoehe/2),
-            (breite/2, hoehe/2),
-            (-breite/2, hoehe/2),
-            (-breite/2, -hoehe/2)
-        ]))
-        
-        # Batteriesymbol in der Mitte (um 90° gegen UZS gedreht)
-        # Fettes gefülltes Rechteck (negative Elektrode / Minus) - unten
-        minus_breite = 0.25
-        minus_hoehe = 0.04  # Dicke des Rechtecks
-        minus_y = -0.05
-        self.segments.append(segments.Segment([
-            (-minus_breite/2, minus_y - minus_hoehe/2),
-            (minus_breite/2, minus_y - minus_hoehe/2),
-            (minus_breite/2, minus_y + minus_hoehe/2),
-            (-minus_breite/2, minus_y + minus_hoehe/2),
-            (-minus_breite/2, minus_y - minus_hoehe/2)
-        ], fill='black'))
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        self._uebernimm(_symbol(debug))
         
-        # Dünner längerer Strich (positive Elektrode / Plus) - oben
-        plus_breite = 0.45
-        plus_dicke = 1  # Normale Linienstärke
-        plus_y = 0.05
-        self.segments.append(segments.Segment([
-            (-plus_breite/2, plus_y),
-            (plus_breite/2, plus_y)
-        ], lw=plus_dicke))
-        
-        # Stummel als Anschlüsse (kurz, nicht bis zum Rand)
-        stummel_laenge = 0.2
-        
-        # Unterer Stummel (von Minus-Elektrode nach unten)
-        self.segments.append(segments.Segment([
-            (0, minus_y),
-            (0, minus_y - stummel_laenge)
-        ]))
-        
-        # Oberer Stummel (von Plus-Elektrode nach oben)
-        self.segments.append(segments.Segment([
-            (0, plus_y),
-            (0, plus_y + stummel_laenge)
-        ]))
-        
-        # Ankerpunkte auf allen vier Seiten
-        self.anchors['W'] = (-breite/2, 0)  # West (links)
-        self.anchors['E'] = (breite/2, 0)   # East (rechts)
-        self.anchors['N'] = (0, hoehe/2)    # North (oben)
-        self.anchors['S'] = (0, -hoehe/2)   # South (unten)
-        self.anchors['plus'] = (breite/2, 0)   # Plus-Pol (rechts)
-        self.anchors['minus'] = (-breite/2, 0) # Minus-Pol (links)
-        
-        # Debug: Anchors anzeigen
-        if debug:
-            for name, pos in [('W', (-breite/2, 0)), 
-                             ('E', (breite/2, 0)),
-                             ('N', (0, hoehe/2)),
-                             ('S', (0, -hoehe/2))]:
-                self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                self.segments.append(segments.SegmentText(
-                    (pos[0] * 1.2, pos[1] * 1.2), name, fontsize=6, align=('center', 'center'), color='red'
-                ))
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self.kapazitaet_kwh = kapazitaet_kwh
+        self.spannung_v = spannung_v
+        self.hersteller = hersteller
+
+    def _beschriftung(self) -> list:
+        segmente = []
+        # Abmessungen für die Beschriftung
+        hoehe = 1.0
         
         # Beschriftung oben
-        if bezeichnung:
-            self.segments.append(segments.SegmentText(
-                (0, hoehe/2 + 0.25), bezeichnung, fontsize=10, align=('center', 'bottom')
+        if self.bezeichnung:
+            segmente.append(segments.SegmentText(
+                (0, hoehe/2 + 0.25), self.bezeichnung, fontsize=10, align=('center', 'bottom')
             ))
         
         # Technische Daten unten
         y_offset = -hoehe/2 - 0.25
-        if kapazitaet_kwh:
-            self.segments.append(segments.SegmentText(
-                (0, y_offset), f"{kapazitaet_kwh}kWh", fontsize=8, align=('center', 'top')
+        if self.kapazitaet_kwh:
+            segmente.append(segments.SegmentText(
+                (0, y_offset), f"{self.kapazitaet_kwh}kWh", fontsize=8, align=('center', 'top')
             ))
             y_offset -= 0.2
         
-        if spannung_v:
-            self.segments.append(segments.SegmentText(
-                (0, y_offset), f"{spannung_v}V", fontsize=8, align=('center', 'top')
+        if self.spannung_v:
+            segmente.append(segments.SegmentText(
+                (0, y_offset), f"{self.spannung_v}V", fontsize=8, align=('center', 'top')
             ))
             y_offset -= 0.2
         
-        if hersteller:
-            self.segments.append(segments.SegmentText(
-                (0, y_offset), hersteller, fontsize=7, align=('center', 'top')
+        if self.hersteller:
+            segmente.append(segments.SegmentText(
+                (0, y_offset), self.hersteller, fontsize=7, align=('center', 'top')
             ))
+        return segmente
 
 
 if __name__ == "__main__":
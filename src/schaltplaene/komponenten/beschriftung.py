@@ -0,0 +1,103 @@
+"""
+Gemeinsame Platzierung der Beschriftung für Komponenten mit ``label_loc``.
+
+Die Position einer Beschriftung ergibt sich nur aus dem Umriss (BBox) des
+Symbols und der Himmelsrichtung: 0.25 Einheiten neben der jeweiligen Kante,
+ausgerichtet vom Symbol weg. Richtungen und Ausrichtungen stehen in festen
+Tabellen; die Positionstabelle wird je Umriss einmal berechnet (für den
+Standard-Umriss ``KASTEN`` schon beim Import). ``place_labels()`` ist damit
+ein einfacher Tabellenzugriff.
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from schemdraw import segments
+from schemdraw.segments import BBox
+
+# Abstand der Beschriftung zum Umriss und Zeilenabstand bei mehreren Zeilen
+ABSTAND = 0.25
+ZEILENABSTAND = 0.2
+
+# Richtung (x, y) je Beschriftungsposition; 'NO'/'SO' als deutsche Varianten
+_RICHTUNGEN = {
+    'N': (0, 1),
+    'S': (0, -1),
+    'E': (1, 0),
+    'W': (-1, 0),
+    'NE': (1, 1),
+    'NO': (1, 1),
+    'NW': (-1, 1),
+    'SE': (1, -1),
+    'SO': (1, -1),
+    'SW': (-1, -1),
+}
+
+# Textausrichtung je Richtung, jeweils vom Symbol weg
+_HALIGN = {-1: 'right', 0: 'center', 1: 'left'}
+_VALIGN = {-1: 'top', 0: 'center', 1: 'bottom'}
+
+# Gegenüberliegende Position (z.B. für technische Daten auf der anderen Seite)
+GEGENUEBER = MappingProxyType({
+    loc: next(k for k, r in _RICHTUNGEN.items() if r == (-dx, -dy))
+    for loc, (dx, dy) in _RICHTUNGEN.items()
+})
+
+# Standard-Umriss der Kasten-Symbole (Wechselrichter, Verbrauch, Netz)
+KASTEN = BBox(-0.5, -0.5, 0.5, 0.5)
+
+
+@lru_cache(maxsize=None)
+def positionen(bbox: BBox) -> Mapping[str, tuple]:
+    """
+    Positionstabelle für einen Umriss.
+
+    Returns:
+        Zuordnung Beschriftungsposition -> ``((x, y), (halign, valign))``
+    """
+    x = {-1: bbox.xmin - ABSTAND, 0: (bbox.xmin + bbox.xmax) / 2, 1: bbox.xmax + ABSTAND}
+    y = {-1: bbox.ymin - ABSTAND, 0: (bbox.ymin + bbox.ymax) / 2, 1: bbox.ymax + ABSTAND}
+    return MappingProxyType({
+        loc: ((x[dx], y[dy]), (_HALIGN[dx], _VALIGN[dy]))
+        for loc, (dx, dy) in _RICHTUNGEN.items()
+    })
+
+
+positionen(KASTEN)
+
+
+def place_labels(bbox: BBox, label_loc: str, lines: Iterable[tuple],
+                 standard: str = 'N', gegenueber: bool = False) -> list:
+    """
+    Beschriftungszeilen neben einem Symbol platzieren.
+
+    Die erste Zeile liegt an der Beschriftungsposition, jede weitere
+    ``ZEILENABSTAND`` darunter (gleiche Ausrichtung). Zeilen ohne Text
+    werden übersprungen und belegen keinen Platz.
+
+    Args:
+        bbox: Umriss des Symbols (relativ zum Element)
+        label_loc: Position ('N', 'S', 'E', 'W', 'NE', 'NO', 'NW', 'SE', 'SO', 'SW')
+        lines: Zeilen als ``(text, fontsize)``
+        standard: Position für unbekannte Werte von ``label_loc``
+        gegenueber: Auf der gegenüberliegenden Seite von ``label_loc`` platzieren
+
+    Returns:
+        Liste von ``SegmentText``
+    """
+    tabelle = positionen(bbox)
+    loc = label_loc if label_loc in tabelle else label_loc.upper()
+    if loc not in tabelle:
+        loc = standard
+    if gegenueber:
+        loc = GEGENUEBER[loc]
+    (x, y), align = tabelle[loc]
+
+    texte = []
+    for text, fontsize in lines:
+        if not text:
+            continue
+        texte.append(segments.SegmentText((x, y), text, fontsize=fontsize, align=align))
+        y -= ZEILENABSTAND
+    return texte
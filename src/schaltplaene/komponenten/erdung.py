@@ -3,12 +3,87 @@
 Symbolisiert die Erdung oder Potenzialausgleichschiene.
 """
 
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
 from schemdraw import segments
+from schemdraw.segments import BBox
+
+# Versuche relative Imports, falle zurück auf absolute (für direkte Ausführung)
+try:
+    from .beschriftung import place_labels
+    from .geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+except ImportError:
+    from beschriftung import place_labels
+    from geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+
+
+# Umriss für die Beschriftung: Anschluss oben bei y=0, Balken bis y=-0.5
+_UMRISS = BBox(-0.3, -0.5, 0.3, 0.0)
+
+
+@lru_cache(maxsize=None)
+def _symbol(debug: bool) -> Symbol:
+    """
+    Linien und Anker des Erdungssymbols ohne Beschriftung.
+    
+    Hängt nur vom Debug-Modus ab, wird einmal berechnet und von allen
+    Instanzen geteilt.
+    """
+    linien = []
+    zusatz = []
+    anker = {}
+    
+    # Geometrische Parameter
+    verbindung_laenge = 0.3  # Länge der Verbindungsleitung nach oben
+    balken_abstand = 0.1    # Vertikaler Abstand zwischen Balken
+    balken1_breite = 0.6    # Breitester Balken (oben)
+    balken2_breite = 0.4    # Mittlerer Balken
+    balken3_breite = 0.2    # Schmalster Balken (unten)
+    
+    # Vertikale Verbindungsleitung
+    linien.append(linie([
+        (0, 0),
+        (0, -verbindung_laenge)
+    ]))
+    
+    # Erster Balken (breitester, oben)
+    balken1_y = -verbindung_laenge
+    linien.append(linie([
+        (-balken1_breite/2, balken1_y),
+        (balken1_breite/2, balken1_y)
+    ]))
+    
+    # Zweiter Balken (mittel)
+    balken2_y = balken1_y - balken_abstand
+    linien.append(linie([
+        (-balken2_breite/2, balken2_y),
+        (balken2_breite/2, balken2_y)
+    ]))
+    
+    # Dritter Balken (schmalster, unten)
+    balken3_y = balken2_y - balken_abstand
+    linien.append(linie([
+        (-balken3_breite/2, balken3_y),
+        (balken3_breite/2, balken3_y)
+    ]))
+    
+    # Ankerpunkt oben (Verbindungspunkt)
+    anker['N'] = (0, 0)  # Oben
+    anker['start'] = (0, 0)  # Alias für N
+    
+    # Debug: Anchors anzeigen
+    if debug:
+        zusatz.append(segments.SegmentCircle((0, 0), 0.05, fill='red'))
+        zusatz.append(segments.SegmentText(
+            (0.1, 0.1), 'N/start', fontsize=6, align=('left', 'center'), color='red'
+        ))
+    
+    return Geometrie.aus_linien(linien, anker).symbol(*zusatz)
 
 
-class Erdung(elm.Element):
+class Erdung(GeteilteGeometrie, elm.Element):
     """
     Erdungssymbol nach DIN EN 60617.
     
@@ -29,73 +104,16 @@ class Erdung(elm.Element):
         
         super().__init__(**kwargs)
         
-        # Geometrische Parameter
-        verbindung_laenge = 0.3  # Länge der Verbindungsleitung nach oben
-        balken_abstand = 0.1    # Vertikaler Abstand zwischen Balken
-        balken1_breite = 0.6    # Breitester Balken (oben)
-        balken2_breite = 0.4    # Mittlerer Balken
-        balken3_breite = 0.2    # Schmalster Balken (unten)
-        
-        # Vertikale Verbindungsleitung
-        self.segments.append(segments.Segment([
-            (0, 0),
-            (0, -verbindung_laenge)
-        ]))
-        
-        # Erster Balken (breitester, oben)
-        balken1_y = -verbindung_laenge
-        self.segments.append(segments.Segment([
-            (-balken1_breite/2, balken1_y),
-            (balken1_breite/2, balken1_y)
-        ]))
-        
-        # Zweiter Balken (mittel)
-        balken2_y = balken1_y - balken_abstand
-        self.segments.append(segments.Segment([
-            (-balken2_breite/2, balken2_y),
-            (balken2_breite/2, balken2_y)
-        ]))
-        
-        # Dritter Balken (schmalster, unten)
-        balken3_y = balken2_y - balken_abstand
-        self.segments.append(segments.Segment([
-            (-balken3_breite/2, balken3_y),
-            (balken3_breite/2, balken3_y)
-        ]))
-        
-        # Ankerpunkt oben (Verbindungspunkt)
-        self.anchors['N'] = (0, 0)  # Oben
-        self.anchors['start'] = (0, 0)  # Alias für N
-        
-        # Debug: Anchors anzeigen
-        if debug:
-            self.segments.append(segments.SegmentCircle((0, 0), 0.05, fill='red'))
-            self.segments.append(segments.SegmentText(
-                (0.1, 0.1), 'N/start', fontsize=6, align=('left', 'center'), color='red'
-            ))
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        self._uebernimm(_symbol(debug))
         
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self.label_loc = label_loc
+
+    def _beschriftung(self) -> list:
         # Beschriftung an angegebener Position
-        if bezeichnung:
-            # Bounding box für Label-Positionierung
-            gesamt_hoehe = verbindung_laenge + 2 * balken_abstand
-            gesamt_breite = balken1_breite
-            
-            label_positions = {
-                'N': ((0, 0.25), ('center', 'bottom')),
-                'S': ((0, -(gesamt_hoehe + 0.25)), ('center', 'top')),
-                'E': ((gesamt_breite/2 + 0.25, -gesamt_hoehe/2), ('left', 'center')),
-                'W': ((-gesamt_breite/2 - 0.25, -gesamt_hoehe/2), ('right', 'center')),
-                'NE': ((gesamt_breite/2 + 0.25, 0.25), ('left', 'bottom')),
-                'NO': ((gesamt_breite/2 + 0.25, 0.25), ('left', 'bottom')),
-                'NW': ((-gesamt_breite/2 - 0.25, 0.25), ('right', 'bottom')),
-                'SE': ((gesamt_breite/2 + 0.25, -(gesamt_hoehe + 0.25)), ('left', 'top')),
-                'SO': ((gesamt_breite/2 + 0.25, -(gesamt_hoehe + 0.25)), ('left', 'top')),
-                'SW': ((-gesamt_breite/2 - 0.25, -(gesamt_hoehe + 0.25)), ('right', 'top'))
-            }
-            pos, align = label_positions.get(label_loc.upper(), label_positions['E'])
-            self.segments.append(segments.SegmentText(
-                pos, bezeichnung, fontsize=10, align=align
-            ))
+        return place_labels(_UMRISS, self.label_loc, [(self.bezeichnung, 10)], standard='E')
 
 
 if __name__ == "__main__":
@@ -2,18 +2,47 @@
 Fehlerstrom-Schutzschalter-Komponenten (FI-Schalter, RCD).
 """
 
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
 from schemdraw.elements import Element
-from schemdraw import segments
 
 try:
     from .enums import ComponentFlow
+    from .geometrie import (Geometrie, GeteilteGeometrie, Symbol, ausgerichtete_texte,
+                            debug_marker, flussrichtung)
+    from .schutzgeraete import AUSLOESEPFEIL, KONTAKTE, SCHALTMESSER, STOESSEL
 except ImportError:
     from enums import ComponentFlow
+    from geometrie import (Geometrie, GeteilteGeometrie, Symbol, ausgerichtete_texte,
+                           debug_marker, flussrichtung)
+    from schutzgeraete import AUSLOESEPFEIL, KONTAKTE, SCHALTMESSER, STOESSEL
+
+
+@lru_cache(maxsize=None)
+def _grundform() -> Geometrie:
+    """
+    Linien und Anker des FI-Schalters in der vertikalen Grundform
+    (Fluss von unten nach oben). Alle Flussrichtungen werden daraus abgebildet.
+    """
+    # Wie der LS-Schalter, zusätzlich mit Stößel am Pfeil (FI-spezifisch)
+    return KONTAKTE + SCHALTMESSER + AUSLOESEPFEIL + STOESSEL
+
 
+@lru_cache(maxsize=None)
+def _symbol(richtung: str, debug: bool) -> Symbol:
+    """
+    Linien und Anker des FI-Schalters ohne Beschriftung.
+    
+    Hängt nur von Flussrichtung und Debug-Modus ab, wird je Variante einmal
+    berechnet und von allen Instanzen geteilt.
+    """
+    geometrie = _grundform().ausgerichtet(richtung)
+    zusatz = debug_marker(geometrie.anker, richtung) if debug else ()
+    return geometrie.symbol(*zusatz)
 
-class FISchutzschalter(Element):
+class FISchutzschalter(GeteilteGeometrie, Element):
     """
     Fehlerstrom-Schutzschalter (FI-Schalter / RCD) nach DIN EN 60617.
     
@@ -27,270 +56,72 @@ class FISchutzschalter(Element):
         nennstrom_a: Nennstrom in Ampere
         ausloesstrom_ma: Auslösestrom in Milliampere (üblicherweise 30mA)
         flow: Orientierung des Schalters (FLOW_V oder FLOW_H)
+        drehung: Zusätzliche Drehung gegen den Uhrzeigersinn (Vielfaches von 90°)
         debug: Debug-Modus zur Anzeige der Anchors
     """
     
     def __init__(self, bezeichnung: str = "FI", typ: str = "A", 
                  nennstrom_a: int = None, ausloesstrom_ma: int = 30,
                  flow: ComponentFlow = ComponentFlow.FLOW_V, 
-                 debug: bool = False, *args, **kwargs):
+                 debug: bool = False, drehung: int = 0, *args, **kwargs):
         
-        # Theta-Fix für horizontale Ausrichtung
-        if flow == ComponentFlow.FLOW_H and 'theta' not in kwargs:
+        # Theta-Fix für horizontale bzw. gedrehte Ausrichtung
+        if (flow == ComponentFlow.FLOW_H or drehung) and 'theta' not in kwargs:
             kwargs['theta'] = 0
             
         super().__init__(*args, **kwargs)
+        richtung = flussrichtung(flow, drehung)
         
-        leitungs_laenge = 0.6
-        kontakt_abstand = 0.65
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        self._uebernimm(_symbol(richtung, debug))
         
-        if flow == ComponentFlow.FLOW_V:
-            # Vertikale Ausrichtung
-            # Unterer Kontakt
-            self.segments.append(segments.Segment([
-                (0, -leitungs_laenge), (0, -kontakt_abstand/2)
-            ]))
-            
-            # Oberer Kontakt
-            self.segments.append(segments.Segment([
-                (0, kontakt_abstand/2), (0, leitungs_laenge)
-            ]))
-            
-            # Schaltmesser (schräg zur Seite, geöffnet)
-            messer_laenge = 0.55
-            messer_ende_x = 0.15
-            messer_ende_y = -kontakt_abstand/2 + messer_laenge
-            
-            self.segments.append(segments.Segment([
-                (0, -kontakt_abstand/2), (messer_ende_x, messer_ende_y)
-            ]))
-            
-            # Pfeil am Kontaktmesser (senkrecht nach außen, zum Ende hin verschoben)
-            pfeil_pos = 0.7  # Position entlang des Messers (70%)
-            pfeil_x = messer_ende_x * pfeil_pos
-            pfeil_y = -kontakt_abstand/2 + messer_laenge * pfeil_pos
-            pfeil_laenge = 0.2
-            
-            # Pfeil senkrecht zum Messer nach außen (rechts)
-            pfeil_end_x = pfeil_x + pfeil_laenge
-            pfeil_end_y = pfeil_y - pfeil_laenge * 0.3  # Ausgleich für Messerwinkel
-            
-            # Pfeilschaft
-            self.segments.append(segments.Segment([
-                (pfeil_x, pfeil_y), (pfeil_end_x, pfeil_end_y)
-            ]))
-            
-            # Ausgefüllte Pfeilspitze (Dreieck) - senkrecht zur Pfeilrichtung
-            spitze_laenge = 0.08
-            spitze_breite = 0.05
-            
-            # Pfeilrichtung
-            pfeil_dx = pfeil_end_x - pfeil_x
-            pfeil_dy = pfeil_end_y - pfeil_y
-            pfeil_len = (pfeil_dx**2 + pfeil_dy**2)**0.5
-            
-            # Normierte Richtungen
-            pfeil_dx_norm = pfeil_dx / pfeil_len
-            pfeil_dy_norm = pfeil_dy / pfeil_len
-            
-            # Senkrechte Richtung (90° gedreht)
-            perp_dx = -pfeil_dy_norm
-            perp_dy = pfeil_dx_norm
-            
-            # Punkte der Pfeilspitze
-            basis_x = pfeil_end_x - spitze_laenge * pfeil_dx_norm
-            basis_y = pfeil_end_y - spitze_laenge * pfeil_dy_norm
-            
-            self.segments.append(segments.Segment([
-                (pfeil_end_x, pfeil_end_y),
-                (basis_x + spitze_breite * perp_dx, basis_y + spitze_breite * perp_dy),
-                (basis_x - spitze_breite * perp_dx, basis_y - spitze_breite * perp_dy),
-                (pfeil_end_x, pfeil_end_y)
-            ], fill='black'))
-            
-            # Stößel am Pfeil (FI-spezifisch)
-            stossel_kurz = 0.08  # Kurzer Querstrich an der Pfeilspitze
-            stossel_lang = 0.15  # Längerer Strich, der den Pfeil fortsetzt
-            stossel_abstand = 0.06  # Abstand zwischen Pfeil und Stößel
-            
-            # Kurzer horizontaler Strich (senkrecht zur Pfeilrichtung, mit Abstand)
-            stossel_quer_x = pfeil_end_x + stossel_abstand * pfeil_dx_norm
-            stossel_quer_y = pfeil_end_y + stossel_abstand * pfeil_dy_norm
-            self.segments.append(segments.Segment([
-                (stossel_quer_x + stossel_kurz * perp_dx, stossel_quer_y + stossel_kurz * perp_dy),
-                (stossel_quer_x - stossel_kurz * perp_dx, stossel_quer_y - stossel_kurz * perp_dy)
-            ]))
-            
-            # Längerer Strich, der den Pfeil fortsetzt (mit Abstand)
-            stossel_start_x = pfeil_end_x + stossel_abstand * pfeil_dx_norm
-            stossel_start_y = pfeil_end_y + stossel_abstand * pfeil_dy_norm
-            stossel_end_x = pfeil_end_x + (stossel_lang + stossel_abstand) * pfeil_dx_norm
-            stossel_end_y = pfeil_end_y + (stossel_lang + stossel_abstand) * pfeil_dy_norm
-            self.segments.append(segments.Segment([
-                (stossel_start_x, stossel_start_y),
-                (stossel_end_x, stossel_end_y)
-            ]))
-            
-            self.anchors['start'] = (0, -leitungs_laenge)
-            self.anchors['end'] = (0, leitungs_laenge)
-            
-            # Debug: Anchors anzeigen
-            if debug:
-                for name, pos in [('start', (0, -leitungs_laenge)), 
-                                 ('end', (0, leitungs_laenge))]:
-                    self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                    self.segments.append(segments.SegmentText(
-                        (pos[0] + 0.15, pos[1]), name, fontsize=6, align=('left', 'center'), color='red'
-                    ))
-            
-            # Beschriftung rechts
-            if bezeichnung:
-                self.segments.append(segments.SegmentText(
-                    (0.6, 0.2), bezeichnung, fontsize=10, align=('left', 'center')
-                ))
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self.typ = typ
+        self.nennstrom_a = nennstrom_a
+        self.ausloesstrom_ma = ausloesstrom_ma
+        self._richtung = richtung
+
+    def _beschriftung(self) -> list:
+        texte = []
+        if self._richtung in ('oben', 'unten'):
+            # Beschriftung rechts (bei "unten" links)
+            stil = dict(align=('left', 'center'))
+            if self.bezeichnung:
+                texte.append(((0.6, 0.2), self.bezeichnung, dict(stil, fontsize=10)))
             
             # Technische Daten
-            y_offset = -0.05 if bezeichnung else 0.2
-            if nennstrom_a:
-                self.segments.append(segments.SegmentText(
-                    (0.6, y_offset), f"{nennstrom_a}A", fontsize=8, align=('left', 'center')
-                ))
+            y_offset = -0.05 if self.bezeichnung else 0.2
+            if self.nennstrom_a:
+                texte.append(((0.6, y_offset), f"{self.nennstrom_a}A", dict(stil, fontsize=8)))
                 y_offset -= 0.25
             
-            if ausloesstrom_ma:
-                self.segments.append(segments.SegmentText(
-                    (0.6, y_offset), f"{ausloesstrom_ma}mA", fontsize=8, align=('left', 'center')
-                ))
+            if self.ausloesstrom_ma:
+                texte.append(((0.6, y_offset), f"{self.ausloesstrom_ma}mA", dict(stil, fontsize=8)))
                 y_offset -= 0.25
             
-            if typ:
-                self.segments.append(segments.SegmentText(
-                    (0.6, y_offset), f"Typ {typ}", fontsize=7, align=('left', 'center')
-                ))
+            if self.typ:
+                texte.append(((0.6, y_offset), f"Typ {self.typ}", dict(stil, fontsize=7)))
         else:
-            # Horizontale Ausrichtung
-            # Linker Kontakt
-            self.segments.append(segments.Segment([
-                (-leitungs_laenge, 0), (-kontakt_abstand/2, 0)
-            ]))
-            
-            # Rechter Kontakt
-            self.segments.append(segments.Segment([
-                (kontakt_abstand/2, 0), (leitungs_laenge, 0)
-            ]))
-            
-            # Schaltmesser (schräg nach oben, geöffnet)
-            messer_laenge = 0.55
-            messer_ende_x = -kontakt_abstand/2 + messer_laenge
-            messer_ende_y = 0.15
-            
-            self.segments.append(segments.Segment([
-                (-kontakt_abstand/2, 0), (messer_ende_x, messer_ende_y)
-            ]))
-            
-            # Pfeil am Kontaktmesser (senkrecht nach außen, zum Ende hin verschoben)
-            pfeil_pos = 0.7  # Position entlang des Messers (70%)
-            pfeil_x = -kontakt_abstand/2 + messer_laenge * pfeil_pos
-            pfeil_y = messer_ende_y * pfeil_pos
-            pfeil_laenge = 0.2
-            
-            # Pfeil senkrecht zum Messer nach außen (oben)
-            pfeil_end_x = pfeil_x - pfeil_laenge * 0.3  # Ausgleich für Messerwinkel
-            pfeil_end_y = pfeil_y + pfeil_laenge
-            
-            # Pfeilschaft
-            self.segments.append(segments.Segment([
-                (pfeil_x, pfeil_y), (pfeil_end_x, pfeil_end_y)
-            ]))
-            
-            # Ausgefüllte Pfeilspitze (Dreieck) - senkrecht zur Pfeilrichtung
-            spitze_laenge = 0.08
-            spitze_breite = 0.05
-            
-            # Pfeilrichtung
-            pfeil_dx = pfeil_end_x - pfeil_x
-            pfeil_dy = pfeil_end_y - pfeil_y
-            pfeil_len = (pfeil_dx**2 + pfeil_dy**2)**0.5
-            
-            # Normierte Richtungen
-            pfeil_dx_norm = pfeil_dx / pfeil_len
-            pfeil_dy_norm = pfeil_dy / pfeil_len
-            
-            # Senkrechte Richtung (90° gedreht)
-            perp_dx = -pfeil_dy_norm
-            perp_dy = pfeil_dx_norm
-            
-            # Punkte der Pfeilspitze
-            basis_x = pfeil_end_x - spitze_laenge * pfeil_dx_norm
-            basis_y = pfeil_end_y - spitze_laenge * pfeil_dy_norm
-            
-            self.segments.append(segments.Segment([
-                (pfeil_end_x, pfeil_end_y),
-                (basis_x + spitze_breite * perp_dx, basis_y + spitze_breite * perp_dy),
-                (basis_x - spitze_breite * perp_dx, basis_y - spitze_breite * perp_dy),
-                (pfeil_end_x, pfeil_end_y)
-            ], fill='black'))
-            
-            # Stößel am Pfeil (FI-spezifisch)
-            stossel_kurz = 0.08  # Kurzer Querstrich an der Pfeilspitze
-            stossel_lang = 0.15  # Längerer Strich, der den Pfeil fortsetzt
-            stossel_abstand = 0.06  # Abstand zwischen Pfeil und Stößel
-            
-            # Kurzer horizontaler Strich (senkrecht zur Pfeilrichtung, mit Abstand)
-            stossel_quer_x = pfeil_end_x + stossel_abstand * pfeil_dx_norm
-            stossel_quer_y = pfeil_end_y + stossel_abstand * pfeil_dy_norm
-            self.segments.append(segments.Segment([
-                (stossel_quer_x + stossel_kurz * perp_dx, stossel_quer_y + stossel_kurz * perp_dy),
-                (stossel_quer_x - stossel_kurz * perp_dx, stossel_quer_y - stossel_kurz * perp_dy)
-            ]))
-            
-            # Längerer Strich, der den Pfeil fortsetzt (mit Abstand)
-            stossel_start_x = pfeil_end_x + stossel_abstand * pfeil_dx_norm
-            stossel_start_y = pfeil_end_y + stossel_abstand * pfeil_dy_norm
-            stossel_end_x = pfeil_end_x + (stossel_lang + stossel_abstand) * pfeil_dx_norm
-            stossel_end_y = pfeil_end_y + (stossel_lang + stossel_abstand) * pfeil_dy_norm
-            self.segments.append(segments.Segment([
-                (stossel_start_x, stossel_start_y),
-                (stossel_end_x, stossel_end_y)
-            ]))
-            
-            self.anchors['start'] = (-leitungs_laenge, 0)
-            self.anchors['end'] = (leitungs_laenge, 0)
-            
-            # Debug: Anchors anzeigen
-            if debug:
-                for name, pos in [('start', (-leitungs_laenge, 0)), 
-                                 ('end', (leitungs_laenge, 0))]:
-                    self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                    self.segments.append(segments.SegmentText(
-                        (pos[0], pos[1] - 0.15), name, fontsize=6, align=('center', 'top'), color='red'
-                    ))
-            
-            # Beschriftung unten
+            # Beschriftung unten (bei "links" oben)
+            stil = dict(align=('center', 'top'))
             y_offset = -0.35
-            if bezeichnung:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), bezeichnung, fontsize=10, align=('center', 'top')
-                ))
+            if self.bezeichnung:
+                texte.append(((0, y_offset), self.bezeichnung, dict(stil, fontsize=10)))
                 y_offset -= 0.25
             
             # Technische Daten
-            if nennstrom_a:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), f"{nennstrom_a}A", fontsize=7, align=('center', 'top')
-                ))
+            if self.nennstrom_a:
+                texte.append(((0, y_offset), f"{self.nennstrom_a}A", dict(stil, fontsize=7)))
                 y_offset -= 0.2
             
-            if ausloesstrom_ma:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), f"{ausloesstrom_ma}mA", fontsize=7, align=('center', 'top')
-                ))
+            if self.ausloesstrom_ma:
+                texte.append(((0, y_offset), f"{self.ausloesstrom_ma}mA", dict(stil, fontsize=7)))
                 y_offset -= 0.2
             
-            if typ:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), f"Typ {typ}", fontsize=6, align=('center', 'top')
-                ))
+            if self.typ:
+                texte.append(((0, y_offset), f"Typ {self.typ}", dict(stil, fontsize=6)))
+        return ausgerichtete_texte(texte, self._richtung)
 
 
 if __name__ == "__main__":
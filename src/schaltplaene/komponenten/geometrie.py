@@ -0,0 +1,409 @@
+"""
+Gemeinsam genutzte Symbolgeometrie (Flyweight) für Komponenten.
+
+Die Linien eines Symbols hängen nur von wenigen Parametern ab (Ausrichtung,
+Pfeile, Tarif, HAK-Rahmen, ...). Jede Variante wird einmal berechnet und als
+unveränderliches ``Symbol`` von allen Instanzen geteilt; je Instanz kommt nur
+noch die Beschriftung hinzu.
+
+Die Linien selbst liegen als ``Geometrie`` in einem zusammenhängenden
+NumPy-Koordinatenarray. Spiegeln, Drehen, Skalieren und Verschieben ist eine
+einzige affine Abbildung auf diesem Array (inklusive der Ankerpunkte).
+
+Symbole mit Flussrichtung (Schalter, Sicherungen, ...) werden nur in der
+vertikalen Grundform (Fluss von unten nach oben) definiert. Die übrigen
+Flussrichtungen entstehen daraus über ``ausrichtung()``.
+
+Gekrümmte Linien (z.B. die AC-Welle des Wechselrichters) werden mit einer
+Anzahl Stützstellen angenähert, die zur Ausgabe passt (``kurvenaufloesung()``).
+"""
+
+import copy
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+import numpy as np
+from schemdraw import segments
+from schemdraw.segments import BBox
+
+try:
+    from .enums import ComponentFlow
+except ImportError:
+    from enums import ComponentFlow
+
+
+class Symbol(NamedTuple):
+    """Vorberechnete Geometrie einer Symbolvariante.
+
+    Attributes:
+        segmente: Segmente des Symbols (werden nicht verändert)
+        anker: Ankerpunkte des Symbols
+        umriss: Umgebendes Rechteck der Segmente ohne Texte
+            (wie ``Element.get_bbox(includetext=False)``)
+    """
+    segmente: tuple
+    anker: Mapping[str, tuple]
+    umriss: BBox
+
+
+def _umriss(segmente) -> BBox:
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
+    for segment in segmente:
+        if isinstance(segment, segments.SegmentText):
+            continue
+        sxmin, symin, sxmax, symax = segment.get_bbox()
+        xmin, ymin = min(xmin, sxmin), min(ymin, symin)
+        xmax, ymax = max(xmax, sxmax), max(ymax, symax)
+    return BBox(xmin, ymin, xmax, ymax)
+
+
+def symbol(segmente, anker: dict) -> Symbol:
+    """Friert Segmente und Anker zu einem gemeinsam nutzbaren Symbol ein."""
+    segmente = tuple(segmente)
+    return Symbol(segmente, MappingProxyType(dict(anker)), _umriss(segmente))
+
+
+class Linie(NamedTuple):
+    """Linienzug mit Stil-Parametern für ``segments.Segment`` (fill, ls, lw, ...)."""
+    punkte: tuple
+    stil: Mapping
+
+
+def linie(punkte, **stil) -> Linie:
+    """Kurzform für einen Linienzug, z.B. ``linie([(0, 0), (1, 0)], ls='--')``."""
+    return Linie(tuple(punkte), stil)
+
+
+# Affine Abbildungen als 3x3-Matrizen (homogene Koordinaten)
+
+def spiegelung(x: bool = False, y: bool = False) -> np.ndarray:
+    """Spiegelt an der y-Achse (``x=True``) und/oder an der x-Achse (``y=True``)."""
+    return np.diag([-1.0 if x else 1.0, -1.0 if y else 1.0, 1.0])
+
+
+def drehung(grad: float) -> np.ndarray:
+    """Drehung gegen den Uhrzeigersinn um den Ursprung.
+
+    Vielfache von 90° werden exakt abgebildet (keine Rundungsreste wie
+    ``cos(90°) = 6e-17``), damit gedrehte Symbole achsenparallel bleiben.
+    """
+    viertel, rest = divmod(grad, 90)
+    if rest == 0:
+        cos, sin = ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))[int(viertel) % 4]
+    else:
+        cos, sin = math.cos(math.radians(grad)), math.sin(math.radians(grad))
+    return np.array([[cos, -sin, 0.0], [sin, cos, 0.0], [0.0, 0.0, 1.0]])
+
+
+def skalierung(fx: float, fy: float = None) -> np.ndarray:
+    """Skaliert um ``fx`` (und ``fy``, Standard: gleich ``fx``)."""
+    return np.diag([fx, fx if fy is None else fy, 1.0])
+
+
+def verschiebung(dx: float, dy: float) -> np.ndarray:
+    """Verschiebt um ``(dx, dy)``."""
+    return np.array([[1.0, 0.0, dx], [0.0, 1.0, dy], [0.0, 0.0, 1.0]])
+
+
+# Flussrichtungen in Drehreihenfolge (gegen den Uhrzeigersinn, je 90°)
+RICHTUNGEN = ('oben', 'links', 'unten', 'rechts')
+
+# Abbildung der vertikalen Grundform auf die vier Flussrichtungen. "rechts"
+# (FLOW_H) ist die Grundform gedreht um -90° und an der Flussachse gespiegelt
+# (= an der Winkelhalbierenden gespiegelt), damit Schaltmesser und Pfeile wie
+# gewohnt nach oben zeigen. "unten" und "links" sind die um 180° gedrehten
+# Formen von "oben" und "rechts".
+_TRANSPOSITION = spiegelung(y=True) @ drehung(-90)
+_AUSRICHTUNG = {
+    'oben': np.eye(3),
+    'rechts': _TRANSPOSITION,
+    'unten': drehung(180),
+    'links': drehung(180) @ _TRANSPOSITION,
+}
+
+# Seite der Beschriftung je Flussrichtung (in Flussrichtung gesehen rechts)
+SEITE = {'oben': 'E', 'rechts': 'S', 'unten': 'W', 'links': 'N'}
+
+
+def flussrichtung(flow: ComponentFlow, grad: int = 0) -> str:
+    """
+    Flussrichtung aus Orientierung und zusätzlicher Drehung.
+
+    Args:
+        flow: FLOW_V (Grundrichtung "oben") oder FLOW_H (Grundrichtung "rechts")
+        grad: Zusätzliche Drehung gegen den Uhrzeigersinn (Vielfaches von 90°)
+
+    Returns:
+        "oben", "links", "unten" oder "rechts"
+    """
+    if grad % 90:
+        raise ValueError(f"Drehung muss ein Vielfaches von 90° sein, nicht {grad}")
+    start = RICHTUNGEN.index('rechts' if flow == ComponentFlow.FLOW_H else 'oben')
+    return RICHTUNGEN[(start + int(grad) // 90) % 4]
+
+
+def ausrichtung(richtung: str) -> np.ndarray:
+    """Affine Abbildung der vertikalen Grundform auf eine Flussrichtung."""
+    return _AUSRICHTUNG[richtung]
+
+
+# Stützstellen je Kurve: Standard für SVG/Bildschirm, Grenzen für die Ausgabe
+KURVENSCHRITTE = 20
+KURVENSCHRITTE_MIN = 6
+KURVENSCHRITTE_MAX = 48
+
+# Pro Thread bzw. Kontext, damit gleichzeitige Renders sich nicht beeinflussen
+_kurvenschritte = ContextVar('kurvenschritte', default=KURVENSCHRITTE)
+
+
+def kurvenschritte() -> int:
+    """Aktuelle Anzahl Stützstellen je Kurve (siehe ``kurvenaufloesung()``)."""
+    return _kurvenschritte.get()
+
+
+@contextmanager
+def kurvenaufloesung(schritte: int):
+    """
+    Stützstellen je Kurve für alle Komponenten, die im Block erzeugt werden.
+
+    Args:
+        schritte: Anzahl Abschnitte je Kurve (wird auf
+            ``KURVENSCHRITTE_MIN``..``KURVENSCHRITTE_MAX`` begrenzt)
+    """
+    token = _kurvenschritte.set(max(KURVENSCHRITTE_MIN, min(KURVENSCHRITTE_MAX, int(schritte))))
+    try:
+        yield
+    finally:
+        _kurvenschritte.reset(token)
+
+
+class Geometrie:
+    """
+    Linienzüge und Ankerpunkte eines Symbols als NumPy-Array.
+
+    Alle Punkte aller Linienzüge und danach alle Ankerpunkte liegen in einem
+    zusammenhängenden (N, 2)-Array ``punkte``. ``grenzen`` enthält die
+    Startindizes der Linienzüge (der letzte Eintrag ist das Ende der
+    Linienpunkte), ``stile`` die Stil-Parameter je Linienzug.
+
+    Geometrie-Objekte sind unveränderlich; Transformationen liefern neue
+    Objekte. Die daraus erzeugten Schemdraw-Segmente werden einmal erzeugt
+    und dann geteilt (siehe ``Symbol``).
+    """
+
+    __slots__ = ('punkte', 'grenzen', 'stile', 'anker_namen', '_segmente', '_anker')
+
+    def __init__(self, punkte: np.ndarray, grenzen: tuple, stile: tuple, anker_namen: tuple = ()):
+        self.punkte = punkte
+        self.punkte.flags.writeable = False
+        self.grenzen = grenzen
+        self.stile = stile
+        self.anker_namen = anker_namen
+        self._segmente = None
+        self._anker = None
+
+    @classmethod
+    def aus_linien(cls, linien, anker: dict = None) -> 'Geometrie':
+        """
+        Baut eine Geometrie aus Linienzügen und Ankerpunkten.
+
+        Args:
+            linien: Folge von ``Linie`` (siehe ``linie()``)
+            anker: Ankerpunkte als Dictionary Name -> (x, y)
+        """
+        anker = anker or {}
+        grenzen = [0]
+        koordinaten = []
+        for zug in linien:
+            koordinaten.extend(zug.punkte)
+            grenzen.append(len(koordinaten))
+        koordinaten.extend(anker.values())
+        punkte = np.array(koordinaten, dtype=float).reshape(-1, 2)
+        return cls(punkte, tuple(grenzen), tuple(zug.stil for zug in linien), tuple(anker))
+
+    def affin(self, matrix: np.ndarray) -> 'Geometrie':
+        """Wendet eine affine Abbildung (3x3-Matrix) auf alle Punkte und Anker an."""
+        punkte = self.punkte @ matrix[:2, :2].T + matrix[:2, 2]
+        return Geometrie(punkte, self.grenzen, self.stile, self.anker_namen)
+
+    def gespiegelt(self, x: bool = False, y: bool = False) -> 'Geometrie':
+        """Gespiegelte Kopie (``x``: links/rechts tauschen, ``y``: oben/unten tauschen)."""
+        if not (x or y):
+            return self
+        return self.affin(spiegelung(x, y))
+
+    def gedreht(self, grad: float) -> 'Geometrie':
+        """Um ``grad`` gegen den Uhrzeigersinn gedrehte Kopie."""
+        return self.affin(drehung(grad)) if grad % 360 else self
+
+    def ausgerichtet(self, richtung: str) -> 'Geometrie':
+        """Kopie für eine Flussrichtung (siehe ``ausrichtung()``), Grundform ist "oben"."""
+        return self if richtung == 'oben' else self.affin(ausrichtung(richtung))
+
+    def skaliert(self, fx: float, fy: float = None) -> 'Geometrie':
+        """Skalierte Kopie."""
+        return self.affin(skalierung(fx, fy))
+
+    def verschoben(self, dx: float, dy: float) -> 'Geometrie':
+        """Verschobene Kopie."""
+        return self.affin(verschiebung(dx, dy))
+
+    def __add__(self, andere: 'Geometrie') -> 'Geometrie':
+        """Fasst zwei Geometrien zusammen (Anker von ``andere`` haben Vorrang)."""
+        n_self, n_andere = self.grenzen[-1], andere.grenzen[-1]
+        anker = dict(zip(self.anker_namen, self.punkte[n_self:]))
+        anker.update(zip(andere.anker_namen, andere.punkte[n_andere:]))
+        punkte = np.concatenate([
+            self.punkte[:n_self], andere.punkte[:n_andere],
+            np.reshape(list(anker.values()), (-1, 2)),
+        ])
+        grenzen = self.grenzen + tuple(n_self + g for g in andere.grenzen[1:])
+        return Geometrie(punkte, grenzen, self.stile + andere.stile, tuple(anker))
+
+    def bbox(self) -> BBox:
+        """Umgebendes Rechteck aller Linienzüge (ohne Anker)."""
+        linienpunkte = self.punkte[:self.grenzen[-1]]
+        (xmin, ymin), (xmax, ymax) = linienpunkte.min(axis=0), linienpunkte.max(axis=0)
+        return BBox(float(xmin), float(ymin), float(xmax), float(ymax))
+
+    @property
+    def anker(self) -> Mapping[str, tuple]:
+        """Ankerpunkte als schreibgeschütztes Dictionary Name -> (x, y)."""
+        if self._anker is None:
+            werte = self.punkte[self.grenzen[-1]:].tolist()
+            self._anker = MappingProxyType(dict(zip(self.anker_namen, map(tuple, werte))))
+        return self._anker
+
+    @property
+    def segmente(self) -> tuple:
+        """Schemdraw-Segmente der Linienzüge (einmal erzeugt, dann geteilt)."""
+        if self._segmente is None:
+            koordinaten = self.punkte.tolist()
+            self._segmente = tuple(
+                segments.Segment(koordinaten[anfang:ende], **stil)
+                for anfang, ende, stil in zip(self.grenzen, self.grenzen[1:], self.stile)
+            )
+        return self._segmente
+
+    def symbol(self, *zusatz) -> Symbol:
+        """Symbol aus den Linienzügen und Ankern, ergänzt um feste Zusatz-Segmente.
+
+        Zusatz-Segmente sind Teile, die keine Linienzüge sind, aber nicht von
+        der Instanz abhängen (z.B. Debug-Marker, fester Text wie "HAK").
+        """
+        return symbol(self.segmente + tuple(zusatz), self.anker)
+
+
+_SPIEGEL_HALIGN = {'left': 'right', 'right': 'left'}
+_SPIEGEL_VALIGN = {'top': 'bottom', 'bottom': 'top'}
+
+
+def ausgerichtete_texte(texte, richtung: str) -> list:
+    """
+    Beschriftung einer Komponente für eine Flussrichtung.
+
+    Args:
+        texte: Liste ``(pos, text, stil)`` im Layout der Grundrichtung, d.h.
+            für "oben"/"unten" rechts neben dem Symbol, für "rechts"/"links"
+            darunter. ``stil`` enthält die Parameter für ``SegmentText``.
+        richtung: Flussrichtung (siehe ``flussrichtung()``)
+
+    Returns:
+        Liste von ``SegmentText``. Für "unten" wird der Textblock nach links,
+        für "links" nach oben gespiegelt; die Zeilenreihenfolge bleibt erhalten.
+    """
+    if richtung == 'unten':
+        texte = [
+            ((-x, y), text,
+             {**stil, 'align': (_SPIEGEL_HALIGN.get(stil['align'][0], stil['align'][0]),
+                                stil['align'][1])})
+            for (x, y), text, stil in texte
+        ]
+    elif richtung == 'links' and texte:
+        # Block an der x-Achse spiegeln, Zeilen darin in gleicher Reihenfolge
+        y_erste, y_letzte = texte[0][0][1], texte[-1][0][1]
+        texte = [
+            ((x, y - y_letzte - y_erste), text,
+             {**stil, 'align': (stil['align'][0],
+                                _SPIEGEL_VALIGN.get(stil['align'][1], stil['align'][1]))})
+            for (x, y), text, stil in texte
+        ]
+    return [segments.SegmentText(pos, text, **stil) for pos, text, stil in texte]
+
+
+# Versatz und Ausrichtung der Debug-Beschriftung je Seite
+_DEBUG_SEITE = {
+    'E': ((1, 0), ('left', 'center')),
+    'S': ((0, -1), ('center', 'top')),
+    'W': ((-1, 0), ('right', 'center')),
+    'N': ((0, 1), ('center', 'bottom')),
+}
+
+
+def debug_marker(anker, richtung: str, abstand: float = 0.15) -> tuple:
+    """Rote Punkte und Namen an den Ankern, Namen auf der Seite der Beschriftung."""
+    (dx, dy), align = _DEBUG_SEITE[SEITE[richtung]]
+    marker = []
+    for name, (x, y) in anker.items():
+        marker.append(segments.SegmentCircle((x, y), 0.05, fill='red'))
+        marker.append(segments.SegmentText(
+            (x + dx * abstand, y + dy * abstand), name, fontsize=6, align=align, color='red'
+        ))
+    return tuple(marker)
+
+
+class GeteilteGeometrie:
+    """Mixin für Elemente, deren Segmente aus einem geteilten ``Symbol`` stammen.
+
+    Die Segmente entstehen erst beim ersten Zugriff auf ``segments``, in der
+    Regel also beim Zeichnen: Symbolsegmente aus dem Cache plus die
+    Beschriftung aus ``_beschriftung()``. Bis dahin hält das Element nur seine
+    Parameter und Anker; Platzieren, ``absanchors`` und der Umriss ohne Texte
+    kommen ohne Segmente aus.
+
+    Schemdraw spiegelt beim Platzieren (``flip``/``reverse``) die Segmente an
+    Ort und Stelle. Geteilte Segmente werden in diesem Fall vorher flach
+    kopiert, sodass der Cache unverändert bleibt (Copy-on-Write).
+
+    ``geteiltes_symbol`` verweist auf das Symbol aller gleichen Instanzen;
+    die SVG-Ausgabe mit ``<symbol>``/``<use>`` (``render.svg_symbole``)
+    schreibt dessen Segmente nur einmal.
+    """
+
+    geteiltes_symbol = None  # Symbol, aus dem die Segmente stammen
+    _ausstehend = None  # Symbol, dessen Segmente noch nicht erzeugt sind
+
+    @property
+    def segments(self) -> list:
+        symbol = self._ausstehend
+        if symbol is not None:
+            self._ausstehend = None
+            self._segmente[:0] = [*symbol.segmente, *self._beschriftung()]
+        return self._segmente
+
+    @segments.setter
+    def segments(self, segmente: list):
+        self._segmente = segmente
+
+    def _uebernimm(self, symbol: Symbol):
+        """Übernimmt die Anker eines geteilten Symbols, Segmente erst bei Bedarf."""
+        self.geteiltes_symbol = self._ausstehend = symbol
+        self.anchors.update(symbol.anker)
+
+    def _beschriftung(self) -> list:
+        """Segmente der Beschriftung (und weitere instanzabhängige Segmente)."""
+        return []
+
+    def get_bbox(self, transform=False, includetext=True):
+        if self._ausstehend is not None and not (transform or includetext):
+            return self._ausstehend.umriss
+        return super().get_bbox(transform, includetext)
+
+    def _flipreverse(self):
+        if self._userparams.get('flip', False) or self._userparams.get('reverse', False):
+            self.segments = [copy.copy(s) for s in self.segments]
+        super()._flipreverse()
@@ -3,12 +3,108 @@
 Symbolisiert die Verbindung zum öffentlichen Stromnetz.
 """
 
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
 from schemdraw import segments
 
+# Versuche relative Imports, falle zurück auf absolute (für direkte Ausführung)
+try:
+    from .beschriftung import KASTEN, place_labels
+    from .geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+except ImportError:
+    from beschriftung import KASTEN, place_labels
+    from geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+
+
+@lru_cache(maxsize=None)
+def _symbol(debug: bool) -> Symbol:
+    """
+    Linien und Anker des Netz-Symbols ohne Beschriftung.
+    
+    Hängt nur vom Debug-Modus ab, wird einmal berechnet und von allen
+    Instanzen geteilt.
+    """
+    linien = []
+    zusatz = []
+    anker = {}
+    
+    # Geometrische Parameter
+    breite = 1.0
+    hoehe = 1.0
+    
+    # Rechteck (Gehäuse)
+    linien.append(linie([
+        (-breite/2, -hoehe/2),
+        (breite/2, -hoehe/2),
+        (breite/2, hoehe/2),
+        (-breite/2, hoehe/2),
+        (-breite/2, -hoehe/2)
+    ]))
+    
+    # Strommast-Symbol in der Mitte (drei Dreiecke)
+    
+    # Großes längliches Dreieck als Mast (mit offenem Fußende)
+    mast_hoehe = 0.5
+    mast_breite_unten = 0.15
+    mast_spitze_y = 0.3
+    mast_basis_y = mast_spitze_y - mast_hoehe
+    
+    # Nur die beiden Schenkel, nicht die Basis
+    linien.append(linie([
+        (-mast_breite_unten/2, mast_basis_y),
+        (0, mast_spitze_y)
+    ]))
+    linien.append(linie([
+        (0, mast_spitze_y),
+        (mast_breite_unten/2, mast_basis_y)
+    ]))
+    
+    # Kurzes breites Dreieck oben (gemeinsame Spitze)
+    quertraeger_oben_breite = 0.5
+    quertraeger_oben_hoehe = 0.1
+    
+    linien.append(linie([
+        (-quertraeger_oben_breite/2, mast_spitze_y - quertraeger_oben_hoehe),
+        (0, mast_spitze_y),
+        (quertraeger_oben_breite/2, mast_spitze_y - quertraeger_oben_hoehe),
+        (-quertraeger_oben_breite/2, mast_spitze_y - quertraeger_oben_hoehe)
+    ]))
+    
+    # Mittleres Dreieck (etwas breiter als das obere)
+    quertraeger_mitte_breite = 0.6
+    quertraeger_mitte_hoehe = 0.12
+    quertraeger_mitte_y = mast_spitze_y - quertraeger_oben_hoehe - 0.08
+    
+    linien.append(linie([
+        (-quertraeger_mitte_breite/2, quertraeger_mitte_y - quertraeger_mitte_hoehe),
+        (0, quertraeger_mitte_y),
+        (quertraeger_mitte_breite/2, quertraeger_mitte_y - quertraeger_mitte_hoehe),
+        (-quertraeger_mitte_breite/2, quertraeger_mitte_y - quertraeger_mitte_hoehe)
+    ]))
+    
+    # Ankerpunkte auf allen vier Seiten
+    anker['W'] = (-breite/2, 0)  # West (links)
+    anker['E'] = (breite/2, 0)   # East (rechts)
+    anker['N'] = (0, hoehe/2)    # North (oben)
+    anker['S'] = (0, -hoehe/2)   # South (unten)
+    
+    # Debug: Anchors anzeigen
+    if debug:
+        for name, pos in [('W', (-breite/2, 0)), 
+                         ('E', (breite/2, 0)),
+                         ('N', (0, hoehe/2)),
+                         ('S', (0, -hoehe/2))]:
+            zusatz.append(segments.SegmentCircle(pos, 0.05, fill='red'))
+            zusatz.append(segments.SegmentText(
+                (pos[0] * 1.2, pos[1] * 1.2), name, fontsize=6, align=('center', 'center'), color='red'
+            ))
+    
+    return Geometrie.aus_linien(linien, anker).symbol(*zusatz)
+
 
-class Netz(elm.Element):
+class Netz(GeteilteGeometrie, elm.Element):
     """
     Netz/Strommast-Symbol für Schaltpläne.
     
@@ -30,115 +126,26 @@ class Netz(elm.Element):
         
         super().__init__(**kwargs)
         
-        # Geometrische Parameter
-        breite = 1.0
-        hoehe = 1.0
-        
-        # Rechteck (Gehäuse)
-        self.segments.append(segments.Segment([
-            (-breite/2, -hoehe/2),
-            (breite/2, -hoehe/2),
-            (breite/2, hoehe/2),
-            (-breite/2, hoehe/2),
-            (-breite/2, -hoehe/2)
-        ]))
-        
-        # Strommast-Symbol in der Mitte (drei Dreiecke)
-        
-        # Großes längliches Dreieck als Mast (mit offenem Fußende)
-        mast_hoehe = 0.5
-        mast_breite_unten = 0.15
-        mast_spitze_y = 0.3
-        mast_basis_y = mast_spitze_y - mast_hoehe
-        
-        # Nur die beiden Schenkel, nicht die Basis
-        self.segments.append(segments.Segment([
-            (-mast_breite_unten/2, mast_basis_y),
-            (0, mast_spitze_y)
-        ]))
-        self.segments.append(segments.Segment([
-            (0, mast_spitze_y),
-            (mast_breite_unten/2, mast_basis_y)
-        ]))
-        
-        # Kurzes breites Dreieck oben (gemeinsame Spitze)
-        quertraeger_oben_breite = 0.5
-        quertraeger_oben_hoehe = 0.1
-        
-        self.segments.append(segments.Segment([
-            (-quertraeger_oben_breite/2, mast_spitze_y - quertraeger_oben_hoehe),
-            (0, mast_spitze_y),
-            (quertraeger_oben_breite/2, mast_spitze_y - quertraeger_oben_hoehe),
-            (-quertraeger_oben_breite/2, mast_spitze_y - quertraeger_oben_hoehe)
-        ]))
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        self._uebernimm(_symbol(debug))
         
-        # Mittleres Dreieck (etwas breiter als das obere)
-        quertraeger_mitte_breite = 0.6
-        quertraeger_mitte_hoehe = 0.12
-        quertraeger_mitte_y = mast_spitze_y - quertraeger_oben_hoehe - 0.08
-        
-        self.segments.append(segments.Segment([
-            (-quertraeger_mitte_breite/2, quertraeger_mitte_y - quertraeger_mitte_hoehe),
-            (0, quertraeger_mitte_y),
-            (quertraeger_mitte_breite/2, quertraeger_mitte_y - quertraeger_mitte_hoehe),
-            (-quertraeger_mitte_breite/2, quertraeger_mitte_y - quertraeger_mitte_hoehe)
-        ]))
-        
-        # Ankerpunkte auf allen vier Seiten
-        self.anchors['W'] = (-breite/2, 0)  # West (links)
-        self.anchors['E'] = (breite/2, 0)   # East (rechts)
-        self.anchors['N'] = (0, hoehe/2)    # North (oben)
-        self.anchors['S'] = (0, -hoehe/2)   # South (unten)
-        
-        # Debug: Anchors anzeigen
-        if debug:
-            for name, pos in [('W', (-breite/2, 0)), 
-                             ('E', (breite/2, 0)),
-                             ('N', (0, hoehe/2)),
-                             ('S', (0, -hoehe/2))]:
-                self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                self.segments.append(segments.SegmentText(
-                    (pos[0] * 1.2, pos[1] * 1.2), name, fontsize=6, align=('center', 'center'), color='red'
-                ))
-        
-        # Beschriftung und technische Daten an angegebener Position (gestapelt)
-        label_positions = {
-            'N': ((0, hoehe/2 + 0.25), ('center', 'bottom')),
-            'S': ((0, -hoehe/2 - 0.25), ('center', 'top')),
-            'E': ((breite/2 + 0.25, 0), ('left', 'center')),
-            'W': ((-breite/2 - 0.25, 0), ('right', 'center')),
-            'NE': ((breite/2 + 0.25, hoehe/2 + 0.25), ('left', 'bottom')),
-            'NO': ((breite/2 + 0.25, hoehe/2 + 0.25), ('left', 'bottom')),
-            'NW': ((-breite/2 - 0.25, hoehe/2 + 0.25), ('right', 'bottom')),
-            'SE': ((breite/2 + 0.25, -hoehe/2 - 0.25), ('left', 'top')),
-            'SO': ((breite/2 + 0.25, -hoehe/2 - 0.25), ('left', 'top')),
-            'SW': ((-breite/2 - 0.25, -hoehe/2 - 0.25), ('right', 'top'))
-        }
-        pos, align = label_positions.get(label_loc.upper(), label_positions['N'])
-        
-        # Bezeichnung
-        if bezeichnung:
-            self.segments.append(segments.SegmentText(
-                pos, bezeichnung, fontsize=10, align=align
-            ))
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self.spannung_v = spannung_v
+        self.label_loc = label_loc
+
+    def _beschriftung(self) -> list:
+        # Wenn spannung_v eine Zahl ist, füge "V" hinzu, sonst verwende den String direkt
+        if isinstance(self.spannung_v, (int, float)):
+            spannung_text = f"{self.spannung_v}V" if self.spannung_v else ""
+        else:
+            spannung_text = str(self.spannung_v)
         
-        # Spannung unter der Bezeichnung
-        if spannung_v:
-            # y_offset für Stapelung (immer nach unten = negativ)
-            y_offset = -0.2
-            
-            # Position für Spannungsangabe
-            spannung_pos = (pos[0], pos[1] + y_offset)
-            
-            # Wenn spannung_v eine Zahl ist, füge "V" hinzu, sonst verwende den String direkt
-            if isinstance(spannung_v, (int, float)):
-                spannung_text = f"{spannung_v}V"
-            else:
-                spannung_text = str(spannung_v)
-            
-            self.segments.append(segments.SegmentText(
-                spannung_pos, spannung_text, fontsize=8, align=align
-            ))
+        # Bezeichnung und Spannung an angegebener Position (gestapelt)
+        return place_labels(KASTEN, self.label_loc, [
+            (self.bezeichnung, 10),
+            (spannung_text, 8),
+        ])
 
 
 if __name__ == "__main__":
@@ -2,13 +2,81 @@
 PV-Modul und String-Komponenten.
 """
 
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
 from schemdraw.elements import Element
 from schemdraw import segments
 
+# Versuche relative Imports, falle zurück auf absolute (für direkte Ausführung)
+try:
+    from .geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+except ImportError:
+    from geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+
 
-class PVModul(Element):
+@lru_cache(maxsize=None)
+def _symbol(debug: bool) -> Symbol:
+    """
+    Linien und Anker des PV-Moduls ohne Beschriftung.
+    
+    Hängt nur vom Debug-Modus ab, wird einmal berechnet und von allen
+    Instanzen geteilt.
+    """
+    linien = []
+    zusatz = []
+    anker = {}
+    
+    # Längliches Rechteck
+    breite = 0.6
+    hoehe = 1.2
+    
+    # Rechteck
+    linien.append(linie([
+        (-breite/2, -hoehe/2),
+        (breite/2, -hoehe/2),
+        (breite/2, hoehe/2),
+        (-breite/2, hoehe/2),
+        (-breite/2, -hoehe/2)
+    ]))
+    
+    # Dreieckspitze am oberen Ende (nach innen gerichtet)
+    dreieck_hoehe = 0.25
+    linien.append(linie([
+        (-breite/2, hoehe/2),
+        (0, hoehe/2 - dreieck_hoehe),
+        (breite/2, hoehe/2)
+    ]))
+    
+    # Anschlüsse (einpolige Darstellung)
+    anker['minus'] = (0, -hoehe/2)
+    anker['start'] = (0, -hoehe/2)
+    anker['end'] = (0, -hoehe/2)
+    
+    # Standard-Ankerpunkte (N, S, E, W)
+    anker['W'] = (-breite/2, 0)  # West (links)
+    anker['E'] = (breite/2, 0)   # East (rechts)
+    anker['N'] = (0, hoehe/2)    # North (oben)
+    anker['S'] = (0, -hoehe/2)   # South (unten)
+    
+    # PE-Anker (entspricht W-Anker)
+    anker['PE'] = (-breite/2, 0)
+    
+    # Debug: Anchors anzeigen
+    if debug:
+        for name, pos in [('minus', (0, -hoehe/2)), ('start', (0, -hoehe/2)), 
+                         ('end', (0, -hoehe/2)), ('W/PE', (-breite/2, 0)),
+                         ('E', (breite/2, 0)), ('N', (0, hoehe/2)), ('S', (0, -hoehe/2))]:
+            zusatz.append(segments.SegmentCircle(pos, 0.05, fill='red'))
+            zusatz.append(segments.SegmentText(
+                (pos[0] - 0.15, pos[1]), name, fontsize=6, align=('right', 'center'), color='red'
+            ))
+    
+    return Geometrie.aus_linien(linien, anker).symbol(*zusatz)
+
+
+class PVModul(GeteilteGeometrie, Element):
     """
     Einzelnes PV-Modul nach DIN EN 60617.
     
@@ -22,68 +90,36 @@ class PVModul(Element):
     def __init__(self, leistung = None, bezeichnung: str = None, debug: bool = False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        # Längliches Rechteck
-        breite = 0.6
-        hoehe = 1.2
-        
-        # Rechteck
-        self.segments.append(segments.Segment([
-            (-breite/2, -hoehe/2),
-            (breite/2, -hoehe/2),
-            (breite/2, hoehe/2),
-            (-breite/2, hoehe/2),
-            (-breite/2, -hoehe/2)
-        ]))
-        
-        # Dreieckspitze am oberen Ende (nach innen gerichtet)
-        dreieck_hoehe = 0.25
-        self.segments.append(segments.Segment([
-            (-breite/2, hoehe/2),
-            (0, hoehe/2 - dreieck_hoehe),
-            (breite/2, hoehe/2)
-        ]))
-        
-        # Anschlüsse (einpolige Darstellung)
-        self.anchors['minus'] = (0, -hoehe/2)
-        self.anchors['start'] = (0, -hoehe/2)
-        self.anchors['end'] = (0, -hoehe/2)
-        
-        # Standard-Ankerpunkte (N, S, E, W)
-        self.anchors['W'] = (-breite/2, 0)  # West (links)
-        self.anchors['E'] = (breite/2, 0)   # East (rechts)
-        self.anchors['N'] = (0, hoehe/2)    # North (oben)
-        self.anchors['S'] = (0, -hoehe/2)   # South (unten)
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        self._uebernimm(_symbol(debug))
         
-        # PE-Anker (entspricht W-Anker)
-        self.anchors['PE'] = (-breite/2, 0)
-        
-        # Debug: Anchors anzeigen
-        if debug:
-            for name, pos in [('minus', (0, -hoehe/2)), ('start', (0, -hoehe/2)), 
-                             ('end', (0, -hoehe/2)), ('W/PE', (-breite/2, 0)),
-                             ('E', (breite/2, 0)), ('N', (0, hoehe/2)), ('S', (0, -hoehe/2))]:
-                self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                self.segments.append(segments.SegmentText(
-                    (pos[0] - 0.15, pos[1]), name, fontsize=6, align=('right', 'center'), color='red'
-                ))
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.leistung = leistung
+        self.bezeichnung = bezeichnung
+
+    def _beschriftung(self) -> list:
+        segmente = []
+        # Abmessungen für die Beschriftung
+        breite = 0.6
         
         # Beschriftung
-        if bezeichnung:
-            self.segments.append(segments.SegmentText(
-                (breite/2 + 0.1, 0), bezeichnung, fontsize=10, align=('left', 'center')
+        if self.bezeichnung:
+            segmente.append(segments.SegmentText(
+                (breite/2 + 0.1, 0), self.bezeichnung, fontsize=10, align=('left', 'center')
             ))
         
-        if leistung:
+        if self.leistung:
             # Leistung kann Zahl oder String sein
-            if isinstance(leistung, (int, float)):
-                leistung_text = f"{leistung}Wp"
+            if isinstance(self.leistung, (int, float)):
+                leistung_text = f"{self.leistung}Wp"
             else:
-                leistung_text = str(leistung)
+                leistung_text = str(self.leistung)
             
-            label_y = -0.3 if bezeichnung else 0
-            self.segments.append(segments.SegmentText(
+            label_y = -0.3 if self.bezeichnung else 0
+            segmente.append(segments.SegmentText(
                 (breite/2 + 0.1, label_y), leistung_text, fontsize=8, align=('left', 'center')
             ))
+        return segmente
 
 
 class PVString(Element):
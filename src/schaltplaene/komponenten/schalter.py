@@ -2,18 +2,68 @@
 Schalter-Komponenten.
 """
 
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
 from schemdraw.elements import Element
-from schemdraw import segments
 
 try:
     from .enums import ComponentFlow
+    from .geometrie import (
+        Geometrie,
+        GeteilteGeometrie,
+        Symbol,
+        ausgerichtete_texte,
+        flussrichtung,
+        linie,
+    )
+    from .schutzgeraete import KONTAKT_ABSTAND, KONTAKTE, MESSER_LAENGE, schaltmesser
 except ImportError:
     from enums import ComponentFlow
+    from geometrie import (
+        Geometrie,
+        GeteilteGeometrie,
+        Symbol,
+        ausgerichtete_texte,
+        flussrichtung,
+        linie,
+    )
+    from schutzgeraete import KONTAKT_ABSTAND, KONTAKTE, MESSER_LAENGE, schaltmesser
+
+
+@lru_cache(maxsize=None)
+def _grundform(oeffner: bool) -> Geometrie:
+    """
+    Linien und Anker des Schalters in der vertikalen Grundform
+    (Fluss von unten nach oben). Alle Flussrichtungen werden daraus abgebildet.
+    """
+    # Kontakte und Schaltmesser wie bei den Schutzschaltern, beim Öffner länger
+    geometrie = KONTAKTE + schaltmesser(0.75 if oeffner else MESSER_LAENGE)
+    
+    # Öffner-Kontakt: Senkrechter Strich vom Kontakt weg
+    if oeffner:
+        oeffner_laenge = 0.2
+        # Vom oberen Kontakt (wo das Messer NICHT beginnt) senkrecht nach rechts
+        geometrie = geometrie + Geometrie.aus_linien([linie([
+            (0, KONTAKT_ABSTAND/2),
+            (oeffner_laenge, KONTAKT_ABSTAND/2)
+        ])])
+    
+    return geometrie
+
 
+@lru_cache(maxsize=None)
+def _symbol(richtung: str, oeffner: bool) -> Symbol:
+    """
+    Linien und Anker des Schalters ohne Beschriftung.
+    
+    Hängt nur von Flussrichtung und Öffner-Variante ab, wird je Variante
+    einmal berechnet und von allen Instanzen geteilt.
+    """
+    return _grundform(oeffner).ausgerichtet(richtung).symbol()
 
-class Schalter(Element):
+class Schalter(GeteilteGeometrie, Element):
     """
     Schalter / Hauptschalter nach DIN EN 60617.
     
@@ -23,96 +73,38 @@ class Schalter(Element):
         bezeichnung: Bezeichnung (z.B. "HS", "S")
         flow: Flussrichtung (ComponentFlow.FLOW_V für vertikal, FLOW_H für horizontal)
         oeffner: Wenn True, wird ein Öffner-Kontakt dargestellt (rechtwinkliger Strich vom offenen Kontakt)
+        drehung: Zusätzliche Drehung gegen den Uhrzeigersinn (Vielfaches von 90°)
     """
     
     def __init__(self, bezeichnung: str = "S",
-                 flow: ComponentFlow = ComponentFlow.FLOW_V, oeffner: bool = False, *args, **kwargs):
-        # Fix für Schemdraw Auto-Rotation: Horizontale Schalter brauchen theta=0
-        if flow == ComponentFlow.FLOW_H and 'theta' not in kwargs:
+                 flow: ComponentFlow = ComponentFlow.FLOW_V, oeffner: bool = False,
+                 drehung: int = 0, *args, **kwargs):
+        # Fix für Schemdraw Auto-Rotation: Horizontale und gedrehte Schalter brauchen theta=0
+        if (flow == ComponentFlow.FLOW_H or drehung) and 'theta' not in kwargs:
             kwargs['theta'] = 0
         
         super().__init__(*args, **kwargs)
+        richtung = flussrichtung(flow, drehung)
         
-        # Kontakte
-        kontakt_abstand = 0.65
-        leitungs_laenge = 0.6
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        self._uebernimm(_symbol(richtung, oeffner))
         
-        if flow == ComponentFlow.FLOW_V:
-            # Vertikale Ausrichtung
-            # Unterer Kontakt
-            self.segments.append(segments.Segment([
-                (0, -leitungs_laenge), (0, -kontakt_abstand/2)
-            ]))
-            
-            # Oberer Kontakt
-            self.segments.append(segments.Segment([
-                (0, kontakt_abstand/2), (0, leitungs_laenge)
-            ]))
-            
-            # Schaltmesser (schräg zur Seite, geöffnet)
-            messer_laenge = 0.75 if oeffner else 0.55
-            messer_ende_x = 0.15
-            messer_ende_y = -kontakt_abstand/2 + messer_laenge
-            
-            self.segments.append(segments.Segment([
-                (0, -kontakt_abstand/2), (messer_ende_x, messer_ende_y)
-            ]))
-            
-            # Öffner-Kontakt: Senkrechter Strich vom Kontakt weg
-            if oeffner:
-                oeffner_laenge = 0.2
-                # Vom oberen Kontakt (wo das Messer NICHT beginnt) senkrecht nach rechts
-                self.segments.append(segments.Segment([
-                    (0, kontakt_abstand/2),
-                    (oeffner_laenge, kontakt_abstand/2)
-                ]))
-            
-            self.anchors['start'] = (0, -leitungs_laenge)
-            self.anchors['end'] = (0, leitungs_laenge)
-            
-            # Beschriftung rechts
-            if bezeichnung:
-                self.segments.append(segments.SegmentText(
-                    (0.6, 0.15), bezeichnung, fontsize=10, align=('left', 'center')
-                ))
-        else:
-            # Horizontale Ausrichtung
-            # Linker Kontakt
-            self.segments.append(segments.Segment([
-                (-leitungs_laenge, 0), (-kontakt_abstand/2, 0)
-            ]))
-            
-            # Rechter Kontakt
-            self.segments.append(segments.Segment([
-                (kontakt_abstand/2, 0), (leitungs_laenge, 0)
-            ]))
-            
-            # Schaltmesser (schräg nach oben, geöffnet)
-            messer_laenge = 0.75 if oeffner else 0.55
-            messer_ende_x = -kontakt_abstand/2 + messer_laenge
-            messer_ende_y = 0.15
-            
-            self.segments.append(segments.Segment([
-                (-kontakt_abstand/2, 0), (messer_ende_x, messer_ende_y)
-            ]))
-            
-            # Öffner-Kontakt: Senkrechter Strich vom Kontakt weg
-            if oeffner:
-                oeffner_laenge = 0.2
-                # Vom rechten Kontakt (wo das Messer NICHT beginnt) senkrecht nach oben
-                self.segments.append(segments.Segment([
-                    (kontakt_abstand/2, 0),
-                    (kontakt_abstand/2, oeffner_laenge)
-                ]))
-            
-            self.anchors['start'] = (-leitungs_laenge, 0)
-            self.anchors['end'] = (leitungs_laenge, 0)
-            
-            # Beschriftung unten
-            if bezeichnung:
-                self.segments.append(segments.SegmentText(
-                    (0, -0.35), bezeichnung, fontsize=10, align=('center', 'top')
-                ))
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self._richtung = richtung
+
+    def _beschriftung(self) -> list:
+        texte = []
+        if self.bezeichnung:
+            if self._richtung in ('oben', 'unten'):
+                # Beschriftung rechts (bei "unten" links)
+                texte.append(((0.6, 0.15), self.bezeichnung,
+                              dict(fontsize=10, align=('left', 'center'))))
+            else:
+                # Beschriftung unten (bei "links" oben)
+                texte.append(((0, -0.35), self.bezeichnung,
+                              dict(fontsize=10, align=('center', 'top'))))
+        return ausgerichtete_texte(texte, self._richtung)
 
 
 if __name__ == "__main__":
@@ -3,19 +3,145 @@
 NH-Sicherungen, Schraubsicherungen und andere Schmelzsicherungen.
 """
 
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
 from schemdraw import segments
-from enum import Enum
 
 # Versuche relative Imports, falle zurück auf absolute (für direkte Ausführung)
 try:
     from .enums import ComponentFlow
+    from .geometrie import (
+        Geometrie,
+        GeteilteGeometrie,
+        Symbol,
+        ausgerichtete_texte,
+        debug_marker,
+        flussrichtung,
+        linie,
+    )
 except ImportError:
     from enums import ComponentFlow
+    from geometrie import (
+        Geometrie,
+        GeteilteGeometrie,
+        Symbol,
+        ausgerichtete_texte,
+        debug_marker,
+        flussrichtung,
+        linie,
+    )
+
+
+# Rechteck der Sicherung in der Grundform und Rand des HAK-Rahmens
+_RECHTECK_BREITE = 0.4
+_RECHTECK_HOEHE = 0.6
+_HAK_RAND = 0.4
 
 
-class Schmelzsicherung(elm.Element):
+@lru_cache(maxsize=None)
+def _grundform() -> Geometrie:
+    """
+    Linien und Anker der Schmelzsicherung in der vertikalen Grundform (Fluss
+    von unten nach oben). Alle Flussrichtungen werden daraus abgebildet.
+    """
+    linien = []
+    anker = {}
+    
+    # Geometrische Parameter
+    rechteck_breite = _RECHTECK_BREITE
+    rechteck_hoehe = _RECHTECK_HOEHE
+    leitungs_laenge = 0.6
+    
+    # Untere Zuleitung
+    linien.append(linie([
+        (0, -leitungs_laenge),
+        (0, -rechteck_hoehe/2)
+    ]))
+    
+    # Rechteck
+    linien.append(linie([
+        (-rechteck_breite/2, -rechteck_hoehe/2),
+        (rechteck_breite/2, -rechteck_hoehe/2),
+        (rechteck_breite/2, rechteck_hoehe/2),
+        (-rechteck_breite/2, rechteck_hoehe/2),
+        (-rechteck_breite/2, -rechteck_hoehe/2)
+    ]))
+    
+    # Durchgehende Linie (Schmelzleiter)
+    linien.append(linie([
+        (0, -rechteck_hoehe/2),
+        (0, rechteck_hoehe/2)
+    ]))
+    
+    # Obere Ableitung
+    linien.append(linie([
+        (0, rechteck_hoehe/2),
+        (0, leitungs_laenge)
+    ]))
+    
+    anker['start'] = (0, -leitungs_laenge)
+    anker['end'] = (0, leitungs_laenge)
+    
+    return Geometrie.aus_linien(linien, anker)
+
+
+@lru_cache(maxsize=None)
+def _hak_rahmen(quer: bool) -> Geometrie:
+    """
+    Gestrichelter HAK-Rahmen (Hausanschlusskasten) um das Rechteck.
+    
+    Der Rahmen wird nicht aus der Grundform abgebildet, sondern je Lage
+    aufgebaut (``quer``: horizontaler Fluss). So beginnt er wie die übrigen
+    Rahmen immer links unten mit der unteren Kante, und das Strichmuster
+    liegt in jeder Lage gleich.
+    """
+    hak_breite = _RECHTECK_BREITE + _HAK_RAND
+    hak_hoehe = _RECHTECK_HOEHE + _HAK_RAND
+    if quer:
+        hak_breite, hak_hoehe = hak_hoehe, hak_breite
+    return Geometrie.aus_linien([linie([
+        (-hak_breite/2, -hak_hoehe/2),
+        (hak_breite/2, -hak_hoehe/2),
+        (hak_breite/2, hak_hoehe/2),
+        (-hak_breite/2, hak_hoehe/2),
+        (-hak_breite/2, -hak_hoehe/2)
+    ], ls='--')])
+
+
+@lru_cache(maxsize=None)
+def _symbol(richtung: str, hak: bool, debug: bool) -> Symbol:
+    """
+    Linien, HAK-Rahmen und Anker der Schmelzsicherung ohne Beschriftung.
+    
+    Hängt nur von Flussrichtung, HAK-Rahmen und Debug-Modus ab, wird je
+    Variante einmal berechnet und von allen Instanzen geteilt.
+    """
+    geometrie = _grundform().ausgerichtet(richtung)
+    zusatz = []
+    
+    if hak:
+        geometrie += _hak_rahmen(richtung in ('rechts', 'links'))
+    
+    if hak:
+        # HAK-Beschriftung neben dem Rahmen, gegenüber der Beschriftung
+        box = geometrie.bbox()
+        abstand = 0.15
+        pos, stil = {
+            'oben': ((box.xmin - abstand, 0), dict(align=('right', 'center'), rotation=90)),
+            'unten': ((box.xmax + abstand, 0), dict(align=('right', 'center'), rotation=90)),
+            'rechts': ((0, box.ymax + abstand), dict(align=('center', 'bottom'))),
+            'links': ((0, box.ymin - abstand), dict(align=('center', 'top'))),
+        }[richtung]
+        zusatz.append(segments.SegmentText(pos, "HAK", fontsize=8, **stil))
+    
+    if debug:
+        zusatz.extend(debug_marker(geometrie.anker, richtung))
+    
+    return geometrie.symbol(*zusatz)
+
+class Schmelzsicherung(GeteilteGeometrie, elm.Element):
     """
     Schmelzsicherung nach DIN EN 60617.
     
@@ -28,6 +154,7 @@ class Schmelzsicherung(elm.Element):
         kennlinie: Kennlinie der Sicherung (z.B. "gG", "aM", "gL")
         typ: Typ der Sicherung (z.B. "NH00", "NH1", "D02", "C")
         flow: Ausrichtung (FLOW_V für vertikal, FLOW_H für horizontal)
+        drehung: Zusätzliche Drehung gegen den Uhrzeigersinn (Vielfaches von 90°)
         hak: Fügt Hausanschlusskasten-Rahmen um die Sicherung hinzu
         debug: Zeigt Ankerpunkte zur Fehlersuche
     """
@@ -40,186 +167,66 @@ class Schmelzsicherung(elm.Element):
                  flow: ComponentFlow = ComponentFlow.FLOW_V,
                  hak: bool = False,
                  debug: bool = False,
+                 drehung: int = 0,
                  **kwargs):
         
         # Theta-Fix: Verhindere automatische Rotation
         kwargs['theta'] = 0
         
         super().__init__(**kwargs)
+        richtung = flussrichtung(flow, drehung)
         
-        # Geometrische Parameter
-        rechteck_breite = 0.4
-        rechteck_hoehe = 0.6
-        leitungs_laenge = 0.6
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        self._uebernimm(_symbol(richtung, hak, debug))
         
-        if flow == ComponentFlow.FLOW_V:
-            # Vertikale Ausrichtung: Strom fließt von unten nach oben
-            
-            # Untere Zuleitung
-            self.segments.append(segments.Segment([
-                (0, -leitungs_laenge),
-                (0, -rechteck_hoehe/2)
-            ]))
-            
-            # Rechteck
-            self.segments.append(segments.Segment([
-                (-rechteck_breite/2, -rechteck_hoehe/2),
-                (rechteck_breite/2, -rechteck_hoehe/2),
-                (rechteck_breite/2, rechteck_hoehe/2),
-                (-rechteck_breite/2, rechteck_hoehe/2),
-                (-rechteck_breite/2, -rechteck_hoehe/2)
-            ]))
-            
-            # Durchgehende Linie (Schmelzleiter)
-            self.segments.append(segments.Segment([
-                (0, -rechteck_hoehe/2),
-                (0, rechteck_hoehe/2)
-            ]))
-            
-            # Obere Ableitung
-            self.segments.append(segments.Segment([
-                (0, rechteck_hoehe/2),
-                (0, leitungs_laenge)
-            ]))
-            
-            # HAK-Rahmen (Hausanschlusskasten)
-            if hak:
-                hak_breite = rechteck_breite + 0.4
-                hak_hoehe = rechteck_hoehe + 0.4
-                self.segments.append(segments.Segment([
-                    (-hak_breite/2, -hak_hoehe/2),
-                    (hak_breite/2, -hak_hoehe/2),
-                    (hak_breite/2, hak_hoehe/2),
-                    (-hak_breite/2, hak_hoehe/2),
-                    (-hak_breite/2, -hak_hoehe/2)
-                ], ls='--'))
-                # HAK-Beschriftung links
-                self.segments.append(segments.SegmentText(
-                    (-hak_breite/2 - 0.15, 0), "HAK", fontsize=8, 
-                    align=('right', 'center'), rotation=90
-                ))
-            
-            self.anchors['start'] = (0, -leitungs_laenge)
-            self.anchors['end'] = (0, leitungs_laenge)
-            
-            # Debug: Anchors anzeigen
-            if debug:
-                for name, pos in [('start', (0, -leitungs_laenge)), 
-                                 ('end', (0, leitungs_laenge))]:
-                    self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                    self.segments.append(segments.SegmentText(
-                        (pos[0] + 0.15, pos[1]), name, fontsize=6, align=('left', 'center'), color='red'
-                    ))
-            
-            # Beschriftung rechts
-            if bezeichnung:
-                self.segments.append(segments.SegmentText(
-                    (0.6, 0.2), bezeichnung, fontsize=10, align=('left', 'center')
-                ))
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self.nennstrom_a = nennstrom_a
+        self.kennlinie = kennlinie
+        self.typ = typ
+        self.hak = hak
+        self._richtung = richtung
+
+    def _beschriftung(self) -> list:
+        texte = []
+        if self._richtung in ('oben', 'unten'):
+            # Beschriftung rechts (bei "unten" links)
+            stil = dict(align=('left', 'center'))
+            if self.bezeichnung:
+                texte.append(((0.6, 0.2), self.bezeichnung, dict(stil, fontsize=10)))
             
             # Technische Daten
-            y_offset = -0.05 if bezeichnung else 0.2
-            if nennstrom_a:
-                self.segments.append(segments.SegmentText(
-                    (0.6, y_offset), f"{nennstrom_a}A", fontsize=8, align=('left', 'center')
-                ))
+            y_offset = -0.05 if self.bezeichnung else 0.2
+            if self.nennstrom_a:
+                texte.append(((0.6, y_offset), f"{self.nennstrom_a}A", dict(stil, fontsize=8)))
                 y_offset -= 0.25
             
-            if kennlinie:
-                self.segments.append(segments.SegmentText(
-                    (0.6, y_offset), kennlinie, fontsize=8, align=('left', 'center')
-                ))
+            if self.kennlinie:
+                texte.append(((0.6, y_offset), self.kennlinie, dict(stil, fontsize=8)))
                 y_offset -= 0.25
             
-            if typ:
-                self.segments.append(segments.SegmentText(
-                    (0.6, y_offset), typ, fontsize=7, align=('left', 'center')
-                ))
-        
-        else:  # FLOW_H
-            # Horizontale Ausrichtung: Strom fließt von links nach rechts
-            
-            # Linke Zuleitung
-            self.segments.append(segments.Segment([
-                (-leitungs_laenge, 0),
-                (-rechteck_hoehe/2, 0)
-            ]))
-            
-            # Rechteck (90° gedreht: X-Achse nutzt rechteck_hoehe, Y-Achse nutzt rechteck_breite)
-            self.segments.append(segments.Segment([
-                (-rechteck_hoehe/2, -rechteck_breite/2),
-                (-rechteck_hoehe/2, rechteck_breite/2),
-                (rechteck_hoehe/2, rechteck_breite/2),
-                (rechteck_hoehe/2, -rechteck_breite/2),
-                (-rechteck_hoehe/2, -rechteck_breite/2)
-            ]))
-            
-            # Durchgehende Linie (Schmelzleiter)
-            self.segments.append(segments.Segment([
-                (-rechteck_hoehe/2, 0),
-                (rechteck_hoehe/2, 0)
-            ]))
-            
-            # Rechte Ableitung
-            self.segments.append(segments.Segment([
-                (rechteck_hoehe/2, 0),
-                (leitungs_laenge, 0)
-            ]))
-            
-            # HAK-Rahmen (Hausanschlusskasten)
-            if hak:
-                hak_breite = rechteck_hoehe + 0.4  # In X-Richtung
-                hak_hoehe = rechteck_breite + 0.4  # In Y-Richtung
-                self.segments.append(segments.Segment([
-                    (-hak_breite/2, -hak_hoehe/2),
-                    (hak_breite/2, -hak_hoehe/2),
-                    (hak_breite/2, hak_hoehe/2),
-                    (-hak_breite/2, hak_hoehe/2),
-                    (-hak_breite/2, -hak_hoehe/2)
-                ], ls='--'))
-                # HAK-Beschriftung oben
-                self.segments.append(segments.SegmentText(
-                    (0, hak_hoehe/2 + 0.15), "HAK", fontsize=8, 
-                    align=('center', 'bottom')
-                ))
-            
-            self.anchors['start'] = (-leitungs_laenge, 0)
-            self.anchors['end'] = (leitungs_laenge, 0)
-            
-            # Debug: Anchors anzeigen
-            if debug:
-                for name, pos in [('start', (-leitungs_laenge, 0)), 
-                                 ('end', (leitungs_laenge, 0))]:
-                    self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                    self.segments.append(segments.SegmentText(
-                        (pos[0], pos[1] - 0.15), name, fontsize=6, align=('center', 'top'), color='red'
-                    ))
-            
-            # Beschriftung unten (mit mehr Abstand wenn HAK)
-            y_offset = -0.55 if hak else -0.35
-            if bezeichnung:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), bezeichnung, fontsize=10, align=('center', 'top')
-                ))
+            if self.typ:
+                texte.append(((0.6, y_offset), self.typ, dict(stil, fontsize=7)))
+        else:
+            # Beschriftung unten, bei "links" oben (mit mehr Abstand wenn HAK)
+            stil = dict(align=('center', 'top'))
+            y_offset = -0.55 if self.hak else -0.35
+            if self.bezeichnung:
+                texte.append(((0, y_offset), self.bezeichnung, dict(stil, fontsize=10)))
                 y_offset -= 0.25
             
             # Technische Daten
-            if nennstrom_a:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), f"{nennstrom_a}A", fontsize=7, align=('center', 'top')
-                ))
+            if self.nennstrom_a:
+                texte.append(((0, y_offset), f"{self.nennstrom_a}A", dict(stil, fontsize=7)))
                 y_offset -= 0.2
             
-            if kennlinie:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), kennlinie, fontsize=7, align=('center', 'top')
-                ))
+            if self.kennlinie:
+                texte.append(((0, y_offset), self.kennlinie, dict(stil, fontsize=7)))
                 y_offset -= 0.2
             
-            if typ:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), typ, fontsize=6, align=('center', 'top')
-                ))
+            if self.typ:
+                texte.append(((0, y_offset), self.typ, dict(stil, fontsize=6)))
+        return ausgerichtete_texte(texte, self._richtung)
 
 
 if __name__ == "__main__":
@@ -292,9 +299,11 @@ if __name__ == "__main__":
         hak=True,
         debug=True
     ).at((5, -2))
-    d += elm.Label().at((5, -3.5)).label("NH-Sicherung im HAK (horizontal)", fontsize=9, halign='center')
+    d += elm.Label().at((5, -3.5)).label("NH-Sicherung im HAK (horizontal)", fontsize=9,
+                                          halign='center')
     
     # Speichern
     d.save('output/komponenten_schmelzsicherung.png')
     d.save('output/komponenten_schmelzsicherung.svg')
-    print("Schmelzsicherung gespeichert: output/komponenten_schmelzsicherung.png und output/komponenten_schmelzsicherung.svg")
+    print("Schmelzsicherung gespeichert: output/komponenten_schmelzsicherung.png und "
+          "output/komponenten_schmelzsicherung.svg")
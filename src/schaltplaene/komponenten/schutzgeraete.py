@@ -0,0 +1,113 @@
+"""
+Grundelemente der Schutzgeräte-Symbole nach DIN EN 60617.
+
+Kontakte, Schaltmesser, Auslösepfeil und Stößel sind allen Schutzschaltern
+gemeinsam (LS, FI, FI/LS, Motorschutzschalter, ...). Sie werden einmal beim
+Import in der vertikalen Grundform (Fluss von unten nach oben) berechnet;
+die Symbole setzen sich daraus per ``+`` zusammen, statt die Geometrie
+jeweils selbst nachzurechnen.
+"""
+
+from functools import lru_cache
+
+try:
+    from .geometrie import Geometrie, linie
+except ImportError:
+    from geometrie import Geometrie, linie
+
+
+# Kontakte
+LEITUNGS_LAENGE = 0.6
+KONTAKT_ABSTAND = 0.65
+
+# Schaltmesser (schräg zur Seite, geöffnet)
+MESSER_LAENGE = 0.55
+MESSER_ENDE_X = 0.15
+
+# Auslösepfeil am Kontaktmesser
+PFEIL_POS = 0.7  # Position entlang des Messers (70%)
+PFEIL_LAENGE = 0.2
+SPITZE_LAENGE = 0.08
+SPITZE_BREITE = 0.05
+
+# Stößel am Auslösepfeil (Fehlerstrom-Auslösung)
+STOESSEL_KURZ = 0.08  # Kurzer Querstrich an der Pfeilspitze
+STOESSEL_LANG = 0.15  # Längerer Strich, der den Pfeil fortsetzt
+STOESSEL_ABSTAND = 0.06  # Abstand zwischen Pfeil und Stößel
+
+
+# Ein- und ausgehende Leitung mit Kontaktpunkten, Anker "start" und "end"
+KONTAKTE = Geometrie.aus_linien([
+    # Unterer Kontakt
+    linie([(0, -LEITUNGS_LAENGE), (0, -KONTAKT_ABSTAND/2)]),
+    # Oberer Kontakt
+    linie([(0, KONTAKT_ABSTAND/2), (0, LEITUNGS_LAENGE)]),
+], {'start': (0, -LEITUNGS_LAENGE), 'end': (0, LEITUNGS_LAENGE)})
+
+
+@lru_cache(maxsize=None)
+def schaltmesser(laenge: float = MESSER_LAENGE) -> Geometrie:
+    """Geöffnetes Schaltmesser vom unteren Kontakt aus, schräg nach rechts."""
+    return Geometrie.aus_linien([linie([
+        (0, -KONTAKT_ABSTAND/2), (MESSER_ENDE_X, -KONTAKT_ABSTAND/2 + laenge)
+    ])])
+
+
+SCHALTMESSER = schaltmesser()
+
+# Pfeil senkrecht zum Messer nach außen (rechts), zum Messerende hin verschoben
+_pfeil_x = MESSER_ENDE_X * PFEIL_POS
+_pfeil_y = -KONTAKT_ABSTAND/2 + MESSER_LAENGE * PFEIL_POS
+PFEIL_ENDE = (_pfeil_x + PFEIL_LAENGE, _pfeil_y - PFEIL_LAENGE * 0.3)  # Ausgleich für Messerwinkel
+
+# Normierte Pfeilrichtung und Senkrechte dazu (90° gedreht)
+_pfeil_dx = PFEIL_ENDE[0] - _pfeil_x
+_pfeil_dy = PFEIL_ENDE[1] - _pfeil_y
+_pfeil_len = (_pfeil_dx**2 + _pfeil_dy**2)**0.5
+PFEIL_RICHTUNG = (_pfeil_dx / _pfeil_len, _pfeil_dy / _pfeil_len)
+PFEIL_NORMALE = (-PFEIL_RICHTUNG[1], PFEIL_RICHTUNG[0])
+
+
+def _ausloesepfeil() -> Geometrie:
+    (end_x, end_y), (dx, dy), (nx, ny) = PFEIL_ENDE, PFEIL_RICHTUNG, PFEIL_NORMALE
+    basis_x = end_x - SPITZE_LAENGE * dx
+    basis_y = end_y - SPITZE_LAENGE * dy
+    return Geometrie.aus_linien([
+        # Pfeilschaft
+        linie([(_pfeil_x, _pfeil_y), (end_x, end_y)]),
+        # Ausgefüllte Pfeilspitze (Dreieck) - senkrecht zur Pfeilrichtung
+        linie([
+            (end_x, end_y),
+            (basis_x + SPITZE_BREITE * nx, basis_y + SPITZE_BREITE * ny),
+            (basis_x - SPITZE_BREITE * nx, basis_y - SPITZE_BREITE * ny),
+            (end_x, end_y)
+        ], fill='black'),
+    ])
+
+
+def _stoessel() -> Geometrie:
+    (end_x, end_y), (dx, dy), (nx, ny) = PFEIL_ENDE, PFEIL_RICHTUNG, PFEIL_NORMALE
+    # Beide Striche beginnen mit Abstand hinter der Pfeilspitze
+    start_x = end_x + STOESSEL_ABSTAND * dx
+    start_y = end_y + STOESSEL_ABSTAND * dy
+    # Der lange Strich endet STOESSEL_LANG hinter seinem Anfang
+    laenge = STOESSEL_LANG + STOESSEL_ABSTAND
+    return Geometrie.aus_linien([
+        # Kurzer Querstrich (senkrecht zur Pfeilrichtung)
+        linie([
+            (start_x + STOESSEL_KURZ * nx, start_y + STOESSEL_KURZ * ny),
+            (start_x - STOESSEL_KURZ * nx, start_y - STOESSEL_KURZ * ny)
+        ]),
+        # Längerer Strich, der den Pfeil fortsetzt
+        linie([
+            (start_x, start_y),
+            (end_x + laenge * dx, end_y + laenge * dy)
+        ]),
+    ])
+
+
+# Auslösepfeil (thermische/magnetische Auslösung) mit normierter Spitze
+AUSLOESEPFEIL = _ausloesepfeil()
+
+# Stößel in Verlängerung des Auslösepfeils (Fehlerstrom-Auslösung)
+STOESSEL = _stoessel()
@@ -3,18 +3,106 @@
 Ableiter zum Schutz vor Überspannungen.
 """
 
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
-from schemdraw import segments
 
 # Versuche relative Imports, falle zurück auf absolute (für direkte Ausführung)
 try:
     from .enums import ComponentFlow
+    from .geometrie import (
+        Geometrie,
+        GeteilteGeometrie,
+        Symbol,
+        ausgerichtete_texte,
+        debug_marker,
+        flussrichtung,
+        linie,
+    )
 except ImportError:
     from enums import ComponentFlow
+    from geometrie import (
+        Geometrie,
+        GeteilteGeometrie,
+        Symbol,
+        ausgerichtete_texte,
+        debug_marker,
+        flussrichtung,
+        linie,
+    )
+
+
+@lru_cache(maxsize=None)
+def _grundform() -> Geometrie:
+    """
+    Linien und Anker des Überspannungsschutzes in der vertikalen Grundform
+    (Fluss von unten nach oben). Alle Flussrichtungen werden daraus abgebildet.
+    """
+    linien = []
+    anker = {}
+    
+    # Geometrische Parameter (kleiner als PV-Modul)
+    rechteck_breite = 0.3
+    rechteck_hoehe = 0.6
+    dreieck_hoehe = 0.2
+    anschluss_laenge = 0.3
+    
+    # Rechteck
+    linien.append(linie([
+        (-rechteck_breite/2, -rechteck_hoehe/2),
+        (rechteck_breite/2, -rechteck_hoehe/2),
+        (rechteck_breite/2, rechteck_hoehe/2),
+        (-rechteck_breite/2, rechteck_hoehe/2),
+        (-rechteck_breite/2, -rechteck_hoehe/2)
+    ]))
+    
+    # Gefülltes Dreieck oben (Spitze zeigt nach innen/unten)
+    dreieck_y_start = rechteck_hoehe/2
+    linien.append(linie([
+        (-rechteck_breite/2, dreieck_y_start),
+        (0, dreieck_y_start - dreieck_hoehe),
+        (rechteck_breite/2, dreieck_y_start),
+        (-rechteck_breite/2, dreieck_y_start)
+    ], fill='black'))
+    
+    # Oberer Anschluss (vom oberen Rechteckrand nach oben)
+    linien.append(linie([
+        (0, dreieck_y_start),
+        (0, dreieck_y_start + anschluss_laenge)
+    ]))
+    
+    # Unterer Anschluss (vom Rechteck nach unten)
+    linien.append(linie([
+        (0, -rechteck_hoehe/2),
+        (0, -rechteck_hoehe/2 - anschluss_laenge)
+    ]))
+    
+    # Ankerpunkte
+    anker['1'] = (0, -rechteck_hoehe/2 - anschluss_laenge)
+    anker['2'] = (0, dreieck_y_start + anschluss_laenge)
+    anker['start'] = (0, -rechteck_hoehe/2 - anschluss_laenge)
+    anker['end'] = (0, dreieck_y_start + anschluss_laenge)
+    
+    return Geometrie.aus_linien(linien, anker)
 
 
-class Ueberspannungsschutz(elm.Element):
+@lru_cache(maxsize=None)
+def _symbol(richtung: str, debug: bool) -> Symbol:
+    """
+    Linien und Anker des Überspannungsschutzes ohne Beschriftung.
+    
+    Hängt nur von Flussrichtung und Debug-Modus ab, wird je Variante einmal
+    berechnet und von allen Instanzen geteilt.
+    """
+    geometrie = _grundform().ausgerichtet(richtung)
+    zusatz = ()
+    if debug:
+        anschluesse = {name: geometrie.anker[name] for name in ('1', '2')}
+        zusatz = debug_marker(anschluesse, richtung, abstand=0.2)
+    return geometrie.symbol(*zusatz)
+
+class Ueberspannungsschutz(GeteilteGeometrie, elm.Element):
     """
     Überspannungsschutz (ÜSS) nach DIN EN 60617.
     
@@ -25,6 +113,7 @@ class Ueberspannungsschutz(elm.Element):
         schutzpegel_kv: Schutzpegel in kV (z.B. 1.5, 2.5)
         typ: Typ des ÜSS (z.B. "Typ 1", "Typ 2", "Typ 3")
         flow: Ausrichtung (FLOW_V für vertikal, FLOW_H für horizontal)
+        drehung: Zusätzliche Drehung gegen den Uhrzeigersinn (Vielfaches von 90°)
         debug: Zeigt Ankerpunkte zur Fehlersuche
     """
     
@@ -34,153 +123,56 @@ class Ueberspannungsschutz(elm.Element):
                  typ: str = "Typ 2",
                  flow: ComponentFlow = ComponentFlow.FLOW_V,
                  debug: bool = False,
+                 drehung: int = 0,
                  **kwargs):
         
         # Theta-Fix: Verhindere automatische Rotation
         kwargs['theta'] = 0
         
         super().__init__(**kwargs)
+        richtung = flussrichtung(flow, drehung)
         
-        # Geometrische Parameter (kleiner als PV-Modul)
-        rechteck_breite = 0.3
-        rechteck_hoehe = 0.6
-        dreieck_hoehe = 0.2
-        anschluss_laenge = 0.3
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        self._uebernimm(_symbol(richtung, debug))
         
-        if flow == ComponentFlow.FLOW_V:
-            # Vertikale Ausrichtung
-            
-            # Rechteck
-            self.segments.append(segments.Segment([
-                (-rechteck_breite/2, -rechteck_hoehe/2),
-                (rechteck_breite/2, -rechteck_hoehe/2),
-                (rechteck_breite/2, rechteck_hoehe/2),
-                (-rechteck_breite/2, rechteck_hoehe/2),
-                (-rechteck_breite/2, -rechteck_hoehe/2)
-            ]))
-            
-            # Gefülltes Dreieck oben (Spitze zeigt nach innen/unten)
-            dreieck_y_start = rechteck_hoehe/2
-            self.segments.append(segments.Segment([
-                (-rechteck_breite/2, dreieck_y_start),
-                (0, dreieck_y_start - dreieck_hoehe),
-                (rechteck_breite/2, dreieck_y_start),
-                (-rechteck_breite/2, dreieck_y_start)
-            ], fill='black'))
-            
-            # Oberer Anschluss (vom oberen Rechteckrand nach oben)
-            self.segments.append(segments.Segment([
-                (0, dreieck_y_start),
-                (0, dreieck_y_start + anschluss_laenge)
-            ]))
-            
-            # Unterer Anschluss (vom Rechteck nach unten)
-            self.segments.append(segments.Segment([
-                (0, -rechteck_hoehe/2),
-                (0, -rechteck_hoehe/2 - anschluss_laenge)
-            ]))
-            
-            # Ankerpunkte
-            self.anchors['1'] = (0, -rechteck_hoehe/2 - anschluss_laenge)
-            self.anchors['2'] = (0, dreieck_y_start + anschluss_laenge)
-            self.anchors['start'] = (0, -rechteck_hoehe/2 - anschluss_laenge)
-            self.anchors['end'] = (0, dreieck_y_start + anschluss_laenge)
-            
-            # Debug: Anchors anzeigen
-            if debug:
-                for name, pos in [('1', self.anchors['1']), 
-                                 ('2', self.anchors['2'])]:
-                    self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                    self.segments.append(segments.SegmentText(
-                        (pos[0] + 0.2, pos[1]), name, fontsize=6, align=('left', 'center'), color='red'
-                    ))
-            
-            # Beschriftung rechts
-            if bezeichnung:
-                self.segments.append(segments.SegmentText(
-                    (0.4, 0.2), bezeichnung, fontsize=10, align=('left', 'center')
-                ))
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self.schutzpegel_kv = schutzpegel_kv
+        self.typ = typ
+        self._richtung = richtung
+
+    def _beschriftung(self) -> list:
+        texte = []
+        if self._richtung in ('oben', 'unten'):
+            # Beschriftung rechts (bei "unten" links)
+            stil = dict(align=('left', 'center'))
+            if self.bezeichnung:
+                texte.append(((0.4, 0.2), self.bezeichnung, dict(stil, fontsize=10)))
             
             # Technische Daten
-            y_offset = -0.05 if bezeichnung else 0.2
-            if schutzpegel_kv:
-                self.segments.append(segments.SegmentText(
-                    (0.4, y_offset), f"{schutzpegel_kv}kV", fontsize=8, align=('left', 'center')
-                ))
+            y_offset = -0.05 if self.bezeichnung else 0.2
+            if self.schutzpegel_kv:
+                texte.append(((0.4, y_offset), f"{self.schutzpegel_kv}kV", dict(stil, fontsize=8)))
                 y_offset -= 0.25
             
-            if typ:
-                self.segments.append(segments.SegmentText(
-                    (0.4, y_offset), typ, fontsize=7, align=('left', 'center')
-                ))
-        
-        else:  # FLOW_H
-            # Horizontale Ausrichtung
-            
-            # Rechteck (90° gedreht: X-Achse nutzt rechteck_hoehe, Y-Achse nutzt rechteck_breite)
-            self.segments.append(segments.Segment([
-                (-rechteck_hoehe/2, -rechteck_breite/2),
-                (rechteck_hoehe/2, -rechteck_breite/2),
-                (rechteck_hoehe/2, rechteck_breite/2),
-                (-rechteck_hoehe/2, rechteck_breite/2),
-                (-rechteck_hoehe/2, -rechteck_breite/2)
-            ]))
-            
-            # Gefülltes Dreieck rechts (Spitze zeigt nach innen/links)
-            dreieck_x_start = rechteck_hoehe/2
-            self.segments.append(segments.Segment([
-                (dreieck_x_start, -rechteck_breite/2),
-                (dreieck_x_start - dreieck_hoehe, 0),
-                (dreieck_x_start, rechteck_breite/2),
-                (dreieck_x_start, -rechteck_breite/2)
-            ], fill='black'))
-            
-            # Rechter Anschluss (vom rechten Rechteckrand nach rechts)
-            self.segments.append(segments.Segment([
-                (dreieck_x_start, 0),
-                (dreieck_x_start + anschluss_laenge, 0)
-            ]))
-            
-            # Linker Anschluss (vom Rechteck nach links)
-            self.segments.append(segments.Segment([
-                (-rechteck_hoehe/2, 0),
-                (-rechteck_hoehe/2 - anschluss_laenge, 0)
-            ]))
-            
-            # Ankerpunkte
-            self.anchors['1'] = (-rechteck_hoehe/2 - anschluss_laenge, 0)
-            self.anchors['2'] = (dreieck_x_start + anschluss_laenge, 0)
-            self.anchors['start'] = (-rechteck_hoehe/2 - anschluss_laenge, 0)
-            self.anchors['end'] = (dreieck_x_start + anschluss_laenge, 0)
-            
-            # Debug: Anchors anzeigen
-            if debug:
-                for name, pos in [('1', self.anchors['1']), 
-                                 ('2', self.anchors['2'])]:
-                    self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                    self.segments.append(segments.SegmentText(
-                        (pos[0], pos[1] + 0.2), name, fontsize=6, align=('center', 'bottom'), color='red'
-                    ))
-            
-            # Beschriftung unten
+            if self.typ:
+                texte.append(((0.4, y_offset), self.typ, dict(stil, fontsize=7)))
+        else:
+            # Beschriftung unten (bei "links" oben)
+            stil = dict(align=('center', 'top'))
             y_offset = -0.35
-            if bezeichnung:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), bezeichnung, fontsize=10, align=('center', 'top')
-                ))
+            if self.bezeichnung:
+                texte.append(((0, y_offset), self.bezeichnung, dict(stil, fontsize=10)))
                 y_offset -= 0.25
             
             # Technische Daten
-            if schutzpegel_kv:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), f"{schutzpegel_kv}kV", fontsize=7, align=('center', 'top')
-                ))
+            if self.schutzpegel_kv:
+                texte.append(((0, y_offset), f"{self.schutzpegel_kv}kV", dict(stil, fontsize=7)))
                 y_offset -= 0.2
             
-            if typ:
-                self.segments.append(segments.SegmentText(
-                    (0, y_offset), typ, fontsize=6, align=('center', 'top')
-                ))
+            if self.typ:
+                texte.append(((0, y_offset), self.typ, dict(stil, fontsize=6)))
+        return ausgerichtete_texte(texte, self._richtung)
 
 
 if __name__ == "__main__":
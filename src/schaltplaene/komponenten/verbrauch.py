@@ -3,12 +3,92 @@
 Symbolisiert den Verbrauch oder die Hausinstallation.
 """
 
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
 from schemdraw import segments
 
+# Versuche relative Imports, falle zurück auf absolute (für direkte Ausführung)
+try:
+    from .beschriftung import KASTEN, place_labels
+    from .geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+except ImportError:
+    from beschriftung import KASTEN, place_labels
+    from geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
+
+
+@lru_cache(maxsize=None)
+def _symbol(debug: bool) -> Symbol:
+    """
+    Linien und Anker des Verbrauch-Symbols ohne Beschriftung.
+    
+    Hängt nur vom Debug-Modus ab, wird einmal berechnet und von allen
+    Instanzen geteilt.
+    """
+    linien = []
+    zusatz = []
+    anker = {}
+    
+    # Geometrische Parameter
+    breite = 1.0
+    hoehe = 1.0
+    
+    # Rechteck (Gehäuse)
+    linien.append(linie([
+        (-breite/2, -hoehe/2),
+        (breite/2, -hoehe/2),
+        (breite/2, hoehe/2),
+        (-breite/2, hoehe/2),
+        (-breite/2, -hoehe/2)
+    ]))
+    
+    # Haus-Symbol in der Mitte
+    # Gebäude (Rechteck)
+    haus_breite = 0.4
+    haus_hoehe = 0.3
+    haus_y = -0.05
+    
+    linien.append(linie([
+        (-haus_breite/2, haus_y - haus_hoehe/2),
+        (haus_breite/2, haus_y - haus_hoehe/2),
+        (haus_breite/2, haus_y + haus_hoehe/2),
+        (-haus_breite/2, haus_y + haus_hoehe/2),
+        (-haus_breite/2, haus_y - haus_hoehe/2)
+    ]))
+    
+    # Dach (Dreieck)
+    dach_hoehe = 0.25
+    dach_y_start = haus_y + haus_hoehe/2
+    
+    linien.append(linie([
+        (-haus_breite/2, dach_y_start),
+        (0, dach_y_start + dach_hoehe),
+        (haus_breite/2, dach_y_start),
+        (-haus_breite/2, dach_y_start)
+    ]))
+    
+    # Ankerpunkte auf allen vier Seiten
+    anker['W'] = (-breite/2, 0)  # West (links)
+    anker['E'] = (breite/2, 0)   # East (rechts)
+    anker['N'] = (0, hoehe/2)    # North (oben)
+    anker['S'] = (0, -hoehe/2)   # South (unten)
+    
+    # Debug: Anchors anzeigen
+    if debug:
+        for name, pos in [('W', (-breite/2, 0)), 
+                         ('E', (breite/2, 0)),
+                         ('N', (0, hoehe/2)),
+                         ('S', (0, -hoehe/2))]:
+            zusatz.append(segments.SegmentCircle(pos, 0.05, fill='red'))
+            zusatz.append(segments.SegmentText(
+                (pos[0] * 1.2, pos[1] * 1.2), name, fontsize=6, align=('center', 'center'), color='red'
+            ))
+    
+    return Geometrie.aus_linien(linien, anker).symbol(*zusatz)
+
 
-class Verbrauch(elm.Element):
+class Verbrauch(GeteilteGeometrie, elm.Element):
     """
     Verbrauch/Haus-Symbol für Schaltpläne.
     
@@ -30,98 +110,25 @@ class Verbrauch(elm.Element):
         
         super().__init__(**kwargs)
         
-        # Geometrische Parameter
-        breite = 1.0
-        hoehe = 1.0
-        
-        # Rechteck (Gehäuse)
-        self.segments.append(segments.Segment([
-            (-breite/2, -hoehe/2),
-            (breite/2, -hoehe/2),
-            (breite/2, hoehe/2),
-            (-breite/2, hoehe/2),
-            (-breite/2, -hoehe/2)
-        ]))
-        
-        # Haus-Symbol in der Mitte
-        # Gebäude (Rechteck)
-        haus_breite = 0.4
-        haus_hoehe = 0.3
-        haus_y = -0.05
-        
-        self.segments.append(segments.Segment([
-            (-haus_breite/2, haus_y - haus_hoehe/2),
-            (haus_breite/2, haus_y - haus_hoehe/2),
-            (haus_breite/2, haus_y + haus_hoehe/2),
-            (-haus_breite/2, haus_y + haus_hoehe/2),
-            (-haus_breite/2, haus_y - haus_hoehe/2)
-        ]))
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        self._uebernimm(_symbol(debug))
         
-        # Dach (Dreieck)
-        dach_hoehe = 0.25
-        dach_y_start = haus_y + haus_hoehe/2
-        
-        self.segments.append(segments.Segment([
-            (-haus_breite/2, dach_y_start),
-            (0, dach_y_start + dach_hoehe),
-            (haus_breite/2, dach_y_start),
-            (-haus_breite/2, dach_y_start)
-        ]))
-        
-        # Ankerpunkte auf allen vier Seiten
-        self.anchors['W'] = (-breite/2, 0)  # West (links)
-        self.anchors['E'] = (breite/2, 0)   # East (rechts)
-        self.anchors['N'] = (0, hoehe/2)    # North (oben)
-        self.anchors['S'] = (0, -hoehe/2)   # South (unten)
-        
-        # Debug: Anchors anzeigen
-        if debug:
-            for name, pos in [('W', (-breite/2, 0)), 
-                             ('E', (breite/2, 0)),
-                             ('N', (0, hoehe/2)),
-                             ('S', (0, -hoehe/2))]:
-                self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                self.segments.append(segments.SegmentText(
-                    (pos[0] * 1.2, pos[1] * 1.2), name, fontsize=6, align=('center', 'center'), color='red'
-                ))
-        
-        # Beschriftung an angegebener Position
-        if bezeichnung:
-            label_positions = {
-                'N': ((0, hoehe/2 + 0.25), ('center', 'bottom')),
-                'S': ((0, -hoehe/2 - 0.25), ('center', 'top')),
-                'E': ((breite/2 + 0.25, 0), ('left', 'center')),
-                'W': ((-breite/2 - 0.25, 0), ('right', 'center')),
-                'NE': ((breite/2 + 0.25, hoehe/2 + 0.25), ('left', 'bottom')),
-                'NO': ((breite/2 + 0.25, hoehe/2 + 0.25), ('left', 'bottom')),
-                'NW': ((-breite/2 - 0.25, hoehe/2 + 0.25), ('right', 'bottom')),
-                'SE': ((breite/2 + 0.25, -hoehe/2 - 0.25), ('left', 'top')),
-                'SO': ((breite/2 + 0.25, -hoehe/2 - 0.25), ('left', 'top')),
-                'SW': ((-breite/2 - 0.25, -hoehe/2 - 0.25), ('right', 'top'))
-            }
-            pos, align = label_positions.get(label_loc.upper(), label_positions['N'])
-            self.segments.append(segments.SegmentText(
-                pos, bezeichnung, fontsize=10, align=align
-            ))
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self.leistung_kw = leistung_kw
+        self.label_loc = label_loc
+
+    def _beschriftung(self) -> list:
+        segmente = []
+        # Bezeichnung an angegebener Position
+        segmente.extend(place_labels(KASTEN, self.label_loc, [(self.bezeichnung, 10)]))
         
         # Technische Daten an gegenüberliegender Seite
-        if leistung_kw:
-            tech_positions = {
-                'N': ((0, -hoehe/2 - 0.25), ('center', 'top')),
-                'S': ((0, hoehe/2 + 0.25), ('center', 'bottom')),
-                'E': ((-breite/2 - 0.25, 0), ('right', 'center')),
-                'W': ((breite/2 + 0.25, 0), ('left', 'center')),
-                'NE': ((-breite/2 - 0.25, -hoehe/2 - 0.25), ('right', 'top')),
-                'NO': ((-breite/2 - 0.25, -hoehe/2 - 0.25), ('right', 'top')),
-                'NW': ((breite/2 + 0.25, -hoehe/2 - 0.25), ('left', 'top')),
-                'SE': ((-breite/2 - 0.25, hoehe/2 + 0.25), ('right', 'bottom')),
-                'SO': ((-breite/2 - 0.25, hoehe/2 + 0.25), ('right', 'bottom')),
-                'SW': ((breite/2 + 0.25, hoehe/2 + 0.25), ('left', 'bottom'))
-            }
-            pos, align = tech_positions.get(label_loc.upper(), tech_positions['N'])
-            self.segments.append(segments.SegmentText(
-                pos, f"{leistung_kw}kW", fontsize=8, align=align
+        if self.leistung_kw:
+            segmente.extend(place_labels(
+                KASTEN, self.label_loc, [(f"{self.leistung_kw}kW", 8)], gegenueber=True
             ))
+        return segmente
 
 
 if __name__ == "__main__":
@@ -3,13 +3,121 @@
 Wandelt Gleichstrom (DC) in Wechselstrom (AC) um.
 """
 
-import math
+from functools import lru_cache
+
+import numpy as np
 import schemdraw
 import schemdraw.elements as elm
 from schemdraw import segments
 
+# Versuche relative Imports, falle zurück auf absolute (für direkte Ausführung)
+try:
+    from .beschriftung import KASTEN, place_labels
+    from .geometrie import Geometrie, GeteilteGeometrie, Symbol, linie, symbol
+    from .geometrie import kurvenschritte as aktuelle_kurvenschritte
+except ImportError:
+    from beschriftung import KASTEN, place_labels
+    from geometrie import Geometrie, GeteilteGeometrie, Symbol, linie, symbol
+    from geometrie import kurvenschritte as aktuelle_kurvenschritte
+
+
+@lru_cache(maxsize=None)
+def _geometrie(schritte: int) -> Geometrie:
+    """
+    Linien und Anker des ungespiegelten Wechselrichters.
+    
+    Wird je Kurvenauflösung einmal berechnet; Spiegelungen entstehen daraus
+    als affine Abbildung.
+    
+    Args:
+        schritte: Abschnitte je AC-Welle
+    """
+    # Geometrische Parameter
+    breite = 1.0
+    hoehe = 1.0
+    
+    # Rechteck
+    rechteck = linie([
+        (-breite/2, -hoehe/2),
+        (breite/2, -hoehe/2),
+        (breite/2, hoehe/2),
+        (-breite/2, hoehe/2),
+        (-breite/2, -hoehe/2)
+    ])
+    
+    # Diagonale von links-unten nach rechts-oben
+    diagonale = linie([(-breite/2, -hoehe/2), (breite/2, hoehe/2)])
+    
+    # DC-Symbol im linken oberen Dreieck (=)
+    dc_x = -breite/4
+    dc_y = hoehe/3.5
+    dc_laenge = 0.25
+    dc_abstand = 0.08
+    
+    # Durchgezogene Linie (oben)
+    dc_oben = linie([
+        (dc_x - dc_laenge/2, dc_y + dc_abstand/2),
+        (dc_x + dc_laenge/2, dc_y + dc_abstand/2)
+    ])
+    
+    # Gestrichelte Linie (unten) - manuell gezeichnet: 1/3 Strich, 1/3 Lücke, 1/3 Strich
+    dc_strich_laenge = dc_laenge / 3
+    dc_links = linie([
+        (dc_x - dc_laenge/2, dc_y - dc_abstand/2),
+        (dc_x - dc_laenge/2 + dc_strich_laenge, dc_y - dc_abstand/2)
+    ])
+    dc_rechts = linie([
+        (dc_x + dc_laenge/2 - dc_strich_laenge, dc_y - dc_abstand/2),
+        (dc_x + dc_laenge/2, dc_y - dc_abstand/2)
+    ])
+    
+    # AC-Symbol im rechten unteren Dreieck (~~), beide Wellen vektorisiert
+    ac_x = breite/4
+    ac_y = -hoehe/3.5
+    ac_laenge = 0.3
+    ac_abstand = 0.1
+    t = np.linspace(0, 1, schritte + 1)
+    x = ac_x - ac_laenge/2 + t * ac_laenge
+    welle = 0.06 * np.sin(t * 2 * np.pi)
+    welle_oben = linie(np.column_stack([x, ac_y + ac_abstand/2 + welle]))
+    welle_unten = linie(np.column_stack([x, ac_y - ac_abstand/2 + welle]))
+    
+    # Ankerpunkte auf allen vier Seiten
+    anker = {
+        'W': (-breite/2, 0),  # West (links, DC-Seite ohne Spiegelung)
+        'E': (breite/2, 0),   # East (rechts, AC-Seite ohne Spiegelung)
+        'N': (0, hoehe/2),    # North (oben)
+        'S': (0, -hoehe/2),   # South (unten)
+    }
+    return Geometrie.aus_linien(
+        [rechteck, diagonale, dc_oben, dc_links, dc_rechts, welle_oben, welle_unten], anker
+    )
+
+
+@lru_cache(maxsize=None)
+def _symbol(flip_h: bool, flip_v: bool, debug: bool, schritte: int) -> Symbol:
+    """
+    Linien und Anker einer Spiegelvariante ohne Beschriftung.
+    
+    Die Linien werden mit einer affinen Abbildung gespiegelt, die Anker
+    bleiben unabhängig von der Spiegelung. Die AC-Wellen werden damit je
+    Spiegelung und Kurvenauflösung nur einmal berechnet.
+    """
+    basis = _geometrie(schritte)
+    zusatz = []
+    
+    # Debug: Anchors anzeigen
+    if debug:
+        for name, pos in basis.anker.items():
+            zusatz.append(segments.SegmentCircle(pos, 0.05, fill='red'))
+            zusatz.append(segments.SegmentText(
+                (pos[0] * 1.2, pos[1] * 1.2), name, fontsize=6, align=('center', 'center'), color='red'
+            ))
+    
+    return symbol(basis.gespiegelt(flip_h, flip_v).segmente + tuple(zusatz), basis.anker)
+
 
-class Wechselrichter(elm.Element):
+class Wechselrichter(GeteilteGeometrie, elm.Element):
     """
     Wechselrichter nach DIN EN 60617.
     
@@ -25,6 +133,8 @@ class Wechselrichter(elm.Element):
         flip_v: Vertikal spiegeln (oben/unten tauschen)
         label_loc: Position der Beschriftung ('N', 'S', 'E', 'W', 'NE', 'NO', 'NW', 'SE', 'SO', 'SW')
         debug: Zeigt Ankerpunkte zur Fehlersuche
+        kurvenschritte: Abschnitte je AC-Welle (None = passend zur Ausgabe,
+            siehe ``kurvenaufloesung()``)
     """
     
     def __init__(self, 
@@ -35,152 +145,29 @@ class Wechselrichter(elm.Element):
                  flip_v: bool = False,
                  label_loc: str = 'N',
                  debug: bool = False,
+                 kurvenschritte: int = None,
                  **kwargs):
         
         super().__init__(**kwargs)
         
-        # Geometrische Parameter
-        breite = 1.0
-        hoehe = 1.0
-        
-        # Spiegelfaktoren
-        fx = -1 if flip_h else 1
-        fy = -1 if flip_v else 1
-        
-        # Rechteck
-        self.segments.append(segments.Segment([
-            (fx * -breite/2, fy * -hoehe/2),
-            (fx * breite/2, fy * -hoehe/2),
-            (fx * breite/2, fy * hoehe/2),
-            (fx * -breite/2, fy * hoehe/2),
-            (fx * -breite/2, fy * -hoehe/2)
-        ]))
-        
-        # Diagonale von links-unten nach rechts-oben
-        self.segments.append(segments.Segment([
-            (fx * -breite/2, fy * -hoehe/2),
-            (fx * breite/2, fy * hoehe/2)
-        ]))
-        
-        # DC-Symbol im linken oberen Dreieck (=)
-        dc_x = -breite/4
-        dc_y = hoehe/3.5
-        dc_laenge = 0.25
-        dc_abstand = 0.08
-        
-        # Durchgezogene Linie (oben)
-        self.segments.append(segments.Segment([
-            (fx * (dc_x - dc_laenge/2), fy * (dc_y + dc_abstand/2)),
-            (fx * (dc_x + dc_laenge/2), fy * (dc_y + dc_abstand/2))
-        ]))
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        if kurvenschritte is None:
+            kurvenschritte = aktuelle_kurvenschritte()
+        self._uebernimm(_symbol(flip_h, flip_v, debug, kurvenschritte))
         
-        # Gestrichelte Linie (unten) - manuell gezeichnet: 1/3 Strich, 1/3 Lücke, 1/3 Strich
-        dc_strich_laenge = dc_laenge / 3
-        dc_luecke = dc_laenge / 3
-        # Linker Strich
-        self.segments.append(segments.Segment([
-            (fx * (dc_x - dc_laenge/2), fy * (dc_y - dc_abstand/2)),
-            (fx * (dc_x - dc_laenge/2 + dc_strich_laenge), fy * (dc_y - dc_abstand/2))
-        ]))
-        # Rechter Strich
-        self.segments.append(segments.Segment([
-            (fx * (dc_x + dc_laenge/2 - dc_strich_laenge), fy * (dc_y - dc_abstand/2)),
-            (fx * (dc_x + dc_laenge/2), fy * (dc_y - dc_abstand/2))
-        ]))
-        
-        # AC-Symbol im rechten unteren Dreieck (~~)
-        ac_x = breite/4
-        ac_y = -hoehe/3.5
-        ac_laenge = 0.3
-        ac_abstand = 0.1
-        
-        # Obere Welle (~)
-        punkte_oben = []
-        schritte = 20
-        for i in range(schritte + 1):
-            t = i / schritte
-            x = ac_x - ac_laenge/2 + t * ac_laenge
-            y = ac_y + ac_abstand/2 + 0.06 * math.sin(t * 2 * math.pi)
-            punkte_oben.append((fx * x, fy * y))
-        self.segments.append(segments.Segment(punkte_oben))
-        
-        # Untere Welle (~)
-        punkte_unten = []
-        for i in range(schritte + 1):
-            t = i / schritte
-            x = ac_x - ac_laenge/2 + t * ac_laenge
-            y = ac_y - ac_abstand/2 + 0.06 * math.sin(t * 2 * math.pi)
-            punkte_unten.append((fx * x, fy * y))
-        self.segments.append(segments.Segment(punkte_unten))
-        
-        # Ankerpunkte auf allen vier Seiten (unabhängig von Spiegelung)
-        self.anchors['W'] = (-breite/2, 0)  # West (links, DC-Seite ohne Spiegelung)
-        self.anchors['E'] = (breite/2, 0)   # East (rechts, AC-Seite ohne Spiegelung)
-        self.anchors['N'] = (0, hoehe/2)    # North (oben)
-        self.anchors['S'] = (0, -hoehe/2)   # South (unten)
-        
-        # Debug: Anchors anzeigen
-        if debug:
-            for name, pos in [('W', (-breite/2, 0)), 
-                             ('E', (breite/2, 0)),
-                             ('N', (0, hoehe/2)),
-                             ('S', (0, -hoehe/2))]:
-                self.segments.append(segments.SegmentCircle(pos, 0.05, fill='red'))
-                self.segments.append(segments.SegmentText(
-                    (pos[0] * 1.2, pos[1] * 1.2), name, fontsize=6, align=('center', 'center'), color='red'
-                ))
-        
-        # Beschriftung an angegebener Position
-        if bezeichnung:
-            label_positions = {
-                'N': ((0, hoehe/2 + 0.25), ('center', 'bottom')),
-                'S': ((0, -hoehe/2 - 0.25), ('center', 'top')),
-                'E': ((breite/2 + 0.25, 0), ('left', 'center')),
-                'W': ((-breite/2 - 0.25, 0), ('right', 'center')),
-                'NE': ((breite/2 + 0.25, hoehe/2 + 0.25), ('left', 'bottom')),
-                'NO': ((breite/2 + 0.25, hoehe/2 + 0.25), ('left', 'bottom')),
-                'NW': ((-breite/2 - 0.25, hoehe/2 + 0.25), ('right', 'bottom')),
-                'SE': ((breite/2 + 0.25, -hoehe/2 - 0.25), ('left', 'top')),
-                'SO': ((breite/2 + 0.25, -hoehe/2 - 0.25), ('left', 'top')),
-                'SW': ((-breite/2 - 0.25, -hoehe/2 - 0.25), ('right', 'top'))
-            }
-            pos, align = label_positions.get(label_loc.upper(), label_positions['N'])
-            self.segments.append(segments.SegmentText(
-                pos, bezeichnung, fontsize=10, align=align
-            ))
-        
-        # Technische Daten direkt unter dem Bezeichner
-        if label_loc.upper() in ['N', 'S', 'NE', 'NO', 'NW', 'SE', 'SO', 'SW']:
-            # Vertikale Anordnung: Leistung und Hersteller unter dem Bezeichner
-            y_offset = -0.2 if label_loc.upper() in ['N', 'NE', 'NO', 'NW'] else 0.2
-            current_pos = list(label_positions.get(label_loc.upper(), label_positions['N'])[0])
-            current_align = label_positions.get(label_loc.upper(), label_positions['N'])[1]
-            
-            if leistung_kw:
-                current_pos[1] += y_offset
-                self.segments.append(segments.SegmentText(
-                    tuple(current_pos), f"{leistung_kw}kW", fontsize=8, align=current_align
-                ))
-            if hersteller:
-                current_pos[1] += y_offset
-                self.segments.append(segments.SegmentText(
-                    tuple(current_pos), hersteller, fontsize=7, align=current_align
-                ))
-        else:  # E oder W - horizontal nebeneinander oder vertikal gestapelt
-            pos, align = label_positions.get(label_loc.upper(), label_positions['E'])
-            y_offset = -0.2
-            current_pos = list(pos)
-            
-            if leistung_kw:
-                current_pos[1] += y_offset
-                self.segments.append(segments.SegmentText(
-                    tuple(current_pos), f"{leistung_kw}kW", fontsize=8, align=align
-                ))
-            if hersteller:
-                current_pos[1] += y_offset
-                self.segments.append(segments.SegmentText(
-                    tuple(current_pos), hersteller, fontsize=7, align=align
-                ))
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self.leistung_kw = leistung_kw
+        self.hersteller = hersteller
+        self.label_loc = label_loc
+
+    def _beschriftung(self) -> list:
+        # Bezeichnung, darunter Leistung und Hersteller
+        return place_labels(KASTEN, self.label_loc, [
+            (self.bezeichnung, 10),
+            (f"{self.leistung_kw}kW" if self.leistung_kw else "", 8),
+            (self.hersteller, 7),
+        ])
 
 
 if __name__ == "__main__":
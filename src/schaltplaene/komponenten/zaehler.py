@@ -3,11 +3,15 @@ Zähler-Komponenten für elektrische Schaltpläne.
 """
 
 from enum import Enum
+from functools import lru_cache
+
 import schemdraw
 import schemdraw.elements as elm
-from schemdraw.elements import Element
 from schemdraw import segments
+from schemdraw.elements import Element
+
 from .enums import ComponentFlow
+from .geometrie import Geometrie, GeteilteGeometrie, Symbol, linie
 
 
 class ZaehlerPfeil(Enum):
@@ -24,7 +28,121 @@ class ZaehlerTarif(Enum):
     TARIF_ZWEI = 1    # Zwei Zählwerke (Zweitarif/HT+NT)
 
 
-class Zaehler(Element):
+@lru_cache(maxsize=None)
+def _pfeil() -> Geometrie:
+    """Richtungspfeil für Bezug (nach oben) in der vertikalen Grundform."""
+    pfeil_hoehe = 0.6
+    return Geometrie.aus_linien([
+        linie([(0, -pfeil_hoehe/2), (0, pfeil_hoehe/2)]),
+        linie([(-0.1, pfeil_hoehe/2 - 0.1), (0, pfeil_hoehe/2), (0.1, pfeil_hoehe/2 - 0.1)]),
+    ])
+
+
+@lru_cache(maxsize=None)
+def _symbol(flow: ComponentFlow, pfeil: ZaehlerPfeil, tarif: ZaehlerTarif,
+            debug: bool) -> tuple[Symbol, float]:
+    """
+    Linien und Anker des Zählers ohne Beschriftung.
+    
+    Hängt nur von Ausrichtung, Pfeilen, Tarif und Debug ab, wird je Variante einmal
+    berechnet und von allen Instanzen geteilt.
+    
+    Returns:
+        Symbol und y-Position der Oberkante des Zählwerks
+    """
+    linien = []
+    anker = {}
+    
+    # Hauptrechteck mit Einheit
+    breite = 1.0
+    hoehe = 0.8
+    
+    # Hauptrechteck
+    linien.append(linie([
+        (-breite/2, -hoehe/2), 
+        (breite/2, -hoehe/2), 
+        (breite/2, hoehe/2), 
+        (-breite/2, hoehe/2), 
+        (-breite/2, -hoehe/2)
+    ]))
+    
+    # Schmales Rechteck darüber (Zählwerk)
+    schmale_hoehe = 0.12
+    abstand = 0.02
+    
+    if tarif == ZaehlerTarif.TARIF_ZWEI:
+        # Ein großes Rechteck mit Trennlinie für Zweitarif (HT/NT)
+        gesamthoehe = 2*schmale_hoehe + abstand
+        linien.append(linie([
+            (-breite/2, hoehe/2),
+            (breite/2, hoehe/2),
+            (breite/2, hoehe/2 + gesamthoehe),
+            (-breite/2, hoehe/2 + gesamthoehe),
+            (-breite/2, hoehe/2)
+        ]))
+        # Trennlinie in der Mitte
+        linien.append(linie([
+            (-breite/2, hoehe/2 + schmale_hoehe + abstand/2),
+            (breite/2, hoehe/2 + schmale_hoehe + abstand/2)
+        ]))
+        ausgang_y = hoehe/2 + gesamthoehe
+    else:
+        # Ein schmales Rechteck für Eintarif
+        linien.append(linie([
+            (-breite/2, hoehe/2),
+            (breite/2, hoehe/2),
+            (breite/2, hoehe/2 + schmale_hoehe),
+            (-breite/2, hoehe/2 + schmale_hoehe),
+            (-breite/2, hoehe/2)
+        ]))
+        ausgang_y = hoehe/2 + schmale_hoehe
+    
+    # Anchors: abhängig von der Flussrichtung
+    if flow == ComponentFlow.FLOW_V:
+        # Vertikal: Eingang unten, Ausgang oben
+        anker['in'] = (0, -hoehe/2)
+        anker['out'] = (0, ausgang_y)
+    else:  # FLOW_H
+        # Horizontal: Eingang links, Ausgang rechts
+        anker['in'] = (-breite/2, 0)
+        anker['out'] = (breite/2, 0)
+    
+    anker['center'] = (0, 0)
+    anker['start'] = anker['in']
+    anker['end'] = anker['out']
+    
+    # Richtungspfeile neben dem Gehäuse, quer zur Flussrichtung (FLOW_V: links,
+    # FLOW_H: darunter). Jeder Pfeil ist der Bezugspfeil aus _pfeil(), für
+    # Einspeisung gespiegelt; je Pfeil (Einspeisung, Abstand zur Gehäusekante)
+    pfeile = {
+        ZaehlerPfeil.ARROW_NONE: (),
+        ZaehlerPfeil.ARROW_IN: ((False, 0.2),),
+        ZaehlerPfeil.ARROW_OUT: ((True, 0.2),),
+        ZaehlerPfeil.ARROW_BOTH: ((False, 0.35), (True, 0.2)),
+    }[pfeil]
+    if flow == ComponentFlow.FLOW_V:
+        richtung, kante = 'oben', breite/2
+    else:  # FLOW_H
+        richtung, kante = 'rechts', hoehe/2
+    
+    geometrie = Geometrie.aus_linien(linien, anker)
+    for einspeisung, pfeil_abstand in pfeile:
+        geometrie = geometrie + (
+            _pfeil().gespiegelt(y=einspeisung)
+            .verschoben(-kante - pfeil_abstand, 0)
+            .ausgerichtet(richtung)
+        )
+    
+    # Debug: Rote Punkte an den Anchors
+    zusatz = []
+    if debug:
+        zusatz.append(segments.SegmentCircle(anker['start'], 0.08, fill='red'))
+        zusatz.append(segments.SegmentCircle(anker['end'], 0.08, fill='red'))
+    
+    return geometrie.symbol(*zusatz), ausgang_y
+
+
+class Zaehler(GeteilteGeometrie, Element):
     """
     Stromzähler (Einrichtung oder Zweirichtung).
     
@@ -53,213 +171,51 @@ class Zaehler(Element):
         
         super().__init__(*args, **kwargs)
         
-        # Hauptrechteck mit Einheit
-        breite = 1.0
-        hoehe = 0.8
-        
-        # Hauptrechteck
-        self.segments.append(segments.Segment([
-            (-breite/2, -hoehe/2), 
-            (breite/2, -hoehe/2), 
-            (breite/2, hoehe/2), 
-            (-breite/2, hoehe/2), 
-            (-breite/2, -hoehe/2)
-        ]))
-        
-        # Schmales Rechteck darüber (Zählwerk)
-        schmale_hoehe = 0.12
-        abstand = 0.02
-        
-        if tarif == ZaehlerTarif.TARIF_ZWEI:
-            # Ein großes Rechteck mit Trennlinie für Zweitarif (HT/NT)
-            gesamthoehe = 2*schmale_hoehe + abstand
-            self.segments.append(segments.Segment([
-                (-breite/2, hoehe/2),
-                (breite/2, hoehe/2),
-                (breite/2, hoehe/2 + gesamthoehe),
-                (-breite/2, hoehe/2 + gesamthoehe),
-                (-breite/2, hoehe/2)
-            ]))
-            # Trennlinie in der Mitte
-            self.segments.append(segments.Segment([
-                (-breite/2, hoehe/2 + schmale_hoehe + abstand/2),
-                (breite/2, hoehe/2 + schmale_hoehe + abstand/2)
-            ]))
-            ausgang_y = hoehe/2 + gesamthoehe
-        else:
-            # Ein schmales Rechteck für Eintarif
-            self.segments.append(segments.Segment([
-                (-breite/2, hoehe/2),
-                (breite/2, hoehe/2),
-                (breite/2, hoehe/2 + schmale_hoehe),
-                (-breite/2, hoehe/2 + schmale_hoehe),
-                (-breite/2, hoehe/2)
-            ]))
-            ausgang_y = hoehe/2 + schmale_hoehe
-        
-        # Anchors: abhängig von der Flussrichtung
-        if flow == ComponentFlow.FLOW_V:
-            # Vertikal: Eingang unten, Ausgang oben
-            self.anchors['in'] = (0, -hoehe/2)
-            self.anchors['out'] = (0, ausgang_y)
-        else:  # FLOW_H
-            # Horizontal: Eingang links, Ausgang rechts
-            self.anchors['in'] = (-breite/2, 0)
-            self.anchors['out'] = (breite/2, 0)
-        
-        self.anchors['center'] = (0, 0)
-        self.anchors['start'] = self.anchors['in']
-        self.anchors['end'] = self.anchors['out']
-        
-        # Richtungspfeile (Position abhängig von flow)
-        pfeil_hoehe = 0.6
-        pfeil_breite = 0.6
-        
-        if flow == ComponentFlow.FLOW_V:
-            # Vertikale Ausrichtung: Pfeile links vom Zähler
-            pfeil_x_mitte = -breite/2 - 0.2
-            
-            if pfeil == ZaehlerPfeil.ARROW_IN:
-                # Ein Pfeil nach oben (Bezug)
-                self.segments.append(segments.Segment([
-                    (pfeil_x_mitte, -pfeil_hoehe/2),
-                    (pfeil_x_mitte, pfeil_hoehe/2)
-                ]))
-                self.segments.append(segments.Segment([
-                    (pfeil_x_mitte - 0.1, pfeil_hoehe/2 - 0.1),
-                    (pfeil_x_mitte, pfeil_hoehe/2),
-                    (pfeil_x_mitte + 0.1, pfeil_hoehe/2 - 0.1)
-                ]))
-                
-            elif pfeil == ZaehlerPfeil.ARROW_OUT:
-                # Ein Pfeil nach unten (Einspeisung)
-                self.segments.append(segments.Segment([
-                    (pfeil_x_mitte, pfeil_hoehe/2),
-                    (pfeil_x_mitte, -pfeil_hoehe/2)
-                ]))
-                self.segments.append(segments.Segment([
-                    (pfeil_x_mitte - 0.1, -pfeil_hoehe/2 + 0.1),
-                    (pfeil_x_mitte, -pfeil_hoehe/2),
-                    (pfeil_x_mitte + 0.1, -pfeil_hoehe/2 + 0.1)
-                ]))
-                
-            elif pfeil == ZaehlerPfeil.ARROW_BOTH:
-                # Zwei Pfeile (oben + unten)
-                pfeil_x_links = -breite/2 - 0.35
-                pfeil_x_rechts = -breite/2 - 0.2
-                
-                # Pfeil nach oben (Einspeisung)
-                self.segments.append(segments.Segment([
-                    (pfeil_x_links, -pfeil_hoehe/2),
-                    (pfeil_x_links, pfeil_hoehe/2)
-                ]))
-                self.segments.append(segments.Segment([
-                    (pfeil_x_links - 0.1, pfeil_hoehe/2 - 0.1),
-                    (pfeil_x_links, pfeil_hoehe/2),
-                    (pfeil_x_links + 0.1, pfeil_hoehe/2 - 0.1)
-                ]))
-                
-                # Pfeil nach unten (Bezug)
-                self.segments.append(segments.Segment([
-                    (pfeil_x_rechts, pfeil_hoehe/2),
-                    (pfeil_x_rechts, -pfeil_hoehe/2)
-                ]))
-                self.segments.append(segments.Segment([
-                    (pfeil_x_rechts - 0.1, -pfeil_hoehe/2 + 0.1),
-                    (pfeil_x_rechts, -pfeil_hoehe/2),
-                    (pfeil_x_rechts + 0.1, -pfeil_hoehe/2 + 0.1)
-                ]))
-        
-        else:  # FLOW_H
-            # Horizontale Ausrichtung: Pfeile unter dem Zähler
-            pfeil_y_mitte = -hoehe/2 - 0.2
-            
-            if pfeil == ZaehlerPfeil.ARROW_IN:
-                # Ein Pfeil nach rechts (Bezug)
-                self.segments.append(segments.Segment([
-                    (-pfeil_breite/2, pfeil_y_mitte),
-                    (pfeil_breite/2, pfeil_y_mitte)
-                ]))
-                self.segments.append(segments.Segment([
-                    (pfeil_breite/2 - 0.1, pfeil_y_mitte - 0.1),
-                    (pfeil_breite/2, pfeil_y_mitte),
-                    (pfeil_breite/2 - 0.1, pfeil_y_mitte + 0.1)
-                ]))
-                
-            elif pfeil == ZaehlerPfeil.ARROW_OUT:
-                # Ein Pfeil nach links (Einspeisung)
-                self.segments.append(segments.Segment([
-                    (pfeil_breite/2, pfeil_y_mitte),
-                    (-pfeil_breite/2, pfeil_y_mitte)
-                ]))
-                self.segments.append(segments.Segment([
-                    (-pfeil_breite/2 + 0.1, pfeil_y_mitte - 0.1),
-                    (-pfeil_breite/2, pfeil_y_mitte),
-                    (-pfeil_breite/2 + 0.1, pfeil_y_mitte + 0.1)
-                ]))
-                
-            elif pfeil == ZaehlerPfeil.ARROW_BOTH:
-                # Zwei Pfeile (links + rechts)
-                pfeil_y_oben = -hoehe/2 - 0.35
-                pfeil_y_unten = -hoehe/2 - 0.2
-                
-                # Pfeil nach rechts (Bezug)
-                self.segments.append(segments.Segment([
-                    (-pfeil_breite/2, pfeil_y_oben),
-                    (pfeil_breite/2, pfeil_y_oben)
-                ]))
-                self.segments.append(segments.Segment([
-                    (pfeil_breite/2 - 0.1, pfeil_y_oben - 0.1),
-                    (pfeil_breite/2, pfeil_y_oben),
-                    (pfeil_breite/2 - 0.1, pfeil_y_oben + 0.1)
-                ]))
-                
-                # Pfeil nach links (Einspeisung)
-                self.segments.append(segments.Segment([
-                    (pfeil_breite/2, pfeil_y_unten),
-                    (-pfeil_breite/2, pfeil_y_unten)
-                ]))
-                self.segments.append(segments.Segment([
-                    (-pfeil_breite/2 + 0.1, pfeil_y_unten - 0.1),
-                    (-pfeil_breite/2, pfeil_y_unten),
-                    (-pfeil_breite/2 + 0.1, pfeil_y_unten + 0.1)
-                ]))
+        # Linien und Anker aus dem gemeinsamen Geometrie-Cache
+        zaehler_symbol, self._ausgang_y = _symbol(flow, pfeil, tarif, debug)
+        self._uebernimm(zaehler_symbol)
         
         # Beschriftung - Einheit zentriert im Hauptrechteck als Label
         self.params['lblloc'] = 'center'
         self.params['lblofst'] = 0
         self.params['fontsize'] = 10
-        self.segments.append(segments.SegmentText(
-            (0, 0), einheit, fontsize=10
+        
+        # Parameter für die Beschriftung (Segmente erst beim Zeichnen)
+        self.bezeichnung = bezeichnung
+        self.info = info
+        self.einheit = einheit
+        self.flow = flow
+    
+    def _beschriftung(self) -> list:
+        breite = 1.0  # Breite des Hauptrechtecks
+        segmente = []
+        segmente.append(segments.SegmentText(
+            (0, 0), self.einheit, fontsize=10
         ))
         
         # Bezeichnung - Position abhängig vom Flow
-        if flow == ComponentFlow.FLOW_V:
+        if self.flow == ComponentFlow.FLOW_V:
             # Vertikal: Bezeichnung rechts vom Symbol
-            self.segments.append(segments.SegmentText(
-                (breite/2 + 0.15, 0), bezeichnung, fontsize=10, align=('left', 'center')
+            segmente.append(segments.SegmentText(
+                (breite/2 + 0.15, 0), self.bezeichnung, fontsize=10, align=('left', 'center')
             ))
             # Info-Text unter dem Bezeichner (falls vorhanden)
-            if info:
-                self.segments.append(segments.SegmentText(
-                    (breite/2 + 0.15, -0.25), info, fontsize=8, align=('left', 'center')
+            if self.info:
+                segmente.append(segments.SegmentText(
+                    (breite/2 + 0.15, -0.25), self.info, fontsize=8, align=('left', 'center')
                 ))
         else:  # FLOW_H
             # Horizontal: Bezeichnung über dem Symbol
-            self.segments.append(segments.SegmentText(
-                (0, ausgang_y + 0.15), bezeichnung, fontsize=10, align=('center', 'bottom')
+            segmente.append(segments.SegmentText(
+                (0, self._ausgang_y + 0.15), self.bezeichnung, fontsize=10,
+                align=('center', 'bottom')
             ))
             # Info-Text unter dem Bezeichner (falls vorhanden)
-            if info:
-                self.segments.append(segments.SegmentText(
-                    (0, ausgang_y + 0.35), info, fontsize=8, align=('center', 'bottom')
+            if self.info:
+                segmente.append(segments.SegmentText(
+                    (0, self._ausgang_y + 0.35), self.info, fontsize=8, align=('center', 'bottom')
                 ))
-        
-        # Debug: Rote Punkte an den Anchors
-        if debug:
-            from schemdraw.segments import SegmentCircle
-            self.segments.append(SegmentCircle(self.anchors['start'], 0.08, fill='red'))
-            self.segments.append(SegmentCircle(self.anchors['end'], 0.08, fill='red'))
+        return segmente
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+"""Rendering und Export von Schaltplänen.
+
+Dieses Modul bündelt die Ausgabe fertiger Schemdraw-Zeichnungen in
+verschiedene Dateiformate (auch als Sammel-PDF), die Optimierung der
+Segmente vor dem Zeichnen, das Verkleinern der SVG- und PNG-Daten sowie das Caching
+fertiger Bilddaten (im Speicher und prozessübergreifend auf der Festplatte).
+"""
+
+# Lazy imports, damit Matplotlib erst bei Bedarf geladen wird
+def __getattr__(name):
+    if name in ('FORMATE', 'SVG_FORMATE', 'exportiere_zeichnung', 'kurvenschritte_fuer',
+                'nach_kurvenschritten', 'pruefe_formate', 'schreibe_dateien', 'svgz'):
+        from . import export
+        return getattr(export, name)
+    if name in ('Optimierung', 'optimiere_zeichnung'):
+        from . import optimierung
+        return getattr(optimierung, name)
+    if name in ('SymbolSvg', 'svg_mit_symbolen'):
+        from . import svg_symbole
+        return getattr(svg_symbole, name)
+    if name in ('PdfBuendel', 'exportiere_pdf_buendel'):
+        from . import pdf_buendel
+        return getattr(pdf_buendel, name)
+    if name in ('SvgKompakt', 'kompaktiere_svg'):
+        from . import svg_kompakt
+        return getattr(svg_kompakt, name)
+    if name in ('PALETTE_FARBEN', 'PNG_MODI', 'reduziere_png'):
+        from . import png_palette
+        return getattr(png_palette, name)
+    if name in ('GEKACHELT_AB_PIXEL', 'KACHEL_PIXEL', 'PngKacheln', 'exportiere_png_gekachelt',
+                'schreibe_png_gekachelt'):
+        from . import png_kacheln
+        return getattr(png_kacheln, name)
+    if name in ('RenderCache', 'bibliotheks_versionen', 'quellen_fingerprint', 'render_schluessel',
+                'standard_cache'):
+        from . import cache
+        return getattr(cache, name)
+    if name == 'DiskCache':
+        from .disk_cache import DiskCache
+        return DiskCache
+    if name in ('RenderExecutor', 'RenderTimeoutError', 'RenderUeberlastetError'):
+        from . import executor
+        return getattr(executor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = [
+    'FORMATE', 'SVG_FORMATE', 'exportiere_zeichnung', 'kurvenschritte_fuer',
+    'nach_kurvenschritten', 'pruefe_formate', 'schreibe_dateien', 'svgz',
+    'Optimierung', 'optimiere_zeichnung',
+    'SymbolSvg', 'svg_mit_symbolen',
+    'SvgKompakt', 'kompaktiere_svg',
+    'PALETTE_FARBEN', 'PNG_MODI', 'reduziere_png',
+    'GEKACHELT_AB_PIXEL', 'KACHEL_PIXEL', 'PngKacheln', 'exportiere_png_gekachelt',
+    'schreibe_png_gekachelt',
+    'PdfBuendel', 'exportiere_pdf_buendel',
+    'RenderCache', 'bibliotheks_versionen', 'quellen_fingerprint', 'render_schluessel',
+    'standard_cache',
+    'DiskCache',
+    'RenderExecutor', 'RenderTimeoutError', 'RenderUeberlastetError',
+]
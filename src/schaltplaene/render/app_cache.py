@@ -0,0 +1,140 @@
+"""Gemeinsamer Render-Cache und Render-Executor für die Streamlit-App.
+
+Alle Sitzungen eines Streamlit-Prozesses teilen sich einen RenderCache
+(``st.cache_resource``) mit begrenztem Byte-Budget. Sitzungen merken sich
+nur den Cache-Schlüssel und die Template-Parameter, nicht die Bilddaten oder
+Render-Objekte. Identische Schaltpläne verschiedener Nutzer liegen so nur
+einmal im Speicher; ein verdrängtes SVG wird aus den Parametern über das
+Layout-Skelett des Templates neu erzeugt (``render.skelett``).
+
+Alle Renders laufen über einen gemeinsamen RenderExecutor, damit sich
+gleichzeitige Sitzungen nicht den globalen Zustand von Matplotlib und
+Schemdraw teilen.
+
+Die Vorschau-SVGs liegen komprimiert (SVGZ) im Cache und werden auch
+komprimiert an den Browser geschickt; erst ``vorschau_html()`` entpackt sie
+dort. Das spart Speicher im Cache und Bandbreite bei jedem Rerun (mobile
+Verbindungen).
+"""
+
+import base64
+import gzip
+import uuid
+
+import streamlit as st
+
+from schaltplaene.render.cache import RenderCache
+from schaltplaene.render.executor import RenderExecutor
+from schaltplaene.render.export import svgz
+from schaltplaene.render.skelett import TITEL, SvgRender
+
+# Obergrenzen für alle Sitzungen zusammen; bei Überschreitung werden die
+# am längsten nicht genutzten Bilder verdrängt
+MAX_BYTES = 256 * 1024 * 1024
+MAX_EINTRAEGE = 4096
+
+# Render-Executor: ein Worker (serialisiert), begrenzte Warteschlange und Timeout.
+# Ein Render über dem Timeout läuft trotzdem zu Ende und hält bis dahin alle
+# Sitzungen auf; der teuerste Download (PNG mit 1200 dpi, ca. 5 s) bleibt
+# deutlich darunter
+RENDER_TIMEOUT_S = 60.0
+
+# Auswählbare Auflösungen für den PNG-Download; ab 600 dpi (Plakat, A1/A0)
+# wird gekachelt gerastert (``render.png_kacheln``)
+PNG_DPI = (150, 300, 600, 1200)
+PNG_DPI_STANDARD = 300
+
+
+@st.cache_resource
+def gemeinsamer_cache() -> RenderCache:
+    """Prozessweiter Render-Cache, den alle Sitzungen teilen."""
+    return RenderCache(max_eintraege=MAX_EINTRAEGE, max_bytes=MAX_BYTES)
+
+
+@st.cache_resource
+def render_executor() -> RenderExecutor:
+    """Prozessweiter Render-Executor, den alle Sitzungen teilen."""
+    return RenderExecutor(timeout=RENDER_TIMEOUT_S)
+
+
+def sitzungs_id() -> str:
+    """Kennung der aktuellen Sitzung für die faire Verteilung der Renders."""
+    if 'render_sitzung' not in st.session_state:
+        st.session_state['render_sitzung'] = uuid.uuid4().hex
+    return st.session_state['render_sitzung']
+
+
+def svg_schluessel(template_klasse, parameter: dict, titel: str) -> str:
+    """Cache-Schlüssel des Vorschau-SVGs (SVGZ) für die Parameter eines Templates."""
+    return template_klasse(**parameter).cache_schluessel("svgz", titel, renderer="svg",
+                                                         symbole=True, kompakt=True)
+
+
+def svg_ablegen(template_klasse, parameter: dict, titel: str) -> str:
+    """Erzeugt das Vorschau-SVG bei Bedarf und legt es komprimiert (SVGZ) ab.
+
+    Args:
+        template_klasse: Von TemplateBasis abgeleitete Klasse
+        parameter: Konstruktor-Parameter des Templates
+        titel: Titel des Schaltplans
+
+    Returns:
+        Cache-Schlüssel, den die Sitzung zusammen mit Parametern und Titel
+        statt der Bilddaten speichert
+    """
+    schluessel = svg_schluessel(template_klasse, parameter, titel)
+    svgz_laden(schluessel, template_klasse, parameter, titel)
+    return schluessel
+
+
+def svgz_laden(schluessel: str, template_klasse, parameter: dict, titel: str,
+               sitzung: str | None = None) -> bytes:
+    """Liefert das komprimierte SVG (SVGZ) aus dem gemeinsamen Cache.
+
+    Fehlt der Eintrag (noch nicht erzeugt oder inzwischen verdrängt), wird
+    das SVG über ``SvgRender.erzeuge()`` im gemeinsamen Executor neu
+    erzeugt und wieder abgelegt. ``sitzung`` ist für Aufrufe außerhalb des
+    Skriptlaufs (Download-Callbacks) vorab mit ``sitzungs_id()`` zu ermitteln.
+    """
+    cache = gemeinsamer_cache()
+    daten = cache.get(schluessel)
+    if daten is None:
+        svg_render = render_executor().ausfuehren(sitzung or sitzungs_id(), SvgRender.erzeuge,
+                                                  template_klasse, {**parameter, TITEL: titel})
+        daten = svgz(svg_render.svg)
+        cache.put(schluessel, daten)
+    return daten
+
+
+def svg_laden(schluessel: str, template_klasse, parameter: dict, titel: str,
+              sitzung: str | None = None) -> bytes:
+    """Liefert das unkomprimierte SVG aus dem gemeinsamen Cache (z.B. für den Download)."""
+    return gzip.decompress(svgz_laden(schluessel, template_klasse, parameter, titel, sitzung))
+
+
+def vorschau_html(svgz_daten: bytes) -> str:
+    """HTML für ``components.html``, das ein SVGZ erst im Browser entpackt.
+
+    Übertragen werden nur die komprimierten Daten (Base64); das Entpacken
+    übernimmt ``DecompressionStream`` des Browsers.
+
+    Args:
+        svgz_daten: Komprimiertes SVG (z.B. von ``svgz_laden()``)
+
+    Returns:
+        HTML-Fragment mit Platzhalter und Skript
+    """
+    daten = base64.b64encode(svgz_daten).decode("ascii")
+    return f"""<div id="vorschau" style="width:100%; overflow:auto;"></div>
+<script>
+(async () => {{
+  const ziel = document.getElementById("vorschau");
+  if (!("DecompressionStream" in window)) {{
+    ziel.textContent = "Vorschau benötigt einen aktuellen Browser, bitte SVG herunterladen.";
+    return;
+  }}
+  const bytes = Uint8Array.from(atob("{daten}"), (c) => c.charCodeAt(0));
+  const strom = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+  ziel.innerHTML = await new Response(strom).text();
+}})();
+</script>"""
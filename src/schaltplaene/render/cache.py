@@ -0,0 +1,165 @@
+"""In-Prozess-Cache für fertig gerenderte Schaltpläne.
+
+Identische Template-Parameter führen zu identischen Bildern. Der Cache
+speichert die fertigen Bilddaten (SVG/PNG/PDF) unter einem kanonischen
+Hash der Parameter und verdrängt bei Überschreiten der Größengrenze die
+am längsten nicht mehr genutzten Einträge (LRU).
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+# Pakete, deren Quelltext das Aussehen der Schaltpläne bestimmt
+_QUELL_PAKETE = ("komponenten", "templates", "render")
+
+# Bibliotheken, deren Version die erzeugten Bytes beeinflusst
+_BIBLIOTHEKEN = ("schemdraw", "matplotlib", "pillow")
+
+
+def render_schluessel(**daten) -> str:
+    """Bildet einen kanonischen Hash über die übergebenen Render-Daten.
+
+    Die Daten werden als JSON mit sortierten Schlüsseln serialisiert, damit
+    die Reihenfolge der Argumente keine Rolle spielt. Typen bleiben dabei
+    unterscheidbar (10 und 10.0 ergeben unterschiedliche Beschriftungen und
+    daher auch unterschiedliche Schlüssel).
+
+    Returns:
+        SHA-256 als Hex-String
+    """
+    kanonisch = json.dumps(daten, sort_keys=True, ensure_ascii=False,
+                           separators=(',', ':'), default=str)
+    return hashlib.sha256(kanonisch.encode('utf-8')).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def quellen_fingerprint() -> str:
+    """Fingerprint der Quelltexte von ``komponenten``, ``templates`` und ``render``.
+
+    Wird in den Cache-Schlüssel aufgenommen, damit persistente Caches nach
+    einer Änderung an Komponenten-, Template- oder Render-Code (z.B. am
+    SVG-Export) automatisch ungültig werden. Die Berechnung erfolgt einmal
+    pro Prozess.
+
+    Returns:
+        SHA-256 als Hex-String
+    """
+    paket = Path(__file__).resolve().parent.parent
+    h = hashlib.sha256()
+    for name in _QUELL_PAKETE:
+        for pfad in sorted((paket / name).rglob("*.py")):
+            h.update(pfad.relative_to(paket).as_posix().encode('utf-8'))
+            h.update(b"\0")
+            h.update(pfad.read_bytes())
+            h.update(b"\0")
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def bibliotheks_versionen() -> dict[str, str]:
+    """Installierte Versionen der Render-Bibliotheken (ohne sie zu importieren).
+
+    Returns:
+        Dictionary Paketname -> Version (None, falls nicht installiert)
+    """
+    versionen = {}
+    for name in _BIBLIOTHEKEN:
+        try:
+            versionen[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versionen[name] = None
+    return versionen
+
+
+class RenderCache:
+    """Thread-sicherer LRU-Cache für gerenderte Bilddaten.
+
+    Args:
+        max_eintraege: Maximale Anzahl an Einträgen
+        max_bytes: Optionale Obergrenze für die Summe aller Bilddaten in Bytes
+    """
+
+    def __init__(self, max_eintraege: int = 128, max_bytes: int = None):
+        if max_eintraege < 1:
+            raise ValueError("max_eintraege muss mindestens 1 sein")
+        self.max_eintraege = max_eintraege
+        self.max_bytes = max_bytes
+        self._eintraege: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, schluessel: str):
+        """Liefert die Bilddaten zum Schlüssel oder None (zählt Treffer/Fehlschläge)."""
+        with self._lock:
+            daten = self._eintraege.get(schluessel)
+            if daten is None:
+                self.misses += 1
+                return None
+            self._eintraege.move_to_end(schluessel)
+            self.hits += 1
+            return daten
+
+    def put(self, schluessel: str, daten: bytes):
+        """Legt Bilddaten im Cache ab und verdrängt ggf. alte Einträge."""
+        if self.max_bytes is not None and len(daten) > self.max_bytes:
+            # Einzelner Eintrag größer als das Budget: gar nicht erst aufnehmen
+            return
+        with self._lock:
+            alt = self._eintraege.pop(schluessel, None)
+            if alt is not None:
+                self._bytes -= len(alt)
+            self._eintraege[schluessel] = daten
+            self._bytes += len(daten)
+            self._verdraenge()
+
+    def _verdraenge(self):
+        """Entfernt die ältesten Einträge, bis alle Grenzen eingehalten sind."""
+        while (len(self._eintraege) > self.max_eintraege
+               or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            _, daten = self._eintraege.popitem(last=False)
+            self._bytes -= len(daten)
+
+    def leere(self):
+        """Entfernt alle Einträge und setzt die Zähler zurück."""
+        with self._lock:
+            self._eintraege.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def groesse_bytes(self) -> int:
+        """Summe der gespeicherten Bilddaten in Bytes."""
+        return self._bytes
+
+    def statistik(self) -> dict:
+        """Liefert Treffer, Fehlschläge, Anzahl Einträge und Größe."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'eintraege': len(self._eintraege),
+                'bytes': self._bytes,
+            }
+
+    def __len__(self):
+        return len(self._eintraege)
+
+    def __contains__(self, schluessel: str):
+        return schluessel in self._eintraege
+
+
+# Obergrenzen des Standard-Caches (Byte-Budget wie beim gemeinsamen Cache
+# der Web-App, damit PNGs hoher Auflösung nicht unbegrenzt Speicher belegen)
+STANDARD_MAX_EINTRAEGE = 128
+STANDARD_MAX_BYTES = 256 * 1024 * 1024
+
+# Prozessweiter Standard-Cache für TemplateBasis.rendere()
+standard_cache = RenderCache(max_eintraege=STANDARD_MAX_EINTRAEGE, max_bytes=STANDARD_MAX_BYTES)
@@ -0,0 +1,198 @@
+"""Persistenter, inhaltsadressierter Render-Cache auf der Festplatte.
+
+Mehrere Prozesse (Worker, Streamlit-Replikate) können sich ein
+Cache-Verzeichnis teilen. Aufbau:
+
+    <verzeichnis>/objekte/ab/<sha256 der Bilddaten>   Bilddaten
+    <verzeichnis>/schluessel/cd/<render-schluessel>    SHA-256 des Objekts
+
+Alle Dateien werden atomar geschrieben (temporäre Datei + ``os.replace``),
+Leser sehen daher immer entweder keine oder eine vollständige Datei. Beim
+Lesen wird der Inhalt gegen seinen Hash geprüft. Überschreitet der Cache
+seine Größe, werden die am längsten nicht genutzten Objekte samt ihrer
+Verweise gelöscht.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+# Nach einer Aufräumaktion wird der Cache auf diesen Anteil von max_bytes gekürzt,
+# damit nicht bei jedem folgenden Schreibvorgang erneut aufgeräumt werden muss
+_FUELLGRAD_NACH_AUFRAEUMEN = 0.9
+
+
+class DiskCache:
+    """Inhaltsadressierter Datei-Cache für gerenderte Bilddaten.
+
+    Args:
+        verzeichnis: Cache-Verzeichnis (wird bei Bedarf angelegt)
+        max_bytes: Obergrenze für die Größe aller Cache-Dateien in Bytes
+    """
+
+    def __init__(self, verzeichnis, max_bytes: int = 512 * 1024 * 1024):
+        self.verzeichnis = Path(verzeichnis)
+        self.max_bytes = max_bytes
+        self._objekte = self.verzeichnis / "objekte"
+        self._schluessel = self.verzeichnis / "schluessel"
+        self._objekte.mkdir(parents=True, exist_ok=True)
+        self._schluessel.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Schätzung der Gesamtgröße; andere Prozesse schreiben ebenfalls,
+        # daher wird vor dem Verdrängen immer neu gezählt
+        self._bytes = sum(groesse for _, groesse, _ in self._dateien())
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _unterpfad(basis: Path, name: str) -> Path:
+        return basis / name[:2] / name
+
+    def _schreibe_atomar(self, ziel: Path, daten: bytes):
+        """Schreibt Daten über eine temporäre Datei und ``os.replace``."""
+        ziel.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=ziel.parent, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(daten)
+            try:
+                os.replace(tmp, ziel)
+            except PermissionError:
+                # Windows: Ziel ist gerade von einem Leser geöffnet. Der Inhalt
+                # ist inhaltsadressiert bzw. identisch, daher genügt es zu verwerfen
+                # und die vorhandene Datei als genutzt zu markieren.
+                os.unlink(tmp)
+                os.utime(ziel)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def get(self, schluessel: str):
+        """Liefert die Bilddaten zum Schlüssel oder None."""
+        ref = self._unterpfad(self._schluessel, schluessel)
+        try:
+            digest = ref.read_text(encoding="ascii").strip()
+        except (FileNotFoundError, ValueError):
+            self._zaehle(treffer=False)
+            return None
+        obj = self._unterpfad(self._objekte, digest)
+        try:
+            daten = obj.read_bytes()
+        except FileNotFoundError:
+            # Objekt inzwischen verdrängt: Verweis ist veraltet
+            self._entferne(ref)
+            self._zaehle(treffer=False)
+            return None
+
+        if hashlib.sha256(daten).hexdigest() != digest:
+            # Beschädigtes oder fremdes Objekt: wie ein Fehlschlag behandeln
+            self._entferne(ref)
+            self._zaehle(treffer=False)
+            return None
+
+        # Zugriffszeit für die LRU-Verdrängung aktualisieren
+        for pfad in (ref, obj):
+            try:
+                os.utime(pfad)
+            except OSError:
+                pass
+        self._zaehle(treffer=True)
+        return daten
+
+    def put(self, schluessel: str, daten: bytes):
+        """Legt Bilddaten ab.
+
+        Das Objekt wird immer neu geschrieben, auch wenn es schon vorhanden
+        ist: Ein anderer Prozess könnte es sonst zwischen Prüfung und
+        Schreiben des Verweises verdrängen. Als jüngste Datei bleibt es beim
+        nächsten Aufräumen erhalten.
+        """
+        digest = hashlib.sha256(daten).hexdigest()
+        obj = self._unterpfad(self._objekte, digest)
+        neu = not obj.exists()
+        self._schreibe_atomar(obj, daten)
+        if neu:
+            with self._lock:
+                self._bytes += len(daten)
+        self._schreibe_atomar(self._unterpfad(self._schluessel, schluessel),
+                              digest.encode("ascii"))
+
+        if self._bytes > self.max_bytes:
+            self._raeume_auf()
+
+    def _dateien(self, *basen):
+        """Liefert (mtime, Größe, Pfad) aller Cache-Dateien (bzw. der in ``basen``)."""
+        for basis in basen or (self._objekte, self._schluessel):
+            for wurzel, _, namen in os.walk(basis):
+                for name in namen:
+                    if name.endswith(".tmp"):
+                        continue
+                    pfad = Path(wurzel) / name
+                    try:
+                        st = pfad.stat()
+                    except FileNotFoundError:
+                        continue  # Gleichzeitig von einem anderen Prozess entfernt
+                    yield st.st_mtime, st.st_size, pfad
+
+    def _raeume_auf(self):
+        """Löscht die am längsten nicht genutzten Objekte bis unter die Grenze.
+
+        Verweise auf gelöschte (oder fehlende) Objekte werden mit entfernt,
+        damit keine veralteten Verweise liegen bleiben.
+        """
+        with self._lock:
+            objekte = sorted(self._dateien(self._objekte))
+            verweise = list(self._dateien(self._schluessel))
+            gesamt = sum(groesse for _, groesse, _ in objekte + verweise)
+            ziel = self.max_bytes * _FUELLGRAD_NACH_AUFRAEUMEN
+            for _, groesse, pfad in objekte:
+                if gesamt <= ziel:
+                    break
+                self._entferne(pfad)
+                gesamt -= groesse
+
+            for _, groesse, ref in verweise:
+                try:
+                    digest = ref.read_text(encoding="ascii").strip()
+                except (FileNotFoundError, ValueError):
+                    continue
+                if not self._unterpfad(self._objekte, digest).exists():
+                    self._entferne(ref)
+                    gesamt -= groesse
+            self._bytes = gesamt
+
+    @staticmethod
+    def _entferne(pfad: Path):
+        try:
+            pfad.unlink()
+        except (FileNotFoundError, PermissionError):
+            pass
+
+    def _zaehle(self, treffer: bool):
+        with self._lock:
+            if treffer:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def leere(self):
+        """Löscht alle Cache-Dateien und setzt die Zähler zurück."""
+        with self._lock:
+            for _, _, pfad in list(self._dateien()):
+                self._entferne(pfad)
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def groesse_bytes(self) -> int:
+        """Geschätzte Größe aller Cache-Dateien in Bytes."""
+        return self._bytes
+
+    def statistik(self) -> dict:
+        """Liefert Treffer, Fehlschläge und geschätzte Größe."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'bytes': self._bytes}
@@ -0,0 +1,155 @@
+"""Thread-sicherer Executor für Render-Aufträge mehrerer Nutzer.
+
+Matplotlib und der Zeichnungs-Stack von Schemdraw sind globaler Zustand
+und nicht thread-sicher. Streamlit führt jede Sitzung in einem eigenen
+Thread aus; gleichzeitige Renders würden sich gegenseitig stören. Der
+Executor führt alle Aufträge nacheinander in genau einem Worker-Thread aus
+und verteilt sie reihum auf die Sitzungen, sodass ein Nutzer mit vielen
+Klicks andere nicht blockiert. Mehr Durchsatz gibt es nur über mehrere
+Prozesse (z.B. Streamlit-Replikate, die sich einen ``DiskCache`` teilen).
+
+Ein laufender Render lässt sich nicht abbrechen. Der Timeout begrenzt nur
+das Warten des Aufrufers: Ein Auftrag, der ihn überschreitet, läuft im
+Worker zu Ende, und alle anderen Sitzungen warten so lange. Der Timeout ist
+deshalb so zu wählen, dass auch der teuerste Render (z.B. PNG mit 1200 dpi)
+deutlich darunter bleibt.
+"""
+
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+
+class RenderUeberlastetError(RuntimeError):
+    """Zu viele wartende Render-Aufträge (gesamt oder für eine Sitzung)."""
+
+
+class RenderTimeoutError(TimeoutError):
+    """Ein Render-Auftrag wurde nicht rechtzeitig fertig."""
+
+
+class RenderExecutor:
+    """Führt Render-Aufträge nacheinander und fair verteilt aus.
+
+    Jede Sitzung hat eine eigene Warteschlange; der Worker entnimmt
+    Aufträge reihum (Round Robin) aus den Sitzungen.
+
+    Args:
+        max_warteschlange: Maximale Anzahl wartender Aufträge insgesamt
+        max_pro_sitzung: Maximale Anzahl wartender Aufträge je Sitzung
+        timeout: Standard-Timeout je Auftrag in Sekunden (Warten + Rendern)
+    """
+
+    def __init__(self, max_warteschlange: int = 64, max_pro_sitzung: int = 4,
+                 timeout: float = 60.0):
+        self.max_warteschlange = max_warteschlange
+        self.max_pro_sitzung = max_pro_sitzung
+        self.timeout = timeout
+        self._warteschlangen: OrderedDict[str, deque] = OrderedDict()
+        self._wartend = 0
+        self._bedingung = threading.Condition()
+        self._beendet = False
+        # Genau ein Worker: Matplotlib/pyplot dürfen nie gleichzeitig zeichnen
+        self._thread = threading.Thread(target=self._arbeite, name="render-worker", daemon=True)
+        self._thread.start()
+
+    def einreihen(self, sitzung: str, funktion, *args, **kwargs) -> Future:
+        """Reiht einen Auftrag ein, ohne auf das Ergebnis zu warten.
+
+        Args:
+            sitzung: Kennung der Sitzung (für die faire Verteilung)
+            funktion: Aufzurufende Funktion, z.B. ``template.rendere``
+
+        Returns:
+            Future mit dem Rückgabewert der Funktion
+
+        Raises:
+            RenderUeberlastetError: Wenn die Warteschlange voll ist
+        """
+        future = Future()
+        with self._bedingung:
+            if self._beendet:
+                raise RuntimeError("RenderExecutor wurde beendet")
+            warteschlange = self._warteschlangen.get(sitzung)
+            if self._wartend >= self.max_warteschlange:
+                raise RenderUeberlastetError(
+                    "Zu viele Render-Aufträge, bitte später erneut versuchen")
+            if warteschlange is not None and len(warteschlange) >= self.max_pro_sitzung:
+                raise RenderUeberlastetError("Zu viele Render-Aufträge für diese Sitzung")
+            if warteschlange is None:
+                warteschlange = self._warteschlangen[sitzung] = deque()
+            warteschlange.append((future, funktion, args, kwargs))
+            self._wartend += 1
+            self._bedingung.notify()
+        return future
+
+    def ausfuehren(self, sitzung: str, funktion, *args, timeout: float = None, **kwargs):
+        """Führt einen Auftrag aus und wartet auf das Ergebnis.
+
+        Args:
+            sitzung: Kennung der Sitzung (für die faire Verteilung)
+            funktion: Aufzurufende Funktion, z.B. ``template.rendere``
+            timeout: Timeout in Sekunden (None = Standard-Timeout des Executors)
+
+        Returns:
+            Rückgabewert der Funktion
+
+        Raises:
+            RenderUeberlastetError: Wenn die Warteschlange voll ist
+            RenderTimeoutError: Wenn der Auftrag nicht rechtzeitig fertig wurde
+                (ein bereits laufender Render läuft trotzdem zu Ende und
+                blockiert bis dahin alle folgenden Aufträge)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        future = self.einreihen(sitzung, funktion, *args, **kwargs)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            # Noch wartende Aufträge werden verworfen; ein bereits laufender
+            # Render kann nicht abgebrochen werden und läuft zu Ende
+            future.cancel()
+            raise RenderTimeoutError(f"Rendern dauerte länger als {timeout:g} s") from None
+
+    def _naechster(self):
+        """Entnimmt den nächsten Auftrag reihum über alle Sitzungen."""
+        sitzung, warteschlange = next(iter(self._warteschlangen.items()))
+        auftrag = warteschlange.popleft()
+        if warteschlange:
+            # Sitzung ans Ende stellen, damit die anderen zuerst drankommen
+            self._warteschlangen.move_to_end(sitzung)
+        else:
+            del self._warteschlangen[sitzung]
+        self._wartend -= 1
+        return auftrag
+
+    def _arbeite(self):
+        while True:
+            with self._bedingung:
+                while not self._warteschlangen and not self._beendet:
+                    self._bedingung.wait()
+                if self._beendet and not self._warteschlangen:
+                    return
+                future, funktion, args, kwargs = self._naechster()
+
+            if not future.set_running_or_notify_cancel():
+                continue  # Nach Timeout abgebrochen
+            try:
+                ergebnis = funktion(*args, **kwargs)
+            except Exception as fehler:
+                future.set_exception(fehler)
+            else:
+                future.set_result(ergebnis)
+
+    @property
+    def wartend(self) -> int:
+        """Anzahl der wartenden (noch nicht gestarteten) Aufträge."""
+        return self._wartend
+
+    def beende(self, warten: bool = True):
+        """Beendet den Worker, nachdem alle wartenden Aufträge erledigt sind."""
+        with self._bedingung:
+            self._beendet = True
+            self._bedingung.notify_all()
+        if warten:
+            self._thread.join()
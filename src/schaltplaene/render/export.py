@@ -0,0 +1,249 @@
+"""Export einer Zeichnung in mehrere Formate mit nur einem Zeichenvorgang.
+
+``Drawing.save()`` und ``Drawing.get_imagedata()`` lassen Matplotlib für
+jedes Format erneut die komplette Figur aufbauen bzw. neu anordnen. Hier
+wird die Zeichnung genau einmal gelayoutet und gezeichnet; anschließend
+werden alle gewünschten Formate aus derselben Figur geschrieben.
+
+Die Ausgabe ist deterministisch: gleiche Zeichnungen ergeben byte-identische
+Dateien (keine Zeitstempel in SVG/PDF, feste IDs im Matplotlib-SVG). Damit
+taugt der Hash der Bilddaten als ETag und zur Deduplizierung von Archiven.
+
+SVGZ ist das mit gzip komprimierte SVG (ebenfalls ohne Zeitstempel); es wird
+aus demselben SVG erzeugt und ist je nach Plan 3-5x kleiner.
+
+PNGs können ohne Antialiasing gerastert und als Palette- bzw. 1-Bit-Bild
+geschrieben werden (``render.png_palette``), etwa für Portal-Uploads. Große
+PNGs (hohe Auflösung, ab ``GEKACHELT_AB_PIXEL``) werden gekachelt gerastert
+(``render.png_kacheln``), der Speicherbedarf bleibt dabei begrenzt.
+"""
+
+import gzip
+from contextlib import contextmanager, nullcontext
+from io import BytesIO
+from pathlib import Path
+
+import schemdraw
+
+from .optimierung import optimiere_zeichnung
+from .png_kacheln import GEKACHELT_AB_PIXEL, bildgroesse, schreibe_png_gekachelt
+from .png_palette import pruefe_png_modus, reduziere_png
+from .svg_kompakt import kompaktiere_svg
+from .svg_symbole import svg_mit_symbolen
+
+# Unterstützte Ausgabeformate
+FORMATE = ("svg", "svgz", "png", "pdf")
+
+# Formate, die aus dem SVG entstehen (auch mit dem SVG-Renderer verfügbar)
+SVG_FORMATE = ("svg", "svgz")
+
+# gzip-Stufe für SVGZ: SVG komprimiert auch mit der höchsten Stufe schnell
+SVGZ_STUFE = 9
+
+# Stützstellen je Kurve (z.B. AC-Welle des Wechselrichters) nach Ausgabe:
+# SVG für den Bildschirm, PDF fein für den Druck, PNG proportional zur
+# Auflösung (bei 72 dpi wie SVG, Vorschaubilder entsprechend gröber)
+KURVENSCHRITTE_SVG = 20
+KURVENSCHRITTE_PDF = 48
+
+# Metadaten je Format ohne Zeitstempel (Matplotlib setzt sonst Datum/Uhrzeit);
+# auch für eigene Ausgaben wie das Sammel-PDF (``render.pdf_buendel``)
+METADATEN = {
+    "svg": {"Date": None},
+    "pdf": {"CreationDate": None},
+}
+
+# Fester Salt für die IDs im Matplotlib-SVG (Clip-Pfade); ohne Salt verwendet
+# Matplotlib eine zufällige UUID pro Prozess
+SVG_HASHSALT = "schaltplaene"
+
+
+def pruefe_formate(formate, canvas: str = "matplotlib") -> tuple:
+    """Normalisiert die Formatliste und prüft sie gegen den Renderer.
+
+    Args:
+        formate: Einzelnes Format oder Folge von Formaten (z.B. "svg", ".PNG", "svgz")
+        canvas: Renderer bzw. Schemdraw-Canvas ("matplotlib" oder "svg")
+
+    Returns:
+        Tupel der Formate in Kleinbuchstaben ohne Duplikate
+    """
+    if isinstance(formate, str):
+        formate = (formate,)
+    formate = tuple(dict.fromkeys(fmt.lower().lstrip('.') for fmt in formate))
+    for fmt in formate:
+        if fmt not in FORMATE:
+            raise ValueError(f"Unbekanntes Format {fmt!r}, erlaubt: {', '.join(FORMATE)}")
+        if canvas == 'svg' and fmt not in SVG_FORMATE:
+            raise ValueError(f"Format {fmt!r} ist mit dem SVG-Renderer nicht verfügbar")
+    return formate
+
+
+def kurvenschritte_fuer(fmt: str, dpi: float = 72) -> int:
+    """Stützstellen je Kurve für ein Ausgabeformat.
+
+    Args:
+        fmt: Ausgabeformat ("svg", "svgz", "png", "pdf")
+        dpi: Auflösung für Rasterformate (PNG)
+
+    Returns:
+        Anzahl Abschnitte je Kurve (für ``kurvenaufloesung()``)
+    """
+    if fmt == 'pdf':
+        return KURVENSCHRITTE_PDF
+    if fmt == 'png':
+        return min(KURVENSCHRITTE_PDF, round(KURVENSCHRITTE_SVG * dpi / 72))
+    return KURVENSCHRITTE_SVG
+
+
+def nach_kurvenschritten(formate, dpi: float = 72) -> dict[int, tuple]:
+    """Gruppiert Formate nach ihrer Kurvenauflösung.
+
+    Formate einer Gruppe können aus derselben Zeichnung exportiert werden.
+
+    Returns:
+        Dictionary Stützstellen -> Formate
+    """
+    gruppen = {}
+    for fmt in formate:
+        gruppen.setdefault(kurvenschritte_fuer(fmt, dpi), []).append(fmt)
+    return {schritte: tuple(gruppe) for schritte, gruppe in gruppen.items()}
+
+
+def svgz(svg: bytes) -> bytes:
+    """Komprimiert SVG-Daten zu SVGZ (gzip ohne Zeitstempel, deterministisch)."""
+    return gzip.compress(svg, compresslevel=SVGZ_STUFE, mtime=0)
+
+
+def exportiere_zeichnung(d: schemdraw.Drawing, formate=("svg", "png"),
+                         dpi: float = 72, transparent: bool = True,
+                         optimiere: bool = False, symbole: bool = False,
+                         kompakt: bool = False, png_modus: str = "rgba",
+                         antialiasing: bool = True) -> dict[str, bytes]:
+    """Zeichnet die Zeichnung einmal und exportiert sie in alle Formate.
+
+    Args:
+        d: Fertig aufgebaute Schemdraw-Zeichnung
+        formate: Ausgabeformate, z.B. ("svg", "png", "pdf"); "svgz" wird
+            aus dem SVG komprimiert
+        dpi: Auflösung für Rasterformate (PNG); ab ``GEKACHELT_AB_PIXEL``
+            Pixeln wird das PNG gekachelt gerastert
+        transparent: Transparenter Hintergrund
+        optimiere: Liniensegmente vorher zusammenfassen
+            (siehe ``render.optimierung.optimiere_zeichnung``)
+        symbole: SVG mit ``<symbol>``/``<use>`` für gleiche Komponenten
+            (immer über das SVG-Backend von Schemdraw, siehe ``render.svg_symbole``);
+            nach ``optimiere`` gibt es keine einzelnen Komponenten mehr
+        kompakt: SVG nachträglich verkleinern (``render.svg_kompakt``)
+        png_modus: "rgba" (Matplotlib), "palette" oder "1bit"
+            (``render.png_palette``)
+        antialiasing: PNG mit Kantenglättung rastern; ohne enthält das Bild
+            nur die verwendeten Farben und komprimiert deutlich besser
+
+    Returns:
+        Dictionary Format -> Bilddaten (bytes) in der Reihenfolge von ``formate``
+    """
+    formate = pruefe_formate(formate, d.canvas)
+    png_modus = pruefe_png_modus(png_modus)
+    # SVGZ entsteht aus dem SVG, gezeichnet werden nur die Grundformate
+    gezeichnet = tuple(dict.fromkeys('svg' if fmt == 'svgz' else fmt for fmt in formate))
+    bilder = _zeichne(d, gezeichnet, dpi, transparent, optimiere, symbole, png_modus,
+                      antialiasing)
+    if kompakt and 'svg' in bilder:
+        bilder['svg'] = kompaktiere_svg(bilder['svg']).svg
+    if 'svgz' in formate:
+        bilder['svgz'] = svgz(bilder['svg'])
+    return {fmt: bilder[fmt] for fmt in formate}
+
+
+def _zeichne(d: schemdraw.Drawing, formate: tuple, dpi: float, transparent: bool,
+             optimiere: bool, symbole: bool, png_modus: str = "rgba",
+             antialiasing: bool = True) -> dict[str, bytes]:
+    """Zeichnet die Zeichnung einmal und schreibt die Formate (ohne SVGZ)."""
+    if optimiere:
+        optimiere_zeichnung(d)
+
+    ergebnis = {}
+    if symbole and 'svg' in formate:
+        ergebnis['svg'] = svg_mit_symbolen(d).svg
+    if formate == tuple(ergebnis):
+        return ergebnis
+
+    # Layout und Zeichnen genau einmal
+    fig = d.draw(show=False)
+
+    if d.canvas == 'svg':
+        return {'svg': fig.getimage('svg')}
+
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    mpl_fig = fig.getfig()
+    try:
+        with matplotlib.rc_context({'svg.hashsalt': SVG_HASHSALT}):
+            for fmt in formate:
+                if fmt in ergebnis:
+                    continue
+                puffer = BytesIO()
+                extra = fig.ax.get_default_bbox_extra_artists()
+                if fmt == 'png' and _gross(mpl_fig, dpi, extra):
+                    # Großformat: Kachel für Kachel, der PNG-Modus wird dabei umgesetzt
+                    schreibe_png_gekachelt(mpl_fig, puffer, dpi, transparent, png_modus,
+                                           antialiasing, extra)
+                    ergebnis[fmt] = puffer.getvalue()
+                    continue
+                # Antialiasing nur für das PNG abschalten, SVG/PDF bleiben unverändert
+                ohne_aa = fmt == 'png' and not antialiasing
+                with _ohne_antialiasing(mpl_fig) if ohne_aa else nullcontext():
+                    mpl_fig.savefig(puffer, format=fmt, dpi=dpi, transparent=transparent,
+                                    bbox_inches='tight', bbox_extra_artists=extra,
+                                    pad_inches=0, metadata=METADATEN.get(fmt))
+                ergebnis[fmt] = puffer.getvalue()
+                if fmt == 'png' and png_modus != 'rgba':
+                    ergebnis[fmt] = reduziere_png(ergebnis[fmt], png_modus)
+    finally:
+        # Figur aus pyplot abmelden, sonst bleibt sie bis Prozessende im Speicher
+        plt.close(mpl_fig)
+    return ergebnis
+
+
+def _gross(mpl_fig, dpi: float, bbox_extra_artists) -> bool:
+    """Ob ein PNG dieser Auflösung gekachelt geschrieben wird."""
+    breite, hoehe = bildgroesse(mpl_fig, dpi, bbox_extra_artists)
+    return breite * hoehe >= GEKACHELT_AB_PIXEL
+
+
+@contextmanager
+def _ohne_antialiasing(mpl_fig):
+    """Schaltet die Kantenglättung aller Artists (Linien, Flächen, Text) vorübergehend ab."""
+    artists = mpl_fig.findobj(
+        lambda a: hasattr(a, 'set_antialiased') and hasattr(a, 'get_antialiased'))
+    vorher = [a.get_antialiased() for a in artists]
+    for artist in artists:
+        artist.set_antialiased(False)
+    try:
+        yield
+    finally:
+        for artist, wert in zip(artists, vorher):
+            artist.set_antialiased(wert)
+
+
+def schreibe_dateien(bilder: dict[str, bytes], verzeichnis, dateiname_basis: str) -> list[Path]:
+    """Schreibt exportierte Bilddaten als Dateien in ein Verzeichnis.
+
+    Args:
+        bilder: Dictionary Format -> Bilddaten (z.B. von ``exportiere_zeichnung``)
+        verzeichnis: Zielverzeichnis (wird bei Bedarf angelegt)
+        dateiname_basis: Basis-Dateiname ohne Endung
+
+    Returns:
+        Liste der geschriebenen Dateipfade
+    """
+    verzeichnis = Path(verzeichnis)
+    verzeichnis.mkdir(parents=True, exist_ok=True)
+    pfade = []
+    for fmt, daten in bilder.items():
+        pfad = verzeichnis / f"{dateiname_basis}.{fmt}"
+        pfad.write_bytes(daten)
+        pfade.append(pfad)
+    return pfade
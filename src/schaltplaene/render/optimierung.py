@@ -0,0 +1,239 @@
+"""Zusammenfassen von Liniensegmenten einer fertigen Zeichnung.
+
+Jedes ``segments.Segment`` wird beim Zeichnen zu einem eigenen
+Matplotlib-Artist bzw. SVG-Pfad: Rechteckseiten, die Kontakte ober- und
+unterhalb jedes Schutzschalters und jede Verbindungsleitung der Templates.
+``optimiere_zeichnung()`` überführt alle Segmente in Zeichnungskoordinaten,
+verbindet aneinanderstoßende Linienzüge gleichen Stils zu einem Pfad und
+entfernt Segmente ohne Länge. Das beschleunigt vor allem das Rastern (PNG)
+und verkleinert SVG-Dateien großer Pläne.
+
+Zusammengefasst werden nur durchgezogene Linien ohne Füllung und Pfeil mit
+runden Enden und Ecken; für sie ist ein gemeinsamer Pfad nicht von
+einzelnen Strichen zu unterscheiden. Gestrichelte Linien (z.B. PELine)
+bleiben einzeln, da sich sonst das Strichmuster verschieben würde.
+"""
+
+from typing import NamedTuple
+
+import schemdraw
+from schemdraw import drawing_stack
+from schemdraw.elements import Element
+from schemdraw.segments import Segment, SegmentText
+from schemdraw.transform import Transform
+
+# Nachkommastellen, ab denen zwei Punkte als gleich gelten
+STELLEN = 9
+
+# Standardwerte von ``Segment.draw`` für nicht gesetzte Stil-Parameter
+_STANDARD = {'color': 'black', 'lw': 2, 'ls': '-', 'capstyle': 'round',
+             'joinstyle': 'round', 'zorder': 2}
+
+
+class Optimierung(NamedTuple):
+    """Ergebnis von ``optimiere_zeichnung()``.
+
+    Attributes:
+        vorher: Anzahl der Artists (gezeichnete Segmente) vor der Optimierung
+        nachher: Anzahl der Artists danach
+        entfernt: Davon Segmente ohne Länge, die entfallen sind
+    """
+    vorher: int
+    nachher: int
+    entfernt: int
+
+    def __str__(self) -> str:
+        return (f"{self.vorher} -> {self.nachher} Artists "
+                f"({self.entfernt} ohne Länge entfernt)")
+
+
+class _Zusammengefasst(Element):
+    """Trägerelement für die Segmente einer optimierten Zeichnung.
+
+    Die Segmente liegen bereits in Zeichnungskoordinaten und tragen ihren
+    vollständigen Stil; das Element wird daher nicht platziert.
+    """
+
+    def __init__(self, segmente: list):
+        # Nicht in eine offene ``with Drawing()``-Zeichnung übernehmen
+        pause = drawing_stack.pause
+        drawing_stack.pause = True
+        super().__init__()
+        drawing_stack.pause = pause
+        self.segments = segmente
+        self.transform = Transform(0, (0, 0))
+
+
+def _stil(segment: Segment):
+    """Stil eines zusammenfassbaren Segments, sonst None."""
+    if type(segment) is not Segment or not segment.visible:
+        return None
+    if segment.arrow or segment.fill not in (None, 'none') or segment.clip is not None:
+        return None
+    stil = {k: getattr(segment, k) or v for k, v in _STANDARD.items()}
+    if segment.zorder is not None:
+        stil['zorder'] = segment.zorder
+    if (stil['ls'] not in ('-', 'solid') or stil['capstyle'] != 'round'
+            or stil['joinstyle'] != 'round'):
+        return None
+    return tuple(stil.items())
+
+
+def _punkt(xy) -> tuple:
+    return (round(float(xy[0]), STELLEN), round(float(xy[1]), STELLEN))
+
+
+def _punkte(segment: Segment) -> list:
+    """Punkte des Linienzugs ohne direkt wiederholte Punkte."""
+    punkte = []
+    for xy in segment.path:
+        punkt = _punkt(xy)
+        if not punkte or punkte[-1] != punkt:
+            punkte.append(punkt)
+    return punkte
+
+
+def _verbinde(zuege: list) -> list:
+    """Verbindet Linienzüge mit gemeinsamen Endpunkten.
+
+    Args:
+        zuege: Punktlisten (mindestens zwei verschiedene Punkte je Zug)
+
+    Returns:
+        Liste von (Index des ersten Zugs, verbundene Punktliste)
+    """
+    # Offene Züge je Endpunkt; geschlossene Züge (z.B. Rechtecke) bleiben für
+    # sich, sie können aber als erster Zug andere aufnehmen
+    enden: dict[tuple, list[int]] = {}
+    for i, zug in enumerate(zuege):
+        if zug[0] != zug[-1]:
+            enden.setdefault(zug[0], []).append(i)
+            enden.setdefault(zug[-1], []).append(i)
+
+    verbraucht = [False] * len(zuege)
+
+    def naechster(punkt):
+        kandidaten = enden.get(punkt, ())
+        while kandidaten and verbraucht[kandidaten[-1]]:
+            kandidaten.pop()
+        if not kandidaten:
+            return None
+        i = kandidaten.pop()
+        verbraucht[i] = True
+        zug = zuege[i]
+        return zug if zug[0] == punkt else zug[::-1]
+
+    ergebnis = []
+    for i, zug in enumerate(zuege):
+        if verbraucht[i]:
+            continue
+        verbraucht[i] = True
+        pfad = list(zug)
+        # Am Ende anhängen, dann am Anfang voranstellen
+        while (weiter := naechster(pfad[-1])) is not None:
+            pfad.extend(weiter[1:])
+        while (weiter := naechster(pfad[0])) is not None:
+            pfad[:0] = weiter[::-1][:-1]
+        ergebnis.append((i, pfad))
+    return ergebnis
+
+
+def _farben(segment) -> frozenset:
+    """Sichtbare Farben eines Segments (Linie und Füllung)."""
+    farbe = getattr(segment, 'color', None) or 'black'
+    fill = getattr(segment, 'fill', None)
+    farben = {farbe}
+    if fill not in (None, 'none', False):
+        # fill=True füllt in der Linienfarbe
+        farben.add(farbe if fill is True else fill)
+    return frozenset(farben)
+
+
+def _abschnitte(teile: list, segmente: list, farbe: str) -> list:
+    """Teilt die Teile eines Stils an Segmenten anderer Farbe auf.
+
+    Liegt zwischen zwei Teilen ein andersfarbiges Segment (z.B. der grüne
+    Strich einer PELine zwischen zwei gelben), würde ein gemeinsamer Pfad
+    die Zeichenreihenfolge und damit die Überdeckung ändern.
+    """
+    abschnitte = []
+    letzter = None
+    for index, punkte in teile:
+        if letzter is None or any(
+                not isinstance(s, SegmentText) and _farben(s) != {farbe}
+                for s in segmente[letzter + 1:index]):
+            abschnitte.append([])
+        abschnitte[-1].append((index, punkte))
+        letzter = index
+    return abschnitte
+
+
+def _zusammenfassen(segmente: list) -> tuple[list, int]:
+    """Fasst Linienzüge gleichen Stils zusammen.
+
+    Ein zusammengefasster Pfad steht an der Stelle seines ersten Teils, die
+    Zeichenreihenfolge der übrigen Segmente bleibt erhalten.
+
+    Returns:
+        Neue Segmentliste und Anzahl entfernter Segmente ohne Länge
+    """
+    gruppen: dict[tuple, list[tuple[int, list]]] = {}
+    entfernt = 0
+    ersatz: dict[int, Segment | None] = {}
+    for index, segment in enumerate(segmente):
+        stil = _stil(segment)
+        if stil is None:
+            continue
+        punkte = _punkte(segment)
+        if len(punkte) < 2:
+            ersatz[index] = None
+            entfernt += 1
+            continue
+        # Matplotlib rastert achsparallele Pfade auf Pixel ausgerichtet
+        # (Snapping), gemischte Pfade nicht; beide Arten getrennt halten
+        achsparallel = all(a[0] == b[0] or a[1] == b[1] for a, b in zip(punkte, punkte[1:]))
+        gruppen.setdefault((stil, achsparallel), []).append((index, punkte))
+
+    for (stil, _), teile in gruppen.items():
+        for abschnitt in _abschnitte(teile, segmente, dict(stil)['color']):
+            for index, _ in abschnitt:
+                ersatz[index] = None
+            for erster, pfad in _verbinde([punkte for _, punkte in abschnitt]):
+                index = abschnitt[erster][0]
+                vorlage = segmente[index]
+                ersatz[index] = Segment(pfad, **{k: getattr(vorlage, k) for k in _STANDARD})
+
+    neu = []
+    for index, segment in enumerate(segmente):
+        segment = ersatz.get(index, segment)
+        if segment is not None:
+            neu.append(segment)
+    return neu, entfernt
+
+
+def optimiere_zeichnung(d: schemdraw.Drawing) -> Optimierung:
+    """Fasst die Liniensegmente einer fertig aufgebauten Zeichnung zusammen.
+
+    Die Elemente der Zeichnung werden durch ein einzelnes Element mit allen
+    Segmenten in Zeichnungskoordinaten ersetzt. Anker und Positionen der
+    ursprünglichen Elemente bleiben an den Element-Objekten erhalten; nach
+    der Optimierung sollten der Zeichnung keine weiteren Elemente mehr
+    hinzugefügt werden.
+
+    Args:
+        d: Fertig aufgebaute Schemdraw-Zeichnung (noch nicht gezeichnet)
+
+    Returns:
+        Anzahl der Artists vorher und nachher
+    """
+    # Wie Drawing.draw(): noch offene Elemente eines with-Blocks übernehmen
+    drawing_stack.push_element(None)
+
+    segmente = []
+    for element in d.elements:
+        segmente.extend(s.xform(element.transform, **element.params) for s in element.segments)
+
+    vorher = sum(1 for s in segmente if s.visible)
+    segmente, entfernt = _zusammenfassen(segmente)
+    d.elements = [_Zusammengefasst(segmente)]
+    return Optimierung(vorher, sum(1 for s in segmente if s.visible), entfernt)
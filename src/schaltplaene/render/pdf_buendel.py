@@ -0,0 +1,84 @@
+"""Sammel-PDF: viele Schaltpläne als eine mehrseitige PDF-Datei.
+
+Anträge beim Netzbetreiber werden gesammelt eingereicht. Statt für jede
+Anlage einzelne Dateien über ``speichere()`` zu schreiben, schreibt
+``exportiere_pdf_buendel()`` alle Anlagen als je eine Seite in eine PDF.
+
+Die Seiten werden nacheinander gezeichnet und sofort in die Datei
+geschrieben (``matplotlib.backends.backend_pdf.PdfPages``); es existiert
+immer nur die Figur einer Seite. Der Speicherbedarf hängt damit nicht von
+der Anzahl der Anlagen ab, die Templates dürfen auch aus einem Generator
+kommen.
+"""
+
+import time
+from typing import NamedTuple
+
+from schaltplaene.komponenten.geometrie import kurvenaufloesung
+
+from .export import KURVENSCHRITTE_PDF, METADATEN
+from .optimierung import optimiere_zeichnung
+
+
+class PdfBuendel(NamedTuple):
+    """Ergebnis von ``exportiere_pdf_buendel()``.
+
+    Attributes:
+        seiten: Anzahl geschriebener Seiten (Anlagen)
+        sekunden: Gesamtdauer in Sekunden
+    """
+    seiten: int
+    sekunden: float
+
+    @property
+    def seiten_pro_sekunde(self) -> float:
+        """Durchsatz in Seiten pro Sekunde."""
+        return self.seiten / self.sekunden if self.sekunden else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.seiten} Seiten in {self.sekunden:.1f} s "
+                f"({self.seiten_pro_sekunde:.1f} Seiten/s)")
+
+
+def exportiere_pdf_buendel(templates, ziel, optimiere: bool = False,
+                           fortschritt=None) -> PdfBuendel:
+    """Schreibt Schaltpläne als mehrseitige PDF, eine Seite je Anlage.
+
+    Args:
+        templates: Iterable von Template-Instanzen oder Tupeln
+            (Template, Titel); ohne Titel gilt der Standardtitel
+        ziel: Dateipfad oder binäres Dateiobjekt
+        optimiere: Verbundene Linien vor dem Zeichnen zusammenfassen
+            (``render.optimierung``)
+        fortschritt: Optionale Funktion, die nach jeder Seite mit dem
+            bisherigen ``PdfBuendel`` aufgerufen wird
+
+    Returns:
+        Anzahl Seiten und Dauer (``str()`` liefert den Durchsatz in Seiten/s)
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    start = time.perf_counter()
+    seiten = 0
+    with PdfPages(ziel, metadata=METADATEN["pdf"]) as pdf:
+        for eintrag in templates:
+            template, titel = eintrag if isinstance(eintrag, tuple) else (eintrag, None)
+            # Segmente entstehen erst beim Zeichnen, daher beides im Block
+            with kurvenaufloesung(KURVENSCHRITTE_PDF):
+                d = template.zeichnung(titel)
+                if optimiere:
+                    optimiere_zeichnung(d)
+                fig = d.draw(show=False)
+            mpl_fig = fig.getfig()
+            try:
+                pdf.savefig(mpl_fig, bbox_inches='tight',
+                            bbox_extra_artists=fig.ax.get_default_bbox_extra_artists(),
+                            pad_inches=0)
+            finally:
+                # Nur die Figur der aktuellen Seite im Speicher halten
+                plt.close(mpl_fig)
+            seiten += 1
+            if fortschritt is not None:
+                fortschritt(PdfBuendel(seiten, time.perf_counter() - start))
+    return PdfBuendel(seiten, time.perf_counter() - start)
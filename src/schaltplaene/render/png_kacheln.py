@@ -0,0 +1,357 @@
+"""Gekachelter PNG-Export für Großformate (A1/A0) mit begrenztem Speicherbedarf.
+
+``savefig()`` rastert die ganze Figur in einen Agg-Puffer und hält das Bild
+beim Kodieren noch einmal als Array: bei A0 mit 600 dpi sind das über 2 GB.
+Hier wird die fertig gezeichnete Figur in Kacheln über die volle Bildbreite
+gerastert (``savefig(format="rgba", bbox_inches=<Kachel>)``) und jede
+Kachel sofort in die PNG-Datei komprimiert. Im Speicher liegt immer nur eine
+Kachel mit höchstens ``KACHEL_PIXEL`` Pixeln, unabhängig von Papierformat
+und Auflösung.
+
+Agg schneidet ungefüllte Pfade vor dem Stricheln am Rand der Kachel ab:
+Strichmuster (z.B. die PELine) würden an jeder Kachelgrenze neu beginnen,
+Ecken und Linienenden knapp außerhalb der Kachel fehlen. Gefüllte Pfade
+schneidet Agg nicht zu. Bei mehr als einer Kachel erhalten Linien deshalb
+eine unsichtbare Füllung (Deckkraft unter 1/255), dann strichelt Agg jeden
+Pfad vollständig wie bei ``savefig()`` und die Kacheln ergeben Pixel für
+Pixel dasselbe Bild.
+
+Die PNG-Modi entsprechen ``render.png_palette``. Für die Palette werden die
+Kacheln zweimal gerastert: zuerst nur, um die Farben zu zählen, dann zum
+Schreiben. Die Palette ist damit dieselbe wie bei ``reduziere_png()``.
+"""
+
+import struct
+import time
+import zlib
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+from typing import NamedTuple
+
+from .png_palette import (
+    PALETTE_FARBEN,
+    farbhaeufigkeiten,
+    farbindizes,
+    palette,
+    pruefe_png_modus,
+    schwarz_weiss,
+)
+
+# Maximale Pixelzahl einer Kachel (4 Megapixel = 16 MB RGBA)
+KACHEL_PIXEL = 4_000_000
+
+# Ab dieser Pixelzahl schreibt ``exportiere_zeichnung()`` PNGs gekachelt;
+# darunter ist ein einziger Durchlauf schneller (300 dpi bleibt ungekachelt)
+GEKACHELT_AB_PIXEL = 16_000_000
+
+# zlib-Stufe der PNG-Bilddaten
+PNG_STUFE = 6
+
+# PNG-Farbtypen
+_GRAU, _RGB, _PALETTE, _RGBA = 0, 2, 3, 6
+
+
+class PngKacheln(NamedTuple):
+    """Ergebnis von ``exportiere_png_gekachelt()``.
+
+    Attributes:
+        breite: Bildbreite in Pixeln
+        hoehe: Bildhöhe in Pixeln
+        kacheln: Anzahl gerasterter Kacheln
+        sekunden: Gesamtdauer in Sekunden
+    """
+    breite: int
+    hoehe: int
+    kacheln: int
+    sekunden: float
+
+    def __str__(self) -> str:
+        return (f"{self.breite} x {self.hoehe} px in {self.kacheln} Kacheln "
+                f"({self.sekunden:.1f} s)")
+
+
+def exportiere_png_gekachelt(d, ziel, dpi: float = 300, transparent: bool = True,
+                             png_modus: str = "rgba", antialiasing: bool = True,
+                             kachel_pixel: int = KACHEL_PIXEL) -> PngKacheln:
+    """Zeichnet eine Zeichnung und schreibt sie gekachelt als PNG.
+
+    Args:
+        d: Fertig aufgebaute Schemdraw-Zeichnung (Renderer "matplotlib")
+        ziel: Dateipfad oder binäres Dateiobjekt
+        dpi: Auflösung (z.B. 600 für ein A0-Plakat)
+        transparent: Transparenter Hintergrund
+        png_modus: "rgba", "palette" oder "1bit" (siehe ``render.png_palette``)
+        antialiasing: Mit Kantenglättung rastern
+        kachel_pixel: Maximale Pixelzahl je Kachel (bestimmt den Speicherbedarf)
+
+    Returns:
+        Bildgröße, Anzahl Kacheln und Dauer
+    """
+    import matplotlib.pyplot as plt
+
+    from schaltplaene.komponenten.geometrie import kurvenaufloesung
+
+    from .export import kurvenschritte_fuer
+
+    png_modus = pruefe_png_modus(png_modus)
+    start = time.perf_counter()
+    # Segmente entstehen erst beim Zeichnen
+    with kurvenaufloesung(kurvenschritte_fuer('png', dpi)):
+        fig = d.draw(show=False)
+    mpl_fig = fig.getfig()
+    extra = fig.ax.get_default_bbox_extra_artists()
+    try:
+        if isinstance(ziel, (str, Path)):
+            with open(ziel, 'wb') as datei:
+                ergebnis = schreibe_png_gekachelt(mpl_fig, datei, dpi, transparent, png_modus,
+                                                  antialiasing, extra, kachel_pixel)
+        else:
+            ergebnis = schreibe_png_gekachelt(mpl_fig, ziel, dpi, transparent, png_modus,
+                                              antialiasing, extra, kachel_pixel)
+    finally:
+        # Figur aus pyplot abmelden, sonst bleibt sie bis Prozessende im Speicher
+        plt.close(mpl_fig)
+    return ergebnis._replace(sekunden=time.perf_counter() - start)
+
+
+def bildgroesse(mpl_fig, dpi: float, bbox_extra_artists=None) -> tuple[int, int]:
+    """Größe des PNG in Pixeln wie bei ``savefig(bbox_inches="tight", pad_inches=0)``.
+
+    Returns:
+        Tupel (Breite, Höhe)
+    """
+    ausschnitt = _ausschnitt(mpl_fig, dpi, bbox_extra_artists)
+    # Agg schneidet Nachkommastellen ab
+    return int(ausschnitt.width * dpi), int(ausschnitt.height * dpi)
+
+
+def schreibe_png_gekachelt(mpl_fig, datei, dpi: float, transparent: bool = True,
+                           png_modus: str = "rgba", antialiasing: bool = True,
+                           bbox_extra_artists=None,
+                           kachel_pixel: int = KACHEL_PIXEL) -> PngKacheln:
+    """Schreibt eine gezeichnete Matplotlib-Figur gekachelt als PNG.
+
+    Der Bildausschnitt entspricht ``savefig(bbox_inches="tight", pad_inches=0)``.
+
+    Args:
+        mpl_fig: Matplotlib-Figur (nach ``Drawing.draw()``)
+        datei: Binäres Dateiobjekt
+        dpi: Auflösung
+        transparent: Transparenter Hintergrund
+        png_modus: "rgba", "palette" oder "1bit"
+        antialiasing: Mit Kantenglättung rastern
+        bbox_extra_artists: Zusätzliche Artists für den Bildausschnitt
+        kachel_pixel: Maximale Pixelzahl je Kachel
+
+    Returns:
+        Bildgröße, Anzahl Kacheln und Dauer
+    """
+    from .export import _ohne_antialiasing
+
+    start = time.perf_counter()
+    png_modus = pruefe_png_modus(png_modus)
+    ausschnitt = _ausschnitt(mpl_fig, dpi, bbox_extra_artists)
+    breite, hoehe = int(ausschnitt.width * dpi), int(ausschnitt.height * dpi)
+    kachel_hoehe = max(1, min(hoehe, kachel_pixel // max(1, breite)))
+
+    mehrere = kachel_hoehe < hoehe
+    with _ohne_antialiasing(mpl_fig) if not antialiasing else nullcontext(), \
+            _ohne_zuschnitt(mpl_fig) if mehrere else nullcontext():
+        kacheln = partial(_kacheln, mpl_fig, ausschnitt, breite, hoehe, kachel_hoehe, dpi,
+                          transparent)
+        tabelle = None
+        if png_modus == 'palette':
+            tabelle = palette(*_haeufigkeiten(kacheln()), PALETTE_FARBEN, transparent)
+
+        schreiber = _PngSchreiber(datei, breite, hoehe, png_modus, transparent, tabelle)
+        anzahl = 0
+        for kachel in kacheln():
+            schreiber.schreibe(kachel)
+            anzahl += 1
+        schreiber.beende()
+    return PngKacheln(breite, hoehe, anzahl, time.perf_counter() - start)
+
+
+def _ausschnitt(mpl_fig, dpi: float, bbox_extra_artists=None):
+    """Bildausschnitt (Zoll) wie bei ``bbox_inches="tight"``.
+
+    Die Textmaße hängen von der Auflösung ab, daher wird wie bei
+    ``savefig()`` mit ``dpi`` gemessen; ein Renderer mit 1 x 1 Pixel genügt
+    dafür (kein Puffer in voller Größe).
+    """
+    from matplotlib.backends.backend_agg import RendererAgg
+
+    vorher = mpl_fig.dpi
+    mpl_fig.dpi = dpi
+    try:
+        return mpl_fig.get_tightbbox(RendererAgg(1, 1, dpi),
+                                     bbox_extra_artists=bbox_extra_artists)
+    finally:
+        mpl_fig.dpi = vorher
+
+
+def _kacheln(mpl_fig, ausschnitt, breite: int, hoehe: int, kachel_hoehe: int, dpi: float,
+             transparent: bool):
+    """Rastert das Bild Kachel für Kachel von oben nach unten (RGBA-Arrays)."""
+    for zeile in range(0, hoehe, kachel_hoehe):
+        yield _rastere(mpl_fig, ausschnitt, zeile, breite, min(kachel_hoehe, hoehe - zeile), dpi,
+                       transparent)
+
+
+def _rastere(mpl_fig, ausschnitt, zeile: int, breite: int, hoehe: int, dpi: float,
+             transparent: bool):
+    """Rastert ``hoehe`` Bildzeilen ab ``zeile`` (von oben) als RGBA-Array."""
+    import numpy as np
+    from matplotlib.transforms import Bbox
+
+    # Agg schneidet die Bildgröße auf ganze Pixel ab, wie bei savefig() liegt
+    # das Bild an der linken unteren Ecke des Ausschnitts an. Ein halber Pixel
+    # Zugabe sorgt für genau breite x hoehe Pixel
+    gesamt = int(ausschnitt.height * dpi)
+    kachel = Bbox.from_bounds(ausschnitt.x0, ausschnitt.y0 + (gesamt - zeile - hoehe) / dpi,
+                              (breite + 0.5) / dpi, (hoehe + 0.5) / dpi)
+    puffer = BytesIO()
+    mpl_fig.savefig(puffer, format='rgba', dpi=dpi, transparent=transparent,
+                    bbox_inches=kachel, pad_inches=0)
+    return np.frombuffer(puffer.getbuffer(), np.uint8).reshape(hoehe, breite, 4)
+
+
+def _haeufigkeiten(kacheln):
+    """Farbhäufigkeit des ganzen Bildes (siehe ``farbhaeufigkeiten()``) über alle Kacheln."""
+    import numpy as np
+
+    farben = np.zeros(0, np.uint32)
+    anzahl = np.zeros(0, np.int64)
+    for kachel in kacheln:
+        neu, neu_anzahl = farbhaeufigkeiten(kachel)
+        farben, index = np.unique(np.concatenate((farben, neu)), return_inverse=True)
+        anzahl = np.bincount(index, np.concatenate((anzahl, neu_anzahl)),
+                             len(farben)).astype(np.int64)
+    return farben, anzahl
+
+
+# Füllung, die Agg als vorhanden behandelt (kein Zuschnitt), die aber in
+# 8 Bit Deckkraft 0 ergibt. Bei Deckkraft 0 zählt der Pfad als ungefüllt
+_UNSICHTBAR = (0.0, 0.0, 0.0, 1e-6)
+
+
+@contextmanager
+def _ohne_zuschnitt(mpl_fig):
+    """Zeichnet ungefüllte Linien und Flächen vorübergehend ohne Zuschnitt.
+
+    Betrifft alle ``Line2D`` und ``Patch`` ohne eigene Deckkraft (sonst
+    überschreibt Agg die der Füllung). Pfade, die Agg vereinfachen würde (ab
+    128 Punkten), bleiben unverändert, da Agg nur zugeschnittene Pfade
+    vereinfacht.
+    """
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+
+    geaendert = []
+    for artist in mpl_fig.findobj(lambda a: isinstance(a, (Line2D, Patch))):
+        if artist.get_alpha() is None:
+            artist.draw = partial(_zeichne_ohne_zuschnitt, artist.draw)
+            geaendert.append(artist)
+    try:
+        yield
+    finally:
+        for artist in geaendert:
+            del artist.draw
+
+
+def _zeichne_ohne_zuschnitt(zeichne, renderer):
+    zeichne(_RendererOhneZuschnitt(renderer))
+
+
+class _RendererOhneZuschnitt:
+    """Renderer-Stellvertreter, der ungefüllten Pfaden ``_UNSICHTBAR`` als Füllung gibt."""
+
+    def __init__(self, renderer):
+        self._renderer = renderer
+
+    def __getattr__(self, name):
+        return getattr(self._renderer, name)
+
+    def draw_path(self, gc, path, transform, rgb_face=None):
+        if rgb_face is None and not path.should_simplify:
+            rgb_face = _UNSICHTBAR
+        self._renderer.draw_path(gc, path, transform, rgb_face)
+
+
+class _PngSchreiber:
+    """Schreibt ein PNG zeilenweise (Filter "Up", zlib-Strom in IDAT-Blöcken)."""
+
+    def __init__(self, datei, breite: int, hoehe: int, modus: str, transparent: bool,
+                 palette=None):
+        self._datei = datei
+        self._breite = breite
+        self._modus = modus
+        self._transparent = transparent
+        self._palette = palette
+        self._zlib = zlib.compressobj(PNG_STUFE)
+        self._vorige = None
+
+        if modus == '1bit':
+            farbtyp, self._bittiefe = _GRAU, 1
+        elif modus == 'palette':
+            farbtyp = _PALETTE
+            self._bittiefe = next(b for b in (1, 2, 4, 8) if len(palette) <= 1 << b)
+        else:
+            farbtyp, self._bittiefe = (_RGBA if transparent else _RGB), 8
+
+        datei.write(b"\x89PNG\r\n\x1a\n")
+        self._block(b"IHDR", struct.pack(">IIBBBBB", breite, hoehe, self._bittiefe,
+                                         farbtyp, 0, 0, 0))
+        if modus == 'palette':
+            self._block(b"PLTE", palette[:, :3].tobytes())
+            if transparent:
+                self._block(b"tRNS", palette[:, 3].tobytes())
+        elif modus == '1bit' and transparent:
+            # Weiß (Hintergrund) ist transparent
+            self._block(b"tRNS", struct.pack(">H", 1))
+
+    def schreibe(self, rgba):
+        """Komprimiert eine Kachel (RGBA-Array über die volle Breite)."""
+        import numpy as np
+        from PIL import Image
+
+        if self._modus == '1bit':
+            # Modus "1" von Pillow ist bereits wie bei PNG gepackt (MSB zuerst, 1 = Weiß)
+            bild = schwarz_weiss(Image.fromarray(rgba, "RGBA"))
+            zeilen = np.frombuffer(bild.tobytes(), np.uint8).reshape(len(rgba), -1)
+        elif self._modus == 'palette':
+            zeilen = self._packe(farbindizes(rgba, self._palette, self._transparent))
+        else:
+            zeilen = rgba.reshape(len(rgba), -1) if self._transparent else \
+                np.ascontiguousarray(rgba[..., :3]).reshape(len(rgba), -1)
+
+        vorige = zeilen[:1] * 0 if self._vorige is None else self._vorige
+        gefiltert = zeilen - np.vstack((vorige, zeilen[:-1]))  # uint8: modulo 256
+        daten = np.hstack((np.full((len(zeilen), 1), 2, np.uint8), gefiltert))
+        self._vorige = zeilen[-1:].copy()
+        komprimiert = self._zlib.compress(daten.tobytes())
+        if komprimiert:
+            self._block(b"IDAT", komprimiert)
+
+    def beende(self):
+        """Schreibt den Rest des zlib-Stroms und das Dateiende."""
+        self._block(b"IDAT", self._zlib.flush())
+        self._block(b"IEND", b"")
+
+    def _packe(self, indizes):
+        """Packt Palettenindizes mit weniger als 8 Bit je Pixel in Bytes."""
+        import numpy as np
+
+        je_byte = 8 // self._bittiefe
+        if je_byte == 1:
+            return indizes
+        rest = -indizes.shape[1] % je_byte
+        indizes = np.pad(indizes, ((0, 0), (0, rest))).reshape(len(indizes), -1, je_byte)
+        verschiebung = np.arange(8 - self._bittiefe, -1, -self._bittiefe, dtype=np.uint8)
+        return (indizes << verschiebung).sum(axis=2, dtype=np.uint8)
+
+    def _block(self, typ: bytes, daten: bytes):
+        self._datei.write(struct.pack(">I", len(daten)) + typ + daten
+                          + struct.pack(">I", zlib.crc32(typ + daten)))
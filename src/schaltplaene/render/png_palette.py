@@ -0,0 +1,189 @@
+"""Palette- und 1-Bit-PNG für schwarz-weiße Schaltpläne.
+
+Matplotlib schreibt PNGs immer als RGBA mit 8 Bit je Kanal. Die
+Schaltpläne sind aber bis auf die grün-gelbe PELine schwarz auf weiß; mit
+Antialiasing kommen nur Graustufen dazu. ``reduziere_png()`` schreibt
+solche PNGs mit Pillow neu:
+
+- ``"palette"``: Farbpalette mit höchstens ``farben`` Einträgen (bei wenigen
+  Farben 1, 2 oder 4 Bit je Pixel), Transparenz bleibt erhalten. Die
+  Palette hängt nur von der Häufigkeit der Farben ab (``palette()``), jedes
+  Pixel erhält die nächstliegende Palettenfarbe (``farbindizes()``); der
+  gekachelte Export (``render.png_kacheln``) ergibt so dasselbe Bild
+- ``"1bit"``: reines Schwarz-Weiß; schwarz wird jedes Pixel, dessen
+  dunkelster Farbkanal unter ``SCHWELLE`` liegt, also alles außer dem
+  (fast) weißen Hintergrund, auch helle farbige Linien wie die PELine; ein
+  transparenter Hintergrund bleibt transparent
+
+Zusammen mit abgeschaltetem Antialiasing (``exportiere_zeichnung(...,
+antialiasing=False)``) enthält das Bild nur noch die tatsächlich
+verwendeten Farben, die Dateien werden etwa zehnmal kleiner.
+"""
+
+from io import BytesIO
+
+# PNG-Modi: "rgba" = unverändert von Matplotlib
+PNG_MODI = ("rgba", "palette", "1bit")
+
+# Standardgröße der Palette: Schwarz, Weiß, PELine-Farben und Graustufen
+# des Antialiasing
+PALETTE_FARBEN = 16
+
+# Pixelzahl der Stichprobe, aus der Pillow bei mehr als ``farben`` Farben
+# die Palette bestimmt
+_STICHPROBE = 1 << 16
+
+# Wert des dunkelsten Farbkanals (0..255), ab dem ein Pixel im 1-Bit-Modus
+# weiß wird. Nicht die Helligkeit: Gelb (z.B. PELine) ist heller als die
+# Schwelle, hat aber einen dunklen Blaukanal.
+SCHWELLE = 128
+
+
+def pruefe_png_modus(modus: str) -> str:
+    """Prüft einen PNG-Modus.
+
+    Returns:
+        Modus in Kleinbuchstaben
+    """
+    modus = modus.lower()
+    if modus not in PNG_MODI:
+        raise ValueError(f"Unbekannter PNG-Modus {modus!r}, erlaubt: {', '.join(PNG_MODI)}")
+    return modus
+
+
+def reduziere_png(png: bytes, modus: str = "palette", farben: int = PALETTE_FARBEN) -> bytes:
+    """Schreibt ein PNG als Palette- oder 1-Bit-Bild neu (mit Pillow optimiert).
+
+    Args:
+        png: PNG-Daten (z.B. von ``exportiere_zeichnung``)
+        modus: "palette", "1bit" oder "rgba" (nur optimiert speichern)
+        farben: Maximale Anzahl Farben der Palette (2..256)
+
+    Returns:
+        PNG-Daten (bytes)
+    """
+    from PIL import Image
+
+    modus = pruefe_png_modus(modus)
+    bild = Image.open(BytesIO(png)).convert("RGBA")
+    transparent = bild.getextrema()[3][0] < 255
+    optionen = {}
+
+    if modus == "palette":
+        bild = quantisiere(bild, farben, transparent)
+    elif modus == "1bit":
+        bild = schwarz_weiss(bild)
+        if transparent:
+            # Weiß (Hintergrund) als transparent kennzeichnen
+            optionen["transparency"] = 255
+
+    puffer = BytesIO()
+    bild.save(puffer, format="PNG", optimize=True, **optionen)
+    return puffer.getvalue()
+
+
+def quantisiere(bild, farben: int = PALETTE_FARBEN, transparent: bool = True):
+    """Wandelt ein RGBA-Bild (Pillow) in ein Palettenbild ohne Dithering.
+
+    Enthält das Bild weniger als ``farben`` Farben, wird die Palette
+    entsprechend kleiner. Ohne ``transparent`` entfällt der Alphakanal.
+    """
+    import numpy as np
+    from PIL import Image
+
+    rgba = np.asarray(bild.convert("RGBA"))
+    tabelle = palette(*farbhaeufigkeiten(rgba), farben, transparent)
+    ergebnis = Image.fromarray(farbindizes(rgba, tabelle, transparent), "P")
+    if transparent:
+        ergebnis.putpalette(tabelle.tobytes(), "RGBA")
+    else:
+        # Ohne Alphakanal entfällt der tRNS-Block der Palette
+        ergebnis.putpalette(tabelle[:, :3].tobytes(), "RGB")
+    return ergebnis
+
+
+def farbhaeufigkeiten(rgba):
+    """Verschiedene Farben eines RGBA-Arrays (Höhe x Breite x 4) mit ihrer Pixelzahl.
+
+    Returns:
+        Tupel (Farben als ``uint32`` je RGBA-Pixel, Anzahl der Pixel je Farbe)
+    """
+    import numpy as np
+
+    return np.unique(np.ascontiguousarray(rgba).view(np.uint32).ravel(), return_counts=True)
+
+
+def palette(farben, anzahl, max_farben: int = PALETTE_FARBEN, transparent: bool = True):
+    """Bestimmt die Palette aus der Farbhäufigkeit eines Bildes.
+
+    Bei höchstens ``max_farben`` Farben sind das genau diese (häufigste
+    zuerst). Sonst wählt Pillows Octree-Verfahren aus einer Stichprobe, in
+    der jede Farbe ihrer Häufigkeit entsprechend oft vorkommt.
+
+    Args:
+        farben: Farben als ``uint32`` (siehe ``farbhaeufigkeiten()``)
+        anzahl: Pixelzahl je Farbe
+        max_farben: Maximale Anzahl Farben (2..256)
+        transparent: Alphakanal berücksichtigen
+
+    Returns:
+        RGBA-Array (``uint8``, eine Zeile je Farbe)
+    """
+    import numpy as np
+    from PIL import Image
+
+    max_farben = max(2, min(256, max_farben))
+    rgba = np.asarray(farben, np.uint32).view(np.uint8).reshape(-1, 4)
+    if len(rgba) <= max_farben:
+        return rgba[np.argsort(-np.asarray(anzahl), kind="stable")]
+
+    wiederholungen = np.maximum(1, np.rint(anzahl * (_STICHPROBE / np.sum(anzahl))))
+    stichprobe = np.repeat(rgba, wiederholungen.astype(np.intp), axis=0)
+    modus = "RGBA" if transparent else "RGB"
+    bild = Image.fromarray(np.ascontiguousarray(stichprobe[None, :, :len(modus)]), modus)
+    bild = bild.quantize(max_farben, method=Image.Quantize.FASTOCTREE,
+                         dither=Image.Dither.NONE)
+    tabelle = np.array(bild.getpalette(modus), np.uint8).reshape(-1, len(modus))
+    tabelle = tabelle[:bild.getextrema()[1] + 1]
+    if not transparent:
+        tabelle = np.hstack((tabelle, np.full((len(tabelle), 1), 255, np.uint8)))
+    return tabelle
+
+
+def farbindizes(rgba, tabelle, transparent: bool = True):
+    """Index der nächstliegenden Palettenfarbe je Pixel.
+
+    Args:
+        rgba: RGBA-Array (Höhe x Breite x 4)
+        tabelle: Palette (siehe ``palette()``)
+        transparent: Alphakanal beim Abstand berücksichtigen
+
+    Returns:
+        ``uint8``-Array (Höhe x Breite)
+    """
+    import numpy as np
+
+    # Abstände nur für die wenigen verschiedenen Farben berechnen
+    farben, index = np.unique(np.ascontiguousarray(rgba).view(np.uint32).ravel(),
+                              return_inverse=True)
+    farben = farben.view(np.uint8).reshape(-1, 4).astype(np.int32)
+    tabelle = tabelle.astype(np.int32)
+    if not transparent:
+        farben, tabelle = farben[:, :3], tabelle[:, :3]
+    abstand = ((farben[:, None, :] - tabelle[None, :, :]) ** 2).sum(axis=2)
+    return abstand.argmin(axis=1).astype(np.uint8)[index].reshape(rgba.shape[:2])
+
+
+def schwarz_weiss(bild):
+    """Wandelt ein RGBA-Bild (Pillow) über weißem Hintergrund in Schwarz-Weiß (Modus "1").
+
+    Maßgeblich ist der dunkelste Farbkanal je Pixel, damit jede gezeichnete
+    Farbe schwarz wird und nur der Hintergrund weiß bleibt.
+    """
+    from PIL import Image, ImageChops
+
+    hintergrund = Image.new("RGBA", bild.size, "white")
+    hintergrund.alpha_composite(bild)
+    rot, gruen, blau, _ = hintergrund.split()
+    dunkelster = ImageChops.darker(ImageChops.darker(rot, gruen), blau)
+    return dunkelster.point(lambda v: 255 if v >= SCHWELLE else 0, "1")
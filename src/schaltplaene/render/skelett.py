@@ -0,0 +1,345 @@
+"""Vorkompilierte Layout-Skelette für die Schaltplan-Templates.
+
+Die Templates platzieren immer dieselben Komponenten an denselben
+Koordinaten; nur die Beschriftungen hängen von den Parametern ab. Ein
+Skelett wird einmal pro Template (und Parameter-Struktur) mit dem
+SVG-Backend gezeichnet, wobei jeder Parameter durch einen Platzhalter
+ersetzt wird. Beim Rendern werden nur noch die Texte eingesetzt und die
+Bildgröße (viewBox) aus der festen Geometrie und den geschätzten
+Textbreiten neu berechnet. Das Ergebnis ist byte-identisch zum SVG des
+vollständigen ``renderer="svg"``-Durchlaufs mit ``symbole=True`` und
+``kompakt=True``: gleiche Komponenten stehen nur einmal als ``<symbol>``
+im Skelett (siehe ``render.svg_symbole``), das Skelett wird einmal beim
+Kompilieren verkleinert (siehe ``render.svg_kompakt``).
+
+Die Struktur eines Parameters ist seine Art (Zahl, Text) bzw. bei leeren
+Werten der Wert selbst: leere Werte entfernen Beschriftungen und
+verschieben nachfolgende Texte, sie ergeben daher ein eigenes Skelett.
+"""
+
+import copy
+import math
+import re
+from functools import lru_cache
+
+from schemdraw.segments import SegmentText
+from schemdraw.types import BBox
+
+from .svg_kompakt import kompaktiere_svg, zahl
+from .svg_symbole import svg_mit_symbolen
+
+# Marker für Platzhalter: Zeichen aus dem Private-Use-Bereich, die in
+# regulären Beschriftungen nicht vorkommen
+_ANFANG = "\ue000"
+_ENDE = "\ue001"
+_PLATZHALTER = re.compile(f"{_ANFANG}(\\w+){_ENDE}")
+
+# Feld für den Titel (kein Konstruktor-Parameter)
+TITEL = "titel"
+
+# Platzhalter für die Bildgröße im <svg>-Kopf
+_KOPF = "__kopf__"
+_KOPF_ATTRIBUTE = re.compile(r'height="[^"]*" width="[^"]*" viewBox="[^"]*"')
+
+# Zeichen, die Schemdraw beim Zeichnen umwandelt (Mathtext, XML, Zeilenumbrüche).
+# Texte mit diesen Zeichen können nicht direkt eingesetzt werden.
+_SONDERZEICHEN = frozenset("$<>&\n\r")
+
+
+def _marker(name: str) -> str:
+    return f"{_ANFANG}{name}{_ENDE}"
+
+
+class _Zahlplatzhalter(float):
+    """Zahl, die sich bei der Formatierung als Platzhalter-Marker ausgibt.
+
+    Komponenten unterscheiden teilweise zwischen Zahlen und Texten
+    (z.B. PVModul: ``10.0`` -> "10.0Wp", ``"10kWp"`` bleibt unverändert).
+    """
+
+    def __new__(cls, name: str):
+        zahl = super().__new__(cls, 1.0)
+        zahl.name = name
+        return zahl
+
+    def __format__(self, spec: str) -> str:
+        return _marker(self.name)
+
+    __str__ = __format__
+
+
+def parameter_art(wert):
+    """Art eines Parameterwerts für die Auswahl des Skeletts.
+
+    Returns:
+        "zahl" oder "text" für nicht-leere Werte, sonst ``repr(wert)``
+    """
+    if not wert or isinstance(wert, bool):
+        return repr(wert)
+    if isinstance(wert, (int, float)):
+        return "zahl"
+    return "text"
+
+
+def _platzhalter(name: str, art: str, wert):
+    if art == "zahl":
+        return _Zahlplatzhalter(name)
+    if art == "text":
+        return _marker(name)
+    return wert
+
+
+class Skelett:
+    """Einmal gezeichnetes Template mit Platzhaltern für alle Beschriftungen.
+
+    Args:
+        teile: SVG-Text, abwechselnd fester Text und Feldname
+        feste_bbox: Bounding-Box aller festen Segmente (Zeichnungseinheiten)
+        text_segmente: (transformiertes SegmentText, Text mit Platzhaltern)
+        rand: Rand der SVG-Figur in Zeichnungseinheiten
+        skalierung: Punkte pro Zeichnungseinheit
+    """
+
+    def __init__(self, teile: list[str], feste_bbox: BBox,
+                 text_segmente: list[tuple[SegmentText, str]],
+                 rand: float, skalierung: float):
+        self.teile = teile
+        self.feste_bbox = feste_bbox
+        self.text_segmente = text_segmente
+        self.rand = rand
+        self.skalierung = skalierung
+        # Die Textbreiten-Schätzung ist der teuerste Schritt beim Füllen;
+        # wiederkehrende Beschriftungen werden nur einmal vermessen
+        self._text_bbox = lru_cache(maxsize=1024)(self._berechne_text_bbox)
+        # Positionen der Felder in ``teile`` für das gezielte Aktualisieren
+        self._indizes: dict[str, list[int]] = {}
+        for i in range(1, len(teile), 2):
+            self._indizes.setdefault(teile[i], []).append(i)
+
+    @property
+    def felder(self) -> set[str]:
+        """Namen aller Felder, die im SVG vorkommen."""
+        return set(self.teile[1::2]) - {_KOPF}
+
+    @staticmethod
+    def _setze_ein(vorlage: str, texte: dict[str, str]) -> str:
+        return _PLATZHALTER.sub(lambda m: texte[m.group(1)], vorlage)
+
+    def _berechne_text_bbox(self, index: int, text: str) -> BBox:
+        segment = copy.copy(self.text_segmente[index][0])
+        segment.text = text
+        return segment.get_bbox()
+
+    def _kopf(self, texte: dict[str, str]) -> str:
+        """Berechnet die Größenattribute wie ``schemdraw.backends.svg.Figure``.
+
+        Die Zahlen werden wie von ``kompaktiere_svg()`` gerundet.
+        """
+        xmin, ymin, xmax, ymax = self.feste_bbox
+        for index, (_, vorlage) in enumerate(self.text_segmente):
+            text = self._setze_ein(vorlage, texte)
+            sxmin, symin, sxmax, symax = self._text_bbox(index, text)
+            xmin = min(xmin, sxmin)
+            ymin = min(ymin, symin)
+            xmax = max(xmax, sxmax)
+            ymax = max(ymax, symax)
+
+        xmin -= self.rand
+        ymin -= self.rand
+        xmax += self.rand
+        ymax += self.rand
+        breite = max(5, (xmax - xmin) * self.skalierung)
+        hoehe = max(5, (ymax - ymin) * self.skalierung)
+        x0 = xmin * self.skalierung
+        y0 = -ymax * self.skalierung
+        hoehe, breite, x0, y0 = (zahl(w) for w in (hoehe, breite, x0, y0))
+        return f'height="{hoehe}pt" width="{breite}pt" viewBox="{x0} {y0} {breite} {hoehe}"'
+
+    def fuelle(self, texte: dict[str, str]) -> list[str]:
+        """Setzt die Beschriftungen ein.
+
+        Args:
+            texte: Feldname -> fertig formatierter Text (wie ``f"{wert}"``)
+
+        Returns:
+            Gefüllte Teile des SVG-Texts (für ``patche()`` aufheben)
+        """
+        teile = list(self.teile)
+        for i in range(1, len(teile), 2):
+            feld = teile[i]
+            teile[i] = self._kopf(texte) if feld == _KOPF else texte[feld]
+        return teile
+
+    def patche(self, teile: list[str], texte: dict[str, str], felder) -> list[str]:
+        """Ersetzt nur die Texte der angegebenen Felder in gefüllten Teilen.
+
+        Args:
+            teile: Ergebnis von ``fuelle()`` bzw. eines früheren ``patche()``
+            texte: Alle Feldtexte nach der Änderung
+            felder: Namen der geänderten Felder
+
+        Returns:
+            Neue Liste der Teile; ``teile`` bleibt unverändert
+        """
+        teile = list(teile)
+        for feld in felder:
+            for i in self._indizes.get(feld, ()):
+                teile[i] = texte[feld]
+        # Die Breite der Texte bestimmt die Bildgröße
+        for i in self._indizes.get(_KOPF, ()):
+            teile[i] = self._kopf(texte)
+        return teile
+
+
+def einsetzbar(text: str) -> bool:
+    """Prüft, ob ein Text ohne erneutes Zeichnen eingesetzt werden kann."""
+    return not _SONDERZEICHEN.intersection(text)
+
+
+@lru_cache(maxsize=64)
+def kompiliere(template_klasse, struktur: tuple) -> Skelett:
+    """Zeichnet ein Template einmal mit Platzhaltern und zerlegt das SVG.
+
+    Args:
+        template_klasse: Von TemplateBasis abgeleitete Klasse
+        struktur: Tupel (Feldname, Art, Wert) je Parameter, siehe ``parameter_art``;
+            der Wert wird nur für leere Parameter verwendet
+
+    Returns:
+        Skelett des Templates
+    """
+    werte = {name: _platzhalter(name, art, wert) for name, art, wert in struktur}
+    titel = werte.pop(TITEL)
+    d = template_klasse(**werte).zeichnung(titel, renderer="svg")
+    fig = svg_mit_symbolen(d).figur
+
+    # Geometrie aufteilen: feste Segmente vs. Texte mit Platzhaltern
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
+    text_segmente = []
+    for element in d.elements:
+        for segment in element.segments:
+            segment = segment.xform(element.transform)
+            if isinstance(segment, SegmentText) and _PLATZHALTER.search(segment.text):
+                text_segmente.append((segment, segment.text))
+                continue
+            sxmin, symin, sxmax, symax = segment.get_bbox()
+            xmin = min(xmin, sxmin)
+            ymin = min(ymin, symin)
+            xmax = max(xmax, sxmax)
+            ymax = max(ymax, symax)
+
+    svg = kompaktiere_svg(fig.getimage("svg")).svg.decode("utf-8")
+    svg = _KOPF_ATTRIBUTE.sub(_marker(_KOPF), svg, count=1)
+    return Skelett(
+        teile=_PLATZHALTER.split(svg),
+        feste_bbox=BBox(xmin, ymin, xmax, ymax),
+        text_segmente=text_segmente,
+        rand=fig.margin,
+        skalierung=fig.scale,
+    )
+
+
+def _texte(werte: dict) -> dict[str, str]:
+    return {name: f"{wert}" for name, wert in werte.items()}
+
+
+def _struktur(werte: dict) -> tuple:
+    struktur = []
+    for name, wert in werte.items():
+        art = parameter_art(wert)
+        # Nur leere Werte gehen selbst in das Skelett ein
+        struktur.append((name, art, None if art in ("zahl", "text") else wert))
+    return tuple(struktur)
+
+
+class SvgRender:
+    """SVG eines Templates zusammen mit den Werten, aus denen es entstand.
+
+    Ändern sich nur Beschriftungen, setzt ``aktualisiere()`` die neuen Texte
+    direkt in die betroffenen ``<text>``-Knoten ein. Nur wenn sich die
+    Geometrie ändert (leere Werte, Wechsel zwischen Zahl und Text) oder ein
+    Text Sonderzeichen enthält, wird neu gezeichnet.
+
+    Bei Renders über ein Skelett werden die SVG-Daten erst beim Zugriff auf
+    ``svg`` zusammengesetzt; das Objekt selbst hält nur Verweise auf die
+    gemeinsamen Teile des Skeletts und die eingesetzten Texte. Beim
+    vollständigen Rendern hält es dagegen das ganze SVG; in langlebigen
+    Zuständen (z.B. Streamlit-Sitzungen) daher nur Cache-Schlüssel und Werte
+    ablegen und bei Bedarf neu erzeugen (siehe ``render.app_cache``).
+
+    Args:
+        template_klasse: Von TemplateBasis abgeleitete Klasse
+        werte: Parameter des Templates einschließlich ``titel``
+        svg: SVG-Daten (nur bei vollständigem Rendern ohne Skelett)
+        skelett: Verwendetes Skelett (None bei vollständigem Rendern)
+        teile: Gefüllte Teile des Skeletts
+    """
+
+    def __init__(self, template_klasse, werte: dict, svg: bytes = None,
+                 skelett: Skelett = None, teile: list[str] = None):
+        self.template_klasse = template_klasse
+        self.werte = werte
+        self._svg = svg
+        self.skelett = skelett
+        self.teile = teile
+
+    @property
+    def svg(self) -> bytes:
+        """SVG-Daten (bytes)."""
+        if self._svg is not None:
+            return self._svg
+        return "".join(self.teile).encode("utf-8")
+
+    @classmethod
+    def erzeuge(cls, template_klasse, werte: dict) -> "SvgRender":
+        """Rendert das Template über sein Skelett oder, falls nötig, vollständig.
+
+        Args:
+            template_klasse: Von TemplateBasis abgeleitete Klasse
+            werte: Parameter des Templates einschließlich ``titel``
+        """
+        texte = _texte(werte)
+        if not all(einsetzbar(text) for text in texte.values()):
+            parameter = dict(werte)
+            titel = parameter.pop(TITEL)
+            svg = template_klasse(**parameter).exportiere(("svg",), titel=titel, renderer="svg",
+                                                          symbole=True, kompakt=True)["svg"]
+            return cls(template_klasse, werte, svg)
+
+        skelett = kompiliere(template_klasse, _struktur(werte))
+        return cls(template_klasse, werte, skelett=skelett, teile=skelett.fuelle(texte))
+
+    def aktualisiere(self, **aenderungen) -> "SvgRender":
+        """Liefert das SVG für geänderte Parameter.
+
+        Args:
+            **aenderungen: Geänderte Parameter (auch ``titel``); unveränderte
+                Werte dürfen mit übergeben werden
+
+        Returns:
+            Neuer SvgRender (oder ``self``, wenn sich nichts geändert hat)
+        """
+        unbekannt = aenderungen.keys() - self.werte.keys()
+        if unbekannt:
+            raise ValueError(f"Unbekannte Parameter: {', '.join(sorted(unbekannt))}")
+
+        geaendert = {
+            name: wert for name, wert in aenderungen.items()
+            if f"{wert}" != f"{self.werte[name]}"
+            or parameter_art(wert) != parameter_art(self.werte[name])
+        }
+        if not geaendert:
+            return self
+
+        werte = {**self.werte, **geaendert}
+        geometrie_geaendert = any(
+            parameter_art(wert) != parameter_art(self.werte[name])
+            for name, wert in geaendert.items()
+        )
+        if (self.skelett is None or geometrie_geaendert
+                or not all(einsetzbar(f"{wert}") for wert in geaendert.values())):
+            return SvgRender.erzeuge(self.template_klasse, werte)
+
+        teile = self.skelett.patche(self.teile, _texte(werte), geaendert)
+        return SvgRender(self.template_klasse, werte, skelett=self.skelett, teile=teile)
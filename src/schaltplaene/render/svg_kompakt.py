@@ -0,0 +1,526 @@
+"""Verkleinern fertiger SVG-Daten (Nachbearbeitung).
+
+Die SVG-Daten beider Renderer werden unverändert in die Streamlit-Seite
+(``components.html``) eingebettet und archiviert. Koordinaten tragen dabei
+bis zu 17 Nachkommastellen (``111.60000000000001``), jeder Pfad wird mit
+absoluten Koordinaten und vollständigem ``style`` ausgeschrieben, das
+Matplotlib-SVG enthält zusätzlich Einrückung, Metadaten und eine eigene
+Gruppe je Artist.
+
+``kompaktiere_svg()`` schreibt die SVG-Daten neu:
+
+- Zahlen mit fester Anzahl Nachkommastellen (``stellen``), ohne
+  überflüssige Nullen
+- Pfade mit relativen Befehlen, wo diese kürzer sind, waagrechte und
+  senkrechte Linien als ``H``/``V``, wiederholte Befehle ohne Buchstaben
+- Gleiche vererbbare Stil-Angaben aufeinanderfolgender Elemente einmal in
+  einer gemeinsamen Gruppe (``<g>``)
+- Ohne ``<metadata>``, Kommentare, Einrückung, nicht referenzierte IDs und
+  leere Gruppen
+
+Die Abweichung der Geometrie ist höchstens eine halbe Einheit der letzten
+Stelle (Standard: 0,005 pt), das Bild bleibt damit unverändert.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from typing import NamedTuple
+
+# Standard-Nachkommastellen für Koordinaten (in Punkten)
+STELLEN = 2
+
+# Zusätzliche Stellen für Skalierung/Drehung in Transformationen; deren
+# Rundungsfehler wächst mit den Koordinaten
+_STELLEN_LINEAR = 4
+
+# Zusätzliche Stelle für Verschiebungen: sie bewegen ganze Gruppen (Texte,
+# Symbole), deren Glyphen Renderer teils am Pixelraster ausgerichtet rastern
+_STELLEN_VERSCHIEBUNG = 1
+
+_SVG = "http://www.w3.org/2000/svg"
+_XLINK = "http://www.w3.org/1999/xlink"
+_XML = "http://www.w3.org/XML/1998/namespace"
+_PRAEFIXE = {_SVG: "", _XLINK: "xlink", _XML: "xml"}
+
+# Attribute mit Zahlenwerten (Längen, Koordinaten)
+_ZAHL_ATTRIBUTE = frozenset({
+    "x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx", "ry", "dx", "dy",
+    "width", "height", "viewBox", "points", "font-size", "stroke-width",
+    "stroke-dasharray", "stroke-dashoffset",
+})
+
+# Stil-Eigenschaften, die an Kindelemente vererbt werden (SVG 1.1/CSS)
+_VERERBT = frozenset({
+    "fill", "fill-opacity", "fill-rule", "stroke", "stroke-width", "stroke-opacity",
+    "stroke-linecap", "stroke-linejoin", "stroke-miterlimit", "stroke-dasharray",
+    "stroke-dashoffset", "font-family", "font-size", "font-style", "font-weight",
+    "text-anchor", "color", "paint-order",
+})
+
+# Elemente, deren Kinder in gemeinsame Gruppen zusammengefasst werden dürfen,
+# und Elemente, die dabei verschoben werden dürfen
+_GRUPPIERBAR = frozenset({"svg", "g", "symbol", "a"})
+_GRAFIK = frozenset({"path", "circle", "ellipse", "rect", "line", "polyline", "polygon",
+                     "text", "use", "g"})
+
+_ZAHL = re.compile(r"(?<![#\w.])[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_PFAD_TOKEN = re.compile(r"[MmZzLlHhVvCcSsQqTtAa]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_TRANSFORMATION = re.compile(r"(\w+)\s*\(([^)]*)\)")
+_VERWEIS = re.compile(r"url\(\s*#([^)\s]+)\s*\)")
+_STERN_REGEL = re.compile(r"\*\s*\{([^}]*)\}")
+_CSS_LEER = re.compile(r"\s*([{};:,])\s*")
+
+# Anzahl Parameter je Pfadbefehl
+_PARAMETER = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7, "Z": 0}
+
+
+class SvgKompakt(NamedTuple):
+    """Ergebnis von ``kompaktiere_svg()``.
+
+    Attributes:
+        svg: Verkleinerte SVG-Daten (bytes)
+        vorher: Größe vorher in Bytes
+        nachher: Größe nachher in Bytes
+    """
+    svg: bytes
+    vorher: int
+    nachher: int
+
+    @property
+    def ersparnis(self) -> float:
+        """Eingesparter Anteil der Dateigröße (0..1)."""
+        return 1 - self.nachher / self.vorher if self.vorher else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.vorher} -> {self.nachher} Bytes (-{self.ersparnis:.0%})"
+
+
+def zahl(wert: float, stellen: int = STELLEN) -> str:
+    """Kürzeste Schreibweise einer Zahl mit höchstens ``stellen`` Nachkommastellen.
+
+    Beispiel: ``111.60000000000001`` -> ``"111.6"``, ``0.5`` -> ``".5"``,
+    ``-0.001`` -> ``"0"``.
+    """
+    text = f"{round(wert, stellen):.{stellen}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    if text in ("-0", ""):
+        return "0"
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def _zahlen(text: str, stellen: int) -> str:
+    """Rundet alle Zahlen in einem Attributwert (Einheiten bleiben erhalten)."""
+    return _ZAHL.sub(lambda m: zahl(float(m.group()), stellen), text)
+
+
+def _verkette(teile: list[str]) -> str:
+    """Verbindet Befehle und Zahlen eines Pfads mit möglichst wenigen Trennzeichen."""
+    text = []
+    letzte = ""
+    for teil in teile:
+        if letzte and not letzte[-1].isalpha() and not teil[0].isalpha():
+            # Vorzeichen und zweiter Dezimalpunkt trennen Zahlen von selbst
+            if not (teil[0] == "-" or (teil[0] == "." and "." in letzte)):
+                text.append(" ")
+        text.append(teil)
+        letzte = teil
+    return "".join(text)
+
+
+def _laenge(kandidat: tuple[str, list[str]]) -> int:
+    return len(_verkette([kandidat[0], *kandidat[1]]))
+
+
+def _pfad_absolut(d: str) -> list[tuple[str, list[float]]]:
+    """Zerlegt Pfaddaten in Befehle mit absoluten Koordinaten.
+
+    ``H``/``V`` werden zu ``L``; ``S``/``T`` bleiben erhalten (die
+    Spiegelung der Kontrollpunkte hängt nur vom Befehlstyp ab).
+    """
+    befehle = []
+    x = y = start_x = start_y = 0.0
+    befehl = None
+    tokens = _PFAD_TOKEN.findall(d)
+    i = 0
+    while i < len(tokens):
+        if tokens[i].isalpha():
+            befehl = tokens[i]
+            i += 1
+        elif befehl is None:
+            raise ValueError(f"Ungültige Pfaddaten: {d[:40]!r}")
+        gross = befehl.upper()
+        relativ = befehl != gross
+        if gross == "Z":
+            befehle.append(("Z", []))
+            x, y = start_x, start_y
+            # Nach Z muss ein neuer Befehl folgen
+            befehl = None
+            continue
+        anzahl = _PARAMETER[gross]
+        werte = [float(t) for t in tokens[i:i + anzahl]]
+        i += anzahl
+        if len(werte) < anzahl:
+            raise ValueError(f"Unvollständige Pfaddaten: {d[:40]!r}")
+
+        if gross == "H":
+            gross, werte = "L", [werte[0] + x if relativ else werte[0], y]
+        elif gross == "V":
+            gross, werte = "L", [x, werte[0] + y if relativ else werte[0]]
+        elif relativ:
+            if gross == "A":
+                werte[5] += x
+                werte[6] += y
+            else:
+                werte = [w + (x if k % 2 == 0 else y) for k, w in enumerate(werte)]
+        befehle.append((gross, werte))
+        x, y = werte[-2], werte[-1]
+        if gross == "M":
+            start_x, start_y = x, y
+            # Weitere Koordinatenpaare nach M sind Linien
+            befehl = "l" if relativ else "L"
+    return befehle
+
+
+def _pfad_kompakt(d: str, stellen: int, relativ: bool) -> str:
+    """Schreibt Pfaddaten gerundet und mit den jeweils kürzeren Befehlen neu."""
+    teile = []
+    vorheriger = None
+    x = y = start_x = start_y = 0.0
+
+    def runde(w):
+        return round(w, stellen)
+
+    for befehl, werte in _pfad_absolut(d):
+        if befehl == "Z":
+            kandidaten = [("z", [])]
+            x, y = start_x, start_y
+        else:
+            if befehl == "A":
+                absolut = ([runde(w) for w in werte[:3]] + [int(w != 0) for w in werte[3:5]]
+                           + [runde(werte[5]), runde(werte[6])])
+                relative = absolut[:5] + [runde(absolut[5] - x), runde(absolut[6] - y)]
+                zahlen = [zahl(w, stellen) for w in absolut[:3]] + [str(w) for w in absolut[3:5]]
+                kandidaten = [("A", zahlen + [zahl(w, stellen) for w in absolut[5:]]),
+                              ("a", zahlen + [zahl(w, stellen) for w in relative[5:]])]
+            else:
+                absolut = [runde(w) for w in werte]
+                relative = [runde(w - (x if k % 2 == 0 else y)) for k, w in enumerate(absolut)]
+                kandidaten = [(befehl, absolut), (befehl.lower(), relative)]
+                if befehl == "L" and absolut[1] == y:
+                    kandidaten = [("H", absolut[:1]), ("h", relative[:1])]
+                elif befehl == "L" and absolut[0] == x:
+                    kandidaten = [("V", absolut[1:]), ("v", relative[1:])]
+                kandidaten = [(b, [zahl(w, stellen) for w in z]) for b, z in kandidaten]
+            if not relativ:
+                kandidaten = kandidaten[:1]
+            x, y = absolut[-2], absolut[-1]
+            if befehl == "M":
+                start_x, start_y = x, y
+        buchstabe, zahlen = min(kandidaten, key=_laenge)
+        # Wiederholte Befehle (und L/l direkt nach M/m) ohne Buchstaben
+        implizit = {"M": "L", "m": "l"}.get(vorheriger, vorheriger)
+        if buchstabe != implizit or buchstabe in "zZ" or not zahlen:
+            teile.append(buchstabe)
+        teile.extend(zahlen)
+        vorheriger = buchstabe
+    return _verkette(teile)
+
+
+def _transformation_kompakt(text: str, stellen: int) -> str:
+    """Rundet Transformationen; Verschiebungsmatrizen werden zu ``translate``."""
+    verschiebung = stellen + _STELLEN_VERSCHIEBUNG
+    ergebnis = []
+    for name, argumente in _TRANSFORMATION.findall(text):
+        werte = [float(w) for w in re.split(r"[\s,]+", argumente.strip()) if w]
+        if name == "matrix" and len(werte) == 6:
+            linear = [round(w, stellen + _STELLEN_LINEAR) for w in werte[:4]]
+            if linear == [1, 0, 0, 1]:
+                name, werte = "translate", werte[4:]
+                texte = [zahl(w, verschiebung) for w in werte]
+            else:
+                texte = ([zahl(w, stellen + _STELLEN_LINEAR) for w in werte[:4]]
+                         + [zahl(w, verschiebung) for w in werte[4:]])
+        elif name == "scale":
+            texte = [zahl(w, stellen + _STELLEN_LINEAR) for w in werte]
+        elif name == "translate":
+            texte = [zahl(w, verschiebung) for w in werte]
+        else:
+            texte = [zahl(w, stellen) for w in werte]
+        if name == "translate" and len(texte) == 2 and texte[1] == "0":
+            texte = texte[:1]
+        ergebnis.append(f"{name}({' '.join(texte)})")
+    return " ".join(ergebnis)
+
+
+def _lokaler_name(tag) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _stil_lesen(text: str) -> dict[str, str]:
+    stil = {}
+    for deklaration in text.split(";"):
+        name, _, wert = deklaration.partition(":")
+        name, wert = name.strip(), wert.strip()
+        if name and wert:
+            stil[name] = wert
+    return stil
+
+
+def _stil_wert(name: str, wert: str, stellen: int) -> str | None:
+    """Normalisierter Wert einer Stil-Angabe, None für wirkungslose Angaben."""
+    if name == "stroke-dasharray" and wert in ("-", "solid"):
+        # Ungültiger Wert aus dem Schemdraw-SVG-Backend, wird ignoriert
+        return None
+    if name in _ZAHL_ATTRIBUTE:
+        wert = _zahlen(wert, stellen)
+    if re.fullmatch(r"#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3", wert):
+        wert = "#" + wert[1] + wert[3] + wert[5]
+    return wert
+
+
+def _stil_schreiben(stil: dict[str, str]) -> str:
+    return ";".join(f"{name}:{wert}" for name, wert in stil.items())
+
+
+class _Kompaktierer:
+    """Ein Durchlauf von ``kompaktiere_svg()`` über einen Elementbaum."""
+
+    def __init__(self, wurzel: ET.Element, stellen: int, relativ: bool, stile: bool):
+        self.wurzel = wurzel
+        self.stellen = stellen
+        self.relativ = relativ
+        self.verweise = self._verweise()
+        # Eigenschaften aus CSS-Regeln ``*{...}`` (Matplotlib) überdecken
+        # vererbte Werte; sie bleiben am Element
+        self.feste = set()
+        self.stile = stile
+        for style in wurzel.iter(f"{{{_SVG}}}style"):
+            css = style.text or ""
+            regeln = _STERN_REGEL.findall(css)
+            if _STERN_REGEL.sub("", css).strip():
+                # Andere Selektoren: Zusammenfassen nicht sicher möglich
+                self.stile = False
+            for regel in regeln:
+                self.feste.update(_stil_lesen(regel))
+
+    def _verweise(self) -> set[str]:
+        """IDs, auf die im Dokument verwiesen wird (``href``, ``url(#...)``)."""
+        verweise = set()
+        for element in self.wurzel.iter():
+            for wert in element.attrib.values():
+                verweise.update(_VERWEIS.findall(wert))
+            for name in ("href", f"{{{_XLINK}}}href"):
+                wert = element.get(name, "")
+                if wert.startswith("#"):
+                    verweise.add(wert[1:])
+        return verweise
+
+    def bearbeite(self, element: ET.Element, in_text: bool = False):
+        name = _lokaler_name(element.tag)
+        in_text = in_text or name == "text"
+
+        if name == "style" and element.text:
+            element.text = _CSS_LEER.sub(r"\1", element.text.strip())
+        self._attribute(element, name, element is self.wurzel)
+
+        kinder = []
+        for kind in element:
+            kind_name = _lokaler_name(kind.tag)
+            # Metadaten und Kommentare entfallen (Text dahinter bleibt)
+            if kind_name == "metadata" or not isinstance(kind.tag, str):
+                if kind.tail and in_text:
+                    self._text_anhaengen(element, kinder, kind.tail)
+                continue
+            self.bearbeite(kind, in_text)
+            if not in_text and kind_name in ("g", "defs") and len(kind) == 0:
+                continue
+            if kind_name == "g" and not kind.attrib and not in_text:
+                # Gruppe ohne Attribute (z.B. nach Entfernen der ID) auflösen
+                kinder.extend(kind)
+                continue
+            kinder.append(kind)
+
+        if not in_text:
+            element.text = element.text if element.text and element.text.strip() else None
+            for kind in kinder:
+                if kind.tail is not None and not kind.tail.strip():
+                    kind.tail = None
+            if self.stile and name in _GRUPPIERBAR:
+                kinder = self._gruppiere(kinder)
+        element[:] = kinder
+
+    @staticmethod
+    def _text_anhaengen(element, kinder, text):
+        if kinder:
+            kinder[-1].tail = (kinder[-1].tail or "") + text
+        else:
+            element.text = (element.text or "") + text
+
+    def _attribute(self, element: ET.Element, name: str, wurzel: bool):
+        stellen = self.stellen
+        for attribut, wert in list(element.attrib.items()):
+            lokal = _lokaler_name(attribut)
+            if attribut == "id" and wert not in self.verweise and not wurzel:
+                del element.attrib[attribut]
+            elif lokal == "d" and name == "path":
+                element.set(attribut, _pfad_kompakt(wert, stellen, self.relativ))
+            elif lokal in ("transform", "gradientTransform", "patternTransform"):
+                element.set(attribut, _transformation_kompakt(wert, stellen))
+            elif lokal == "style":
+                stil = {}
+                for eigenschaft, inhalt in _stil_lesen(wert).items():
+                    inhalt = _stil_wert(eigenschaft, inhalt, stellen)
+                    if inhalt is not None:
+                        stil[eigenschaft] = inhalt
+                if stil:
+                    element.set(attribut, _stil_schreiben(stil))
+                else:
+                    del element.attrib[attribut]
+            elif lokal in _ZAHL_ATTRIBUTE or lokal in _VERERBT:
+                inhalt = _stil_wert(lokal, wert, stellen)
+                if inhalt is None:
+                    del element.attrib[attribut]
+                else:
+                    element.set(attribut, inhalt)
+
+    def _vererbbar(self, element: ET.Element) -> dict[str, str]:
+        """Stil-Angaben eines Elements, die in eine Gruppe wandern dürfen."""
+        if _lokaler_name(element.tag) not in _GRAFIK or element.get("id") in self.verweise:
+            return {}
+        angaben = {k: v for k, v in element.attrib.items() if k in _VERERBT}
+        # style hat Vorrang vor Präsentationsattributen
+        angaben.update((k, v) for k, v in _stil_lesen(element.get("style", "")).items()
+                       if k in _VERERBT)
+        angaben = {k: v for k, v in angaben.items() if k not in self.feste}
+        # Clip-Pfade wirken auf eine Gruppe wie auf jedes Element einzeln,
+        # solange die Elemente kein eigenes Koordinatensystem haben
+        if "clip-path" in element.attrib and "transform" not in element.attrib:
+            angaben["clip-path"] = element.get("clip-path")
+        return angaben
+
+    @staticmethod
+    def _ersparnis(gemeinsam: set, anzahl: int) -> int:
+        # Je Angabe etwa ' name="wert"'; die Gruppe kostet '<g></g>' und die Angaben einmal
+        laenge = sum(len(k) + len(v) + 4 for k, v in gemeinsam)
+        return (anzahl - 1) * laenge - 7
+
+    def _gruppiere(self, kinder: list) -> list:
+        """Fasst gleiche vererbbare Angaben aufeinanderfolgender Kinder in Gruppen zusammen."""
+        angaben = [set(self._vererbbar(kind).items()) for kind in kinder]
+        ergebnis = []
+        i = 0
+        while i < len(kinder):
+            gemeinsam = angaben[i]
+            beste_ende, beste_angaben, beste_ersparnis = i + 1, gemeinsam, 0
+            j = i + 1
+            while j < len(kinder) and (gemeinsam := gemeinsam & angaben[j]):
+                j += 1
+                ersparnis = self._ersparnis(gemeinsam, j - i)
+                if ersparnis > beste_ersparnis:
+                    beste_ende, beste_angaben, beste_ersparnis = j, gemeinsam, ersparnis
+            if beste_ersparnis <= 0:
+                ergebnis.append(kinder[i])
+                i += 1
+                continue
+
+            gruppe = ET.Element(f"{{{_SVG}}}g")
+            # Reihenfolge der Angaben wie beim ersten Element
+            for name, wert in self._vererbbar(kinder[i]).items():
+                if (name, wert) in beste_angaben:
+                    gruppe.set(name, wert)
+            for kind in kinder[i:beste_ende]:
+                self._entferne_angaben(kind, gruppe.attrib)
+            # Übrige gemeinsame Angaben eines Teils der Gruppe in Untergruppen
+            gruppe.extend(self._gruppiere(kinder[i:beste_ende]))
+            ergebnis.append(gruppe)
+            i = beste_ende
+        return ergebnis
+
+    @staticmethod
+    def _entferne_angaben(element: ET.Element, angaben: dict):
+        for name in angaben:
+            element.attrib.pop(name, None)
+        if "style" in element.attrib:
+            stil = {k: v for k, v in _stil_lesen(element.get("style")).items() if k not in angaben}
+            if stil:
+                element.set("style", _stil_schreiben(stil))
+            else:
+                del element.attrib["style"]
+
+
+def _maskiere(text: str, attribut: bool = False) -> str:
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text.replace('"', "&quot;") if attribut else text
+
+
+def _serialisiere(wurzel: ET.Element) -> str:
+    """Schreibt den Elementbaum ohne Einrückung und mit kurzen Namensraum-Präfixen."""
+    praefixe = dict(_PRAEFIXE)
+    benutzt = {_SVG}
+
+    def qname(name: str) -> str:
+        if not name.startswith("{"):
+            return name
+        namensraum, lokal = name[1:].split("}", 1)
+        if namensraum not in praefixe:
+            praefixe[namensraum] = f"ns{len(praefixe) - len(_PRAEFIXE)}"
+        praefix = praefixe[namensraum]
+        benutzt.add(namensraum)
+        return f"{praefix}:{lokal}" if praefix else lokal
+
+    teile = []
+
+    def schreibe(element):
+        tag = qname(element.tag)
+        teile.append(f"<{tag}")
+        for name, wert in element.attrib.items():
+            teile.append(f' {qname(name)}="{_maskiere(wert, True)}"')
+        if element.text is None and len(element) == 0:
+            teile.append("/>")
+        else:
+            teile.append(">")
+            if element.text:
+                teile.append(_maskiere(element.text))
+            for kind in element:
+                schreibe(kind)
+                if kind.tail:
+                    teile.append(_maskiere(kind.tail))
+            teile.append(f"</{tag}>")
+
+    schreibe(wurzel)
+    # Namensräume erst nach dem Schreiben bekannt; am Wurzelelement deklarieren
+    deklarationen = "".join(
+        f' xmlns:{praefix}="{namensraum}"' if praefix else f' xmlns="{namensraum}"'
+        for namensraum, praefix in praefixe.items()
+        if namensraum in benutzt and namensraum != _XML
+    )
+    kopf = teile[0]
+    return kopf + deklarationen + "".join(teile[1:])
+
+
+def kompaktiere_svg(svg: bytes, stellen: int = STELLEN, relativ: bool = True,
+                    stile: bool = True) -> SvgKompakt:
+    """Verkleinert SVG-Daten ohne sichtbare Änderung.
+
+    Args:
+        svg: SVG-Daten (bytes, UTF-8), z.B. von ``exportiere_zeichnung``
+        stellen: Nachkommastellen für Koordinaten und Längen (in Einheiten
+            des jeweiligen Koordinatensystems, meist Punkte)
+        relativ: Relative Pfadbefehle verwenden, wo sie kürzer sind
+        stile: Gleiche Stil-Angaben aufeinanderfolgender Elemente in
+            Gruppen zusammenfassen
+
+    Returns:
+        Verkleinerte SVG-Daten sowie Größe vorher und nachher
+    """
+    wurzel = ET.fromstring(svg)
+    if _lokaler_name(wurzel.tag) != "svg":
+        raise ValueError(f"Kein SVG-Dokument (Wurzelelement {wurzel.tag!r})")
+    _Kompaktierer(wurzel, stellen, relativ, stile).bearbeite(wurzel)
+    daten = _serialisiere(wurzel).encode("utf-8")
+    return SvgKompakt(daten, len(svg), len(daten))
@@ -0,0 +1,148 @@
+"""SVG-Ausgabe mit ``<symbol>``/``<use>`` für wiederkehrende Komponenten.
+
+Ein Plan enthält oft mehrere gleiche Komponenten (LS-Schalter Q1, Q2, Q3,
+zwei gleiche Zähler, ...). Ihre Linien stammen aus demselben geteilten
+``Symbol`` (``komponenten.geometrie``); in der normalen SVG-Ausgabe werden
+sie trotzdem für jede Instanz vollständig als Pfad ausgeschrieben.
+
+``svg_mit_symbolen()`` schreibt die Linien jedes Symbols (je Stil) nur
+einmal als ``<symbol>`` in ``<defs>`` und setzt die Instanzen mit
+``<use>`` und einer Transformationsmatrix ein. Dateigröße und Parse-Zeit im
+Browser wachsen damit mit der Anzahl verschiedener Symbole statt mit der
+Anzahl Instanzen. Beschriftungen und alle übrigen Elemente (Leitungen,
+PELine, gespiegelte Symbole) werden wie im SVG-Backend von Schemdraw
+gezeichnet.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import NamedTuple
+
+import schemdraw
+from schemdraw import drawing_stack
+from schemdraw.backends.svg import Figure, fmt
+from schemdraw.segments import BBox, SegmentText
+from schemdraw.transform import Transform
+
+# Präfix der Symbol-IDs im SVG
+ID_PRAEFIX = "sym"
+
+# Element-Parameter, die das Aussehen der Symbol-Linien bestimmen
+_STIL = ('color', 'lw', 'ls', 'fill', 'capstyle', 'joinstyle', 'zorder')
+
+_IDENTITAET = Transform(0, (0, 0))
+
+
+class SymbolSvg(NamedTuple):
+    """Ergebnis von ``svg_mit_symbolen()``.
+
+    Attributes:
+        figur: Gezeichnete SVG-Figur (``schemdraw.backends.svg.Figure``)
+        symbole: Anzahl der ``<symbol>``-Definitionen
+        instanzen: Anzahl der ``<use>``-Verweise
+    """
+    figur: Figure
+    symbole: int
+    instanzen: int
+
+    @property
+    def svg(self) -> bytes:
+        """SVG-Daten (bytes)."""
+        return self.figur.getimage('svg')
+
+
+def _symbol_segmente(element) -> int:
+    """Anzahl der führenden Segmente aus dem geteilten Symbol (0 = keins).
+
+    Nur unveränderte Segmente (nicht gespiegelt) ohne Skalierung lassen sich
+    als ``<use>`` einsetzen; bei Skalierung würde sich die Linienbreite
+    mitändern.
+    """
+    symbol = getattr(element, 'geteiltes_symbol', None)
+    if symbol is None or 'gradient' in element.params:
+        return 0
+    if element.params.get('zoom', element.params.get('scale', 1)) not in (1, (1, 1)):
+        return 0
+    anzahl = len(symbol.segmente)
+    segmente = element.segments
+    if len(segmente) < anzahl or any(a is not b for a, b in zip(segmente, symbol.segmente)):
+        return 0
+    return anzahl
+
+
+def _matrix(fig: Figure, transform: Transform) -> str:
+    """SVG-Matrix von Symbol- in Bildkoordinaten (beide in Punkten, y nach unten)."""
+    ox, oy = fig.xform(*transform.transform((0, 0)))
+    ax, ay = fig.xform(*transform.transform((1 / fig.scale, 0)))
+    bx, by = fig.xform(*transform.transform((0, -1 / fig.scale)))
+    werte = (ax - ox, ay - oy, bx - ox, by - oy, ox, oy)
+    return f"matrix({' '.join(fmt(w) for w in werte)})"
+
+
+def _zeichne_symbol(segmente, params) -> dict[int, list]:
+    """Zeichnet Symbol-Segmente ohne Transformation, gruppiert nach zorder."""
+    skizze = Figure(bbox=BBox(0, 0, 1, 1))
+    for segment in segmente:
+        segment.draw(skizze, _IDENTITAET, **params)
+    ebenen: dict[int, list] = {}
+    for zorder, et in skizze.svgelements:
+        ebenen.setdefault(zorder, []).append(et)
+    return ebenen
+
+
+def svg_mit_symbolen(d: schemdraw.Drawing) -> SymbolSvg:
+    """Zeichnet eine Zeichnung als SVG mit ``<symbol>``/``<use>``.
+
+    Args:
+        d: Fertig aufgebaute Schemdraw-Zeichnung (beliebiger Canvas)
+
+    Returns:
+        Figur sowie Anzahl der Symbole und Instanzen
+    """
+    # Wie Drawing.draw(): noch offene Elemente eines with-Blocks übernehmen
+    drawing_stack.push_element(None)
+
+    fig = Figure(bbox=d.get_bbox(),
+                 inches_per_unit=d.dwgparams.get('inches_per_unit'),
+                 margin=d.dwgparams.get('margin'),
+                 showbbox=d.dwgparams.get('dwgbbox', False))
+    if 'bgcolor' in d.dwgparams:
+        fig.bgcolor(d.dwgparams['bgcolor'])
+    fig.svgdefs.extend(d.svgdefs)
+
+    # (Symbol, Stil) -> zorder -> ID
+    ids: dict[tuple, dict[int, str]] = {}
+    symbole = instanzen = 0
+    for element in d.elements:
+        anzahl = _symbol_segmente(element)
+        if not anzahl:
+            element._draw(fig)
+            continue
+
+        segmente = element.segments
+        linien = [s for s in segmente[:anzahl] if not isinstance(s, SegmentText)]
+        schluessel = (id(element.geteiltes_symbol),
+                      tuple(repr(element.params.get(k)) for k in _STIL))
+        if schluessel not in ids:
+            ids[schluessel] = {}
+            for zorder, ets in _zeichne_symbol(linien, element.params).items():
+                symbol_id = f"{ID_PRAEFIX}{symbole}"
+                symbole += 1
+                symbol = ET.Element('symbol', id=symbol_id, overflow='visible')
+                symbol.extend(ets)
+                fig.svgdefs.append(ET.tostring(symbol, encoding='unicode'))
+                ids[schluessel][zorder] = symbol_id
+
+        matrix = _matrix(fig, element.transform)
+        for zorder, symbol_id in ids[schluessel].items():
+            use = ET.Element('use')
+            use.set('xlink:href', f"#{symbol_id}")
+            use.set('transform', matrix)
+            fig.svgelements.append((zorder, use))
+            instanzen += 1
+
+        # Texte des Symbols, Beschriftung und eigene Labels je Instanz
+        texte = [s for s in segmente[:anzahl] if isinstance(s, SegmentText)]
+        for segment in texte + segmente[anzahl:]:
+            segment.draw(fig, element.transform, **element.params)
+
+    return SymbolSvg(fig, symbole, instanzen)
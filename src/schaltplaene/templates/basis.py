@@ -0,0 +1,307 @@
+"""Gemeinsame Basis für die Schaltplan-Templates.
+
+Enthält die Funktionen, die alle Templates gleichermaßen benötigen
+(Erzeugung der Zeichnung, Auswahl des Renderers, Export, Caching).
+"""
+
+import inspect
+from functools import lru_cache
+
+import schemdraw
+
+from schaltplaene import __version__
+from schaltplaene.komponenten.geometrie import kurvenaufloesung
+from schaltplaene.render import skelett
+from schaltplaene.render.cache import (
+    bibliotheks_versionen,
+    quellen_fingerprint,
+    render_schluessel,
+    standard_cache,
+)
+from schaltplaene.render.export import (
+    SVG_FORMATE,
+    exportiere_zeichnung,
+    nach_kurvenschritten,
+    pruefe_formate,
+    schreibe_dateien,
+)
+
+# Verfügbare Renderer:
+# - "matplotlib": Standard, unterstützt SVG, PNG und PDF
+# - "svg": Schemdraw-SVG-Backend, erzeugt SVG direkt aus den Segmenten
+#   ohne Matplotlib (deutlich schneller, aber nur SVG-Ausgabe)
+RENDERER = ("matplotlib", "svg")
+
+
+# Signaturen werden pro Klasse nur einmal ausgewertet (inspect ist langsam)
+@lru_cache(maxsize=None)
+def _parameter_namen(klasse) -> tuple[str, ...]:
+    namen = inspect.signature(klasse.__init__).parameters
+    return tuple(name for name in namen if name != 'self')
+
+
+@lru_cache(maxsize=None)
+def _standardtitel(klasse) -> str:
+    return inspect.signature(klasse.erstelle_schaltplan).parameters['titel'].default
+
+
+class TemplateBasis:
+    """Basisklasse für Schaltplan-Templates.
+
+    Abgeleitete Klassen implementieren ``erstelle_schaltplan()`` und nutzen
+    ``_neue_zeichnung()`` zum Anlegen der Zeichnung.
+    """
+
+    # Standard-Dateiname für speichere()
+    DATEINAME_BASIS = "schaltplan"
+
+    def _neue_zeichnung(self, renderer: str = "matplotlib") -> schemdraw.Drawing:
+        """Legt eine leere Zeichnung mit der Standard-Konfiguration an.
+
+        Args:
+            renderer: "matplotlib" oder "svg" (siehe ``RENDERER``)
+
+        Returns:
+            Konfiguriertes Schemdraw Drawing-Objekt
+        """
+        if renderer not in RENDERER:
+            raise ValueError(
+                f"Unbekannter Renderer {renderer!r}, erlaubt: {', '.join(RENDERER)}"
+            )
+        d = schemdraw.Drawing(canvas=renderer)
+        d.config(unit=2, fontsize=10)
+        return d
+
+    def parameter(self) -> dict:
+        """Liefert die Konstruktor-Parameter des Templates als Dictionary."""
+        return {name: getattr(self, name) for name in _parameter_namen(type(self))}
+
+    def standardtitel(self) -> str:
+        """Liefert den Standardtitel von ``erstelle_schaltplan()``."""
+        return _standardtitel(type(self))
+
+    def cache_schluessel(self, fmt: str, titel: str = None, renderer: str = "matplotlib",
+                         dpi: float = 72, transparent: bool = True, optimiere: bool = False,
+                         symbole: bool = False, kompakt: bool = False, png_modus: str = "rgba",
+                         antialiasing: bool = True) -> str:
+        """Kanonischer Hash für ein gerendertes Bild dieses Templates.
+
+        Berücksichtigt Template-Klasse, Parameter, Titel, Paketversion,
+        Quelltext-Fingerprint der Komponenten, Versionen der
+        Render-Bibliotheken, Format und Render-Optionen.
+        """
+        return render_schluessel(
+            template=f"{type(self).__module__}.{type(self).__qualname__}",
+            parameter=self.parameter(),
+            titel=self.standardtitel() if titel is None else titel,
+            version=__version__,
+            quellen=quellen_fingerprint(),
+            bibliotheken=bibliotheks_versionen(),
+            format=fmt,
+            renderer=renderer,
+            # Die Auflösung beeinflusst nur Rasterformate
+            dpi=dpi if fmt == 'png' else None,
+            transparent=transparent,
+            # Zusammengefasste Linien ändern die Ausgabe aller Formate
+            optimiere=optimiere,
+            # <symbol>/<use> und Verkleinern betreffen nur SVG/SVGZ
+            symbole=symbole if fmt in SVG_FORMATE else False,
+            kompakt=kompakt if fmt in SVG_FORMATE else False,
+            # Palette/1 Bit und Kantenglättung betreffen nur PNG
+            png_modus=png_modus.lower() if fmt == 'png' else None,
+            antialiasing=antialiasing if fmt == 'png' else None,
+        )
+
+    def zeichnung(self, titel: str = None, renderer: str = "matplotlib") -> schemdraw.Drawing:
+        """Erstellt die Schemdraw-Zeichnung, ohne Titel mit dem Standardtitel.
+
+        Für eigene Ausgaben auf Basis der Zeichnung (z.B. das Sammel-PDF in
+        ``render.pdf_buendel``); fertige Bilddaten liefern ``exportiere()``
+        und ``rendere()``.
+
+        Args:
+            titel: Titel des Schaltplans (None = Standardtitel des Templates)
+            renderer: "matplotlib" oder "svg"
+
+        Returns:
+            Noch nicht gezeichnete Schemdraw-Zeichnung
+        """
+        if titel is None:
+            return self.erstelle_schaltplan(renderer=renderer)
+        return self.erstelle_schaltplan(titel=titel, renderer=renderer)
+
+    def exportiere(self, formate=("svg", "png"), verzeichnis=None,
+                   dateiname_basis: str = None, titel: str = None,
+                   renderer: str = "matplotlib", dpi: float = 72,
+                   transparent: bool = True, optimiere: bool = False,
+                   symbole: bool = False, kompakt: bool = False, png_modus: str = "rgba",
+                   antialiasing: bool = True) -> dict[str, bytes]:
+        """Erstellt den Schaltplan einmal und exportiert ihn in mehrere Formate.
+
+        Die Zeichnung wird nur einmal gelayoutet und gezeichnet, alle Formate
+        werden aus derselben Figur geschrieben. Ausnahme: Formate mit anderer
+        Kurvenauflösung (``render.export.kurvenschritte_fuer``, z.B. PDF neben
+        SVG) werden mit einer eigenen Zeichnung erzeugt.
+
+        Args:
+            formate: Ausgabeformate ("svg", "svgz", "png", "pdf")
+            verzeichnis: Optionales Zielverzeichnis; wenn gesetzt, werden die
+                Dateien ``<dateiname_basis>.<format>`` dorthin geschrieben
+            dateiname_basis: Basis-Dateiname ohne Endung (Standard: DATEINAME_BASIS)
+            titel: Titel des Schaltplans (None = Standardtitel des Templates)
+            renderer: "matplotlib" oder "svg" (nur SVG/SVGZ-Ausgabe)
+            dpi: Auflösung für PNG
+            transparent: Transparenter Hintergrund
+            optimiere: Verbundene Linien gleichen Stils vor dem Zeichnen zu
+                einem Pfad zusammenfassen (``render.optimierung``)
+            symbole: Gleiche Komponenten im SVG nur einmal als ``<symbol>``
+                definieren und per ``<use>`` einsetzen (``render.svg_symbole``)
+            kompakt: SVG mit gerundeten Koordinaten, relativen Pfaden und
+                zusammengefassten Stilen ausgeben (``render.svg_kompakt``)
+            png_modus: PNG als "rgba", "palette" oder "1bit" schreiben
+                (``render.png_palette``)
+            antialiasing: PNG mit Kantenglättung rastern
+
+        Returns:
+            Dictionary Format -> Bilddaten (bytes)
+        """
+        formate = pruefe_formate(formate, renderer)
+        bilder = {}
+        for schritte, gruppe in nach_kurvenschritten(formate, dpi).items():
+            with kurvenaufloesung(schritte):
+                d = self.zeichnung(titel, renderer)
+                bilder.update(exportiere_zeichnung(d, gruppe, dpi=dpi, transparent=transparent,
+                                                   optimiere=optimiere, symbole=symbole,
+                                                   kompakt=kompakt, png_modus=png_modus,
+                                                   antialiasing=antialiasing))
+        bilder = {fmt: bilder[fmt] for fmt in formate}
+        if verzeichnis is not None:
+            schreibe_dateien(bilder, verzeichnis, dateiname_basis or self.DATEINAME_BASIS)
+        return bilder
+
+    def speichere(self, dateiname_basis: str = None, verzeichnis="output",
+                  formate=("png", "svg")):
+        """Erstellt und speichert den Schaltplan (Standard: PNG und SVG).
+
+        Args:
+            dateiname_basis: Basis-Dateiname ohne Endung (Standard: DATEINAME_BASIS)
+            verzeichnis: Zielverzeichnis (Standard: "output")
+            formate: Ausgabeformate ("svg", "svgz", "png", "pdf")
+        """
+        dateiname_basis = dateiname_basis or self.DATEINAME_BASIS
+        self.exportiere(formate, verzeichnis=verzeichnis, dateiname_basis=dateiname_basis)
+        dateien = " und ".join(f"{verzeichnis}/{dateiname_basis}.{fmt}" for fmt in formate)
+        print(f"Schaltplan gespeichert: {dateien}")
+
+    def fingerprint(self, fmt: str = "svg", titel: str = None, **optionen) -> str:
+        """Eingabe-Fingerprint eines Bildes, ohne zu rendern.
+
+        Hash über alles, was in das Bild eingeht (Template, Parameter, Titel,
+        Optionen, Paket- und Bibliotheksversionen, Komponenten-Quelltexte),
+        nicht über die Bilddaten selbst. Da der Export deterministisch ist
+        (keine Zeitstempel, feste IDs, siehe ``render.export``), liefert
+        gleicher Fingerprint byte-identische Bilddaten; umgekehrt können
+        verschiedene Fingerprints auch gleiche Bilder ergeben (z.B. Optionen
+        ohne Wirkung auf das Format). Geeignet als HTTP-ETag oder als
+        Dateiname im Archiv.
+
+        Args:
+            fmt: Ausgabeformat ("svg", "svgz", "png", "pdf")
+            titel: Titel des Schaltplans (None = Standardtitel des Templates)
+            **optionen: Render-Optionen wie bei ``rendere()`` (renderer, dpi,
+                transparent, optimiere, symbole, kompakt, png_modus, antialiasing)
+
+        Returns:
+            SHA-256 der Eingaben als Hex-String (identisch zu
+            ``cache_schluessel()``)
+        """
+        return self.cache_schluessel(pruefe_formate(fmt)[0], titel, **optionen)
+
+    def rendere(self, formate=("svg",), titel: str = None, renderer: str = "matplotlib",
+                dpi: float = 72, transparent: bool = True, optimiere: bool = False,
+                symbole: bool = False, kompakt: bool = False, png_modus: str = "rgba",
+                antialiasing: bool = True, cache=None, disk_cache=None) -> dict[str, bytes]:
+        """Liefert die Bilddaten des Schaltplans, bei Bedarf aus dem Cache.
+
+        Gesucht wird zuerst im Speicher-Cache, dann im optionalen Disk-Cache.
+        Nur die in keinem Cache vorhandenen Formate werden neu gerendert
+        (gemeinsam in einem Zeichenvorgang über ``exportiere()``).
+
+        Args:
+            formate: Ausgabeformate ("svg", "svgz", "png", "pdf")
+            titel: Titel des Schaltplans (None = Standardtitel des Templates)
+            renderer: "matplotlib" oder "svg" (nur SVG/SVGZ-Ausgabe)
+            dpi: Auflösung für PNG
+            transparent: Transparenter Hintergrund
+            optimiere: Verbundene Linien zusammenfassen (siehe ``exportiere()``)
+            symbole: SVG mit ``<symbol>``/``<use>`` (siehe ``exportiere()``)
+            kompakt: Verkleinertes SVG (siehe ``exportiere()``)
+            png_modus: "rgba", "palette" oder "1bit" (siehe ``exportiere()``)
+            antialiasing: PNG mit Kantenglättung rastern
+            cache: RenderCache-Instanz (Standard: ``render.cache.standard_cache``)
+            disk_cache: Optionale DiskCache-Instanz, die sich mehrere Prozesse teilen
+
+        Returns:
+            Dictionary Format -> Bilddaten (bytes)
+        """
+        cache = standard_cache if cache is None else cache
+        formate = pruefe_formate(formate, renderer)
+        titel = self.standardtitel() if titel is None else titel
+        optionen = dict(renderer=renderer, dpi=dpi, transparent=transparent, optimiere=optimiere,
+                        symbole=symbole, kompakt=kompakt, png_modus=png_modus,
+                        antialiasing=antialiasing)
+
+        schluessel = {fmt: self.cache_schluessel(fmt, titel, **optionen) for fmt in formate}
+        bilder = {}
+        for fmt, key in schluessel.items():
+            daten = cache.get(key)
+            if daten is None and disk_cache is not None:
+                daten = disk_cache.get(key)
+                if daten is not None:
+                    cache.put(key, daten)
+            if daten is not None:
+                bilder[fmt] = daten
+
+        fehlend = [fmt for fmt in formate if fmt not in bilder]
+        if fehlend:
+            for fmt, daten in self.exportiere(fehlend, titel=titel, **optionen).items():
+                cache.put(schluessel[fmt], daten)
+                if disk_cache is not None:
+                    disk_cache.put(schluessel[fmt], daten)
+                bilder[fmt] = daten
+        return {fmt: bilder[fmt] for fmt in formate}
+
+    def svg_render(self, titel: str = None) -> skelett.SvgRender:
+        """Rendert das SVG über ein vorkompiliertes Layout-Skelett.
+
+        Die Geometrie wird einmal pro Template-Klasse gezeichnet (siehe
+        ``render.skelett``), danach werden nur noch die Beschriftungen
+        eingesetzt. Das SVG entspricht ``exportiere(("svg",), renderer="svg",
+        symbole=True, kompakt=True)``: gleiche Komponenten stehen nur einmal
+        als ``<symbol>`` im SVG, Koordinaten und Stile sind verkleinert
+        (kleinere Vorschau in ``components.html``).
+        Texte mit Sonderzeichen (Mathtext ``$``, ``<``, ``>``, ``&``,
+        Zeilenumbrüche) werden vollständig gerendert.
+
+        Über ``SvgRender.aktualisiere()`` lassen sich geänderte Beschriftungen
+        anschließend gezielt einsetzen.
+
+        Args:
+            titel: Titel des Schaltplans (None = Standardtitel des Templates)
+
+        Returns:
+            SvgRender mit den SVG-Daten in ``svg``
+        """
+        titel = self.standardtitel() if titel is None else titel
+        return skelett.SvgRender.erzeuge(type(self), {**self.parameter(), skelett.TITEL: titel})
+
+    def rendere_kompiliert(self, titel: str = None) -> bytes:
+        """Liefert das SVG über ein vorkompiliertes Layout-Skelett (siehe ``svg_render()``).
+
+        Args:
+            titel: Titel des Schaltplans (None = Standardtitel des Templates)
+
+        Returns:
+            SVG-Daten (bytes)
+        """
+        return self.svg_render(titel).svg
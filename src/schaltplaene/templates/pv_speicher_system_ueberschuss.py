@@ -26,9 +26,10 @@ from schaltplaene.komponenten.batterie import Batterie
 from schaltplaene.komponenten.ueberspannungsschutz import Ueberspannungsschutz
 from schaltplaene.komponenten.pv_module import PVModul
 from schaltplaene.komponenten.pe_line import PELine
+from schaltplaene.templates.basis import TemplateBasis
 
 
-class PvSpeicherSystemUeberschuss:
+class PvSpeicherSystemUeberschuss(TemplateBasis):
     """Template für eine komplette PV-Anlage mit Speicher.
     
     Dieses Template erstellt einen vollständigen Schaltplan mit allen
@@ -46,6 +47,8 @@ class PvSpeicherSystemUeberschuss:
         pv_leistung: Nennleistung PV-Generator (z.B. "10kWp" oder 10.0)
     """
     
+    DATEINAME_BASIS = "pv_komplett"
+    
     def __init__(self,
                  f1_nennstrom_a: int = 50,
                  f2_nennstrom_a: int = 35,
@@ -67,18 +70,20 @@ class PvSpeicherSystemUeberschuss:
         self.batterie_spannung_v = batterie_spannung_v
         self.pv_leistung = pv_leistung
     
-    def erstelle_schaltplan(self, titel: str = "PV-Anlage mit Speicher und Netzanschluss") -> schemdraw.Drawing:
+    def erstelle_schaltplan(self, titel: str = "PV-Anlage mit Speicher und Netzanschluss",
+                            renderer: str = "matplotlib") -> schemdraw.Drawing:
         """Erstellt den kompletten Schaltplan.
         
         Args:
             titel: Titel des Schaltplans
+            renderer: "matplotlib" (Standard, SVG/PNG/PDF) oder "svg"
+                (reines SVG-Backend ohne Matplotlib, nur SVG-Ausgabe)
             
         Returns:
             Schemdraw Drawing-Objekt mit dem vollständigen Schaltplan
         """
         # Drawing erstellen
-        d = schemdraw.Drawing()
-        d.config(unit=2, fontsize=10)
+        d = self._neue_zeichnung(renderer)
         
         # Titel
         d += elm.Label().at((3, -1)).label(titel, fontsize=14, halign='center')
@@ -231,17 +236,6 @@ class PvSpeicherSystemUeberschuss:
         d += PELine(to_pos=(pe_horizontal_dx, 0)).at(pe_horizontal_start)
         
         return d
-    
-    def speichere(self, dateiname_basis: str = "pv_komplett"):
-        """Erstellt und speichert den Schaltplan als PNG und SVG.
-        
-        Args:
-            dateiname_basis: Basis-Dateiname ohne Endung (z.B. "pv_komplett")
-        """
-        d = self.erstelle_schaltplan()
-        d.save(f'output/{dateiname_basis}.png')
-        d.save(f'output/{dateiname_basis}.svg')
-        print(f"Schaltplan gespeichert: output/{dateiname_basis}.png und output/{dateiname_basis}.svg")
 
 
 if __name__ == "__main__":
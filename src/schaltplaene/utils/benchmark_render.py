@@ -0,0 +1,133 @@
+"""Benchmark der Render-Pfade für die Schaltplan-Templates.
+
+Misst, wie viele Schaltpläne pro Sekunde erzeugt werden können
+(Aufbau der Zeichnung + SVG-Ausgabe), jeweils für den Matplotlib-Renderer
+und das reine SVG-Backend, über vorkompilierte Layout-Skelette sowie die
+Wirkung von Render- und Disk-Cache. Zusätzlich wird geprüft, dass
+``import schaltplaene.komponenten`` im Zeitbudget bleibt (Exit-Code 1,
+falls nicht).
+
+Aufruf:
+    uv run python src/schaltplaene/utils/benchmark_render.py
+"""
+
+import sys
+import tempfile
+import time
+
+import matplotlib.pyplot as plt
+
+from schaltplaene.render.cache import RenderCache
+from schaltplaene.render.disk_cache import DiskCache
+from schaltplaene.templates.pv_speicher_system_ueberschuss import PvSpeicherSystemUeberschuss
+from schaltplaene.templates.pv_system_ueberschuss import PvSystemUeberschuss
+from schaltplaene.utils.importzeit import IMPORT_BUDGET_S, miss_importzeit
+
+
+def pruefe_importzeit(budget_s: float = IMPORT_BUDGET_S) -> bool:
+    """Prüft, ob ``import schaltplaene.komponenten`` im Zeitbudget bleibt.
+
+    Gemessen wird mit ``miss_importzeit()`` in einem frischen Interpreter.
+    Der Import darf Schemdraw nicht laden.
+
+    Returns:
+        True, wenn Budget eingehalten und Schemdraw nicht geladen wurde
+    """
+    messung = miss_importzeit()
+    ok = messung.dauer <= budget_s and "schemdraw" not in messung.module
+    print(f"{messung}, Budget {budget_s * 1000:.0f} ms -> {'OK' if ok else 'ÜBERSCHRITTEN'}")
+    return ok
+
+
+def miss_renders_pro_sekunde(template, renderer: str, anzahl: int = 20) -> float:
+    """Misst die SVG-Renders pro Sekunde für ein Template.
+
+    Args:
+        template: Template-Instanz (z.B. PvSpeicherSystemUeberschuss())
+        renderer: "matplotlib" oder "svg"
+        anzahl: Anzahl der Wiederholungen
+
+    Returns:
+        Renders pro Sekunde
+    """
+    # Aufwärmen (Imports, Font-Cache)
+    template.erstelle_schaltplan(renderer=renderer).get_imagedata('svg')
+
+    start = time.perf_counter()
+    for _ in range(anzahl):
+        template.erstelle_schaltplan(renderer=renderer).get_imagedata('svg')
+        # Matplotlib-Figuren freigeben, sonst wächst der Speicher mit jeder Iteration
+        plt.close('all')
+    dauer = time.perf_counter() - start
+    return anzahl / dauer
+
+
+def benchmark_renderer(anzahl: int = 20):
+    """Vergleicht Matplotlib- und SVG-Renderer für alle Templates."""
+    print(f"{'Template':<32} {'matplotlib':>12} {'svg':>12} {'Faktor':>8}")
+    for template in (PvSpeicherSystemUeberschuss(), PvSystemUeberschuss()):
+        mpl = miss_renders_pro_sekunde(template, "matplotlib", anzahl)
+        svg = miss_renders_pro_sekunde(template, "svg", anzahl)
+        print(f"{type(template).__name__:<32} {mpl:>10.1f}/s {svg:>10.1f}/s {svg / mpl:>7.1f}x")
+
+
+def benchmark_kompiliert(anzahl: int = 2000):
+    """Misst Renders über das vorkompilierte Layout-Skelett."""
+    for template in (PvSpeicherSystemUeberschuss(), PvSystemUeberschuss()):
+        # Erster Aufruf kompiliert das Skelett
+        template.rendere_kompiliert()
+
+        start = time.perf_counter()
+        for i in range(anzahl):
+            # Wechselnde Zählernummer, damit nichts aus einem Bild-Cache kommt
+            template.z1_zaehler_nr = f"1EMH{i:05d}"
+            template.rendere_kompiliert()
+        dauer = time.perf_counter() - start
+        print(f"{type(template).__name__:<32} kompiliert: {anzahl / dauer:>8.0f}/s "
+              f"({dauer / anzahl * 1e6:.0f} µs pro Render)")
+
+
+def benchmark_cache(anzahl: int = 200):
+    """Misst wiederholtes Rendern derselben Standard-Konfiguration mit Cache."""
+    cache = RenderCache(max_eintraege=16)
+    template = PvSpeicherSystemUeberschuss()
+
+    start = time.perf_counter()
+    for _ in range(anzahl):
+        template.rendere(("svg", "png"), cache=cache)
+    dauer = time.perf_counter() - start
+
+    statistik = cache.statistik()
+    print(f"\nRender-Cache: {anzahl / dauer:.0f} Renders/s "
+          f"(Treffer: {statistik['hits']}, Fehlschläge: {statistik['misses']})")
+
+
+def benchmark_disk_cache(anzahl: int = 200):
+    """Misst Renders mit leerem Speicher-Cache und gefülltem Disk-Cache.
+
+    Entspricht einem frisch gestarteten Prozess, der auf Bilder zugreift,
+    die ein anderer Prozess bereits gerendert hat.
+    """
+    template = PvSpeicherSystemUeberschuss()
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        disk = DiskCache(verzeichnis)
+        template.rendere(("svg", "png"), cache=RenderCache(), disk_cache=disk)
+
+        start = time.perf_counter()
+        for _ in range(anzahl):
+            template.rendere(("svg", "png"), cache=RenderCache(), disk_cache=disk)
+        dauer = time.perf_counter() - start
+
+        statistik = disk.statistik()
+        print(f"Disk-Cache:   {anzahl / dauer:.0f} Renders/s "
+              f"(Treffer: {statistik['hits']}, Fehlschläge: {statistik['misses']})")
+
+
+if __name__ == "__main__":
+    import_ok = pruefe_importzeit()
+    benchmark_renderer()
+    benchmark_kompiliert()
+    benchmark_cache()
+    benchmark_disk_cache()
+    if not import_ok:
+        sys.exit(1)
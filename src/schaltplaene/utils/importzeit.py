@@ -0,0 +1,56 @@
+"""Importzeit von ``schaltplaene.komponenten`` in einem frischen Interpreter.
+
+Gemeinsam genutzt von ``tests/test_import.py`` und ``benchmark_render.py``.
+Das Modul lädt selbst nur die Standardbibliothek.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+# Zeitbudget für ``import schaltplaene.komponenten`` in einem frischen Prozess
+IMPORT_BUDGET_S = 0.05
+
+# Verzeichnis, das das Paket ``schaltplaene`` enthält
+_PAKET_PFAD = Path(__file__).resolve().parents[2]
+
+_MESSUNG = """
+import json, sys, time
+start = time.perf_counter()
+import schaltplaene.komponenten
+dauer = time.perf_counter() - start
+print(json.dumps({"dauer": dauer, "module": sorted(sys.modules)}))
+"""
+
+
+class Importmessung(NamedTuple):
+    """Ergebnis von ``miss_importzeit()``.
+
+    Attributes:
+        dauer: Dauer des Imports in Sekunden
+        module: Namen aller danach geladenen Module
+    """
+    dauer: float
+    module: frozenset
+
+    def __str__(self) -> str:
+        return (f"Import schaltplaene.komponenten: {self.dauer * 1000:.1f} ms "
+                f"(Schemdraw geladen: {'ja' if 'schemdraw' in self.module else 'nein'})")
+
+
+def miss_importzeit() -> Importmessung:
+    """Misst ``import schaltplaene.komponenten`` in einem frischen Interpreter.
+
+    Bereits geladene Module (Schemdraw, Matplotlib) würden das Ergebnis
+    sonst verfälschen.
+    """
+    umgebung = {**os.environ,
+                "PYTHONPATH": os.pathsep.join(filter(None, (str(_PAKET_PFAD),
+                                                            os.environ.get("PYTHONPATH"))))}
+    ausgabe = subprocess.run([sys.executable, "-c", _MESSUNG], capture_output=True,
+                             text=True, check=True, env=umgebung).stdout
+    daten = json.loads(ausgabe)
+    return Importmessung(daten["dauer"], frozenset(daten["module"]))
@@ -0,0 +1,46 @@
+"""Gemeinsamer SVG-Cache der Streamlit-Seiten (``render.app_cache``)."""
+
+import gzip
+
+import pytest
+
+from schaltplaene.render import app_cache
+from schaltplaene.templates.pv_system_ueberschuss import PvSystemUeberschuss
+
+PARAMETER = {"wechselrichter_kw": 12.5, "z1_zaehler_nr": "1EMH0012345678"}
+TITEL = "Anlage Musterstraße 1"
+
+
+@pytest.fixture(autouse=True)
+def gemeinsam():
+    yield
+    app_cache.render_executor().beende()
+    app_cache.render_executor.clear()
+    app_cache.gemeinsamer_cache.clear()
+
+
+def _vollstaendig() -> bytes:
+    return PvSystemUeberschuss(**PARAMETER).exportiere(
+        ("svg",), titel=TITEL, renderer="svg", symbole=True, kompakt=True)["svg"]
+
+
+def test_ablegen_und_laden():
+    schluessel = app_cache.svg_ablegen(PvSystemUeberschuss, PARAMETER, TITEL)
+    assert schluessel in app_cache.gemeinsamer_cache()
+    svgz = app_cache.svgz_laden(schluessel, PvSystemUeberschuss, PARAMETER, TITEL)
+    assert gzip.decompress(svgz) == _vollstaendig()
+
+
+def test_verdraengtes_svg_wird_neu_erzeugt():
+    schluessel = app_cache.svg_ablegen(PvSystemUeberschuss, PARAMETER, TITEL)
+    app_cache.gemeinsamer_cache().leere()
+    # Die Sitzung kennt nur Schlüssel, Parameter und Titel
+    svg = app_cache.svg_laden(schluessel, PvSystemUeberschuss, PARAMETER, TITEL, "sitzung")
+    assert svg == _vollstaendig()
+    assert schluessel in app_cache.gemeinsamer_cache()
+
+
+def test_schluessel_haengt_von_parametern_ab():
+    schluessel = app_cache.svg_schluessel(PvSystemUeberschuss, PARAMETER, TITEL)
+    assert schluessel == app_cache.svg_schluessel(PvSystemUeberschuss, dict(PARAMETER), TITEL)
+    assert schluessel != app_cache.svg_schluessel(PvSystemUeberschuss, PARAMETER, "Anderer Titel")
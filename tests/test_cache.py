@@ -0,0 +1,55 @@
+"""LRU-Verdrängung im In-Prozess-Cache (``render.cache.RenderCache``)."""
+
+import pytest
+
+from schaltplaene.render.cache import RenderCache, render_schluessel
+
+
+def test_verdraengt_nach_anzahl_den_aeltesten():
+    cache = RenderCache(max_eintraege=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    # Zugriff frischt "a" auf, verdrängt wird dann "b"
+    assert cache.get("a") == b"1"
+    cache.put("c", b"3")
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert len(cache) == 2
+
+
+def test_verdraengt_nach_bytes():
+    cache = RenderCache(max_eintraege=10, max_bytes=10)
+    cache.put("a", b"x" * 4)
+    cache.put("b", b"x" * 4)
+    cache.put("c", b"x" * 4)
+    assert "a" not in cache
+    assert cache.groesse_bytes == 8
+    # Ersetzen zählt die alten Bytes nicht doppelt
+    cache.put("c", b"x" * 6)
+    assert cache.groesse_bytes == 10 and len(cache) == 2
+
+
+def test_zu_grosser_eintrag_wird_nicht_aufgenommen():
+    cache = RenderCache(max_bytes=10)
+    cache.put("a", b"x" * 5)
+    cache.put("gross", b"x" * 11)
+    assert "gross" not in cache and "a" in cache
+
+
+def test_statistik_zaehlt_treffer_und_fehlschlaege():
+    cache = RenderCache()
+    cache.put("a", b"1")
+    cache.get("a")
+    cache.get("b")
+    assert cache.statistik() == {'hits': 1, 'misses': 1, 'eintraege': 1, 'bytes': 1}
+    cache.leere()
+    assert cache.statistik() == {'hits': 0, 'misses': 0, 'eintraege': 0, 'bytes': 0}
+
+
+def test_mindestens_ein_eintrag():
+    with pytest.raises(ValueError):
+        RenderCache(max_eintraege=0)
+
+
+def test_schluessel_kanonisch():
+    assert render_schluessel(a=1, b="x") == render_schluessel(b="x", a=1)
+    assert render_schluessel(kw=10) != render_schluessel(kw=10.0)
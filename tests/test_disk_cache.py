@@ -0,0 +1,101 @@
+"""Persistenter Render-Cache (``render.disk_cache.DiskCache``)."""
+
+import hashlib
+import os
+
+import pytest
+
+from schaltplaene.render.cache import RenderCache
+from schaltplaene.render.disk_cache import DiskCache
+from schaltplaene.templates import basis
+from schaltplaene.templates.pv_system_ueberschuss import PvSystemUeberschuss
+
+
+def _dateien(verzeichnis):
+    return sorted(p.relative_to(verzeichnis).as_posix()
+                  for p in verzeichnis.rglob("*") if p.is_file())
+
+
+def _objekt(cache, daten: bytes):
+    digest = hashlib.sha256(daten).hexdigest()
+    return cache.verzeichnis / "objekte" / digest[:2] / digest
+
+
+def _setze_mtime(cache, schluessel: str, daten: bytes, zeit: float):
+    ref = cache.verzeichnis / "schluessel" / schluessel[:2] / schluessel
+    for pfad in (_objekt(cache, daten), ref):
+        os.utime(pfad, (zeit, zeit))
+
+
+def test_inhaltsadressiert(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put("k1", b"bild")
+    cache.put("k2", b"bild")
+    assert cache.get("k1") == b"bild" and cache.get("k2") == b"bild"
+    # Gleiche Bilddaten liegen nur einmal als Objekt vor
+    assert len(list((tmp_path / "objekte").rglob("*"))) == 2  # Unterordner + Objekt
+    assert cache.get("fehlt") is None
+    assert cache.statistik()['hits'] == 2 and cache.statistik()['misses'] == 1
+
+
+def test_gemeinsam_ueber_instanzen(tmp_path):
+    DiskCache(tmp_path).put("k", b"bild")
+    assert DiskCache(tmp_path).get("k") == b"bild"
+
+
+def test_atomar_ohne_reste(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path)
+    cache.put("alt", b"alt")
+    vorher = _dateien(tmp_path)
+
+    def fehlschlag(*_):
+        raise OSError("Platte voll")
+
+    monkeypatch.setattr(os, "replace", fehlschlag)
+    with pytest.raises(OSError):
+        cache.put("neu", b"neu")
+    # Weder halbe Zieldateien noch temporäre Dateien bleiben zurück
+    assert _dateien(tmp_path) == vorher
+
+
+def test_beschaedigtes_objekt_ist_fehlschlag(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put("k", b"bild")
+    _objekt(cache, b"bild").write_bytes(b"kaputt")
+    assert cache.get("k") is None
+    # Der Verweis wird entfernt, ein neues put() legt das Objekt wieder ab
+    assert not (tmp_path / "schluessel" / "k" / "k").exists()
+    cache.put("k", b"bild")
+    assert cache.get("k") == b"bild"
+
+
+def test_verdraengt_nach_mtime(tmp_path):
+    # Objekte je 1000 Bytes, Verweise je 64 Bytes: Mit "d" wird aufgeräumt,
+    # bis 90 % von max_bytes erreicht sind, also "b" und "c" verdrängt
+    daten = {name: name.encode() * 1000 for name in ("a", "b", "c", "d")}
+    cache = DiskCache(tmp_path, max_bytes=3500)
+    for zeit, name in enumerate("abc", start=1):
+        cache.put(name, daten[name])
+        _setze_mtime(cache, name, daten[name], 1_000_000 + zeit)
+    # Zugriff frischt "a" auf, "b" ist danach am längsten ungenutzt
+    assert cache.get("a") == daten["a"]
+
+    cache.put("d", daten["d"])
+    # Mit den Objekten verschwinden auch ihre Verweise
+    assert _dateien(tmp_path / "schluessel") == ["a/a", "d/d"]
+    assert cache.get("a") == daten["a"] and cache.get("d") == daten["d"]
+    assert cache.get("b") is None and cache.get("c") is None
+
+
+def test_neuer_quellen_fingerprint_macht_eintraege_ungueltig(tmp_path, monkeypatch):
+    template = PvSystemUeberschuss()
+    disk = DiskCache(tmp_path)
+    svg = template.rendere(("svg",), renderer="svg", cache=RenderCache(), disk_cache=disk)
+    schluessel = template.cache_schluessel("svg", renderer="svg")
+    assert disk.get(schluessel) == svg["svg"]
+
+    # Geänderter Komponenten-/Render-Code ergibt einen anderen Schlüssel
+    monkeypatch.setattr(basis, "quellen_fingerprint", lambda: "geaendert")
+    neuer_schluessel = template.cache_schluessel("svg", renderer="svg")
+    assert neuer_schluessel != schluessel
+    assert disk.get(neuer_schluessel) is None
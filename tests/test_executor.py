@@ -0,0 +1,75 @@
+"""Render-Executor (``render.executor.RenderExecutor``)."""
+
+import threading
+
+import pytest
+
+from schaltplaene.render.executor import RenderExecutor, RenderTimeoutError, RenderUeberlastetError
+
+
+@pytest.fixture
+def executor():
+    executor = RenderExecutor(max_warteschlange=4, max_pro_sitzung=2, timeout=5.0)
+    yield executor
+    executor.beende()
+
+
+def _blockiere(executor):
+    """Belegt den Worker, bis das zurückgegebene Event gesetzt wird."""
+    gestartet, weiter = threading.Event(), threading.Event()
+
+    def warte():
+        gestartet.set()
+        weiter.wait(5)
+
+    executor.einreihen("blockade", warte)
+    assert gestartet.wait(5)
+    return weiter
+
+
+def test_reihum_ueber_sitzungen(executor):
+    weiter = _blockiere(executor)
+    reihenfolge = []
+    futures = [executor.einreihen(sitzung, reihenfolge.append, name)
+               for sitzung, name in (("a", "a1"), ("a", "a2"), ("b", "b1"))]
+    weiter.set()
+    for future in futures:
+        future.result(5)
+    # "b" muss nicht warten, bis alle Aufträge von "a" erledigt sind
+    assert reihenfolge == ["a1", "b1", "a2"]
+
+
+def test_ueberlastet_je_sitzung_und_gesamt(executor):
+    weiter = _blockiere(executor)
+    try:
+        executor.einreihen("a", int)
+        executor.einreihen("a", int)
+        with pytest.raises(RenderUeberlastetError):
+            executor.einreihen("a", int)
+        executor.einreihen("b", int)
+        executor.einreihen("c", int)
+        assert executor.wartend == 4
+        with pytest.raises(RenderUeberlastetError):
+            executor.einreihen("d", int)
+    finally:
+        weiter.set()
+
+
+def test_timeout_verwirft_wartenden_auftrag(executor):
+    weiter = _blockiere(executor)
+    ausgefuehrt = []
+    try:
+        with pytest.raises(RenderTimeoutError):
+            executor.ausfuehren("a", ausgefuehrt.append, 1, timeout=0.05)
+    finally:
+        weiter.set()
+    # Der abgebrochene Auftrag wird übersprungen, der nächste läuft normal
+    assert executor.ausfuehren("a", lambda: 42) == 42
+    assert ausgefuehrt == []
+
+
+def test_fehler_erreicht_den_aufrufer(executor):
+    with pytest.raises(ZeroDivisionError):
+        executor.ausfuehren("a", lambda: 1 / 0)
+    # Der Worker läuft danach weiter
+    assert executor.ausfuehren("a", sum, (1, 2)) == 3
@@ -0,0 +1,35 @@
+"""Eingabe-Fingerprint und Cache-Schlüssel der Templates (``TemplateBasis.fingerprint``)."""
+
+from schaltplaene.render.cache import RenderCache
+from schaltplaene.templates.pv_system_ueberschuss import PvSystemUeberschuss
+
+
+def test_gleiche_eingaben_gleicher_fingerprint():
+    assert PvSystemUeberschuss().fingerprint("svg") == PvSystemUeberschuss().fingerprint("svg")
+    assert (PvSystemUeberschuss().fingerprint("svg")
+            != PvSystemUeberschuss(wechselrichter_kw=12.5).fingerprint("svg"))
+
+
+def test_optionen_ohne_wirkung_aendern_den_fingerprint_nicht():
+    template = PvSystemUeberschuss()
+    # Die Auflösung betrifft nur PNG
+    assert template.fingerprint("svg", dpi=300) == template.fingerprint("svg")
+    assert template.fingerprint("png", dpi=300) != template.fingerprint("png")
+
+
+def test_optimiere_im_fingerprint():
+    template = PvSystemUeberschuss()
+    normal = template.exportiere(("svg",))["svg"]
+    optimiert = template.exportiere(("svg",), optimiere=True)["svg"]
+    assert normal != optimiert
+    assert template.fingerprint("svg", optimiere=True) != template.fingerprint("svg")
+
+
+def test_rendere_mit_optimiere():
+    template = PvSystemUeberschuss()
+    cache = RenderCache()
+    optimiert = template.rendere(("svg",), optimiere=True, cache=cache)["svg"]
+    assert optimiert == template.exportiere(("svg",), optimiere=True)["svg"]
+    # Nicht optimiertes SVG liegt unter einem eigenen Schlüssel
+    assert template.rendere(("svg",), cache=cache)["svg"] == template.exportiere(("svg",))["svg"]
+    assert len(cache) == 2
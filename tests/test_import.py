@@ -0,0 +1,15 @@
+"""Importzeit von ``schaltplaene.komponenten`` (Lazy Loading, PEP 562)."""
+
+from schaltplaene.utils.importzeit import IMPORT_BUDGET_S, miss_importzeit
+
+
+def test_import_laedt_schemdraw_nicht():
+    module = miss_importzeit().module
+    assert "schemdraw" not in module
+    assert "matplotlib" not in module
+
+
+def test_import_im_zeitbudget():
+    # Bestes von drei Läufen, damit ein kurz ausgelasteter Rechner nicht stört
+    dauer = min(miss_importzeit().dauer for _ in range(3))
+    assert dauer <= IMPORT_BUDGET_S, f"Import dauerte {dauer * 1000:.1f} ms"
@@ -0,0 +1,51 @@
+"""Sammel-PDF (``render.pdf_buendel.exportiere_pdf_buendel``)."""
+
+import io
+import re
+
+from schaltplaene.render.pdf_buendel import exportiere_pdf_buendel
+from schaltplaene.templates.pv_speicher_system_ueberschuss import PvSpeicherSystemUeberschuss
+from schaltplaene.templates.pv_system_ueberschuss import PvSystemUeberschuss
+
+# Seitenobjekte im (unkomprimierten) PDF-Objektverzeichnis, ohne /Pages
+_SEITE = re.compile(rb"/Type\s*/Page\b")
+
+
+def _seiten(pdf: bytes) -> int:
+    return len(_SEITE.findall(pdf))
+
+
+def _anlagen(anzahl: int):
+    """Generator wie bei einem Sammelantrag: Templates entstehen erst beim Schreiben."""
+    for nummer in range(anzahl):
+        if nummer % 2:
+            yield PvSystemUeberschuss(wechselrichter_kw=5.0 + nummer)
+        else:
+            yield PvSpeicherSystemUeberschuss(wechselrichter_kw=5.0 + nummer), f"Anlage {nummer}"
+
+
+def test_eine_seite_je_anlage():
+    puffer = io.BytesIO()
+    fortschritt = []
+    ergebnis = exportiere_pdf_buendel(_anlagen(3), puffer,
+                                      fortschritt=lambda b: fortschritt.append(b.seiten))
+    assert ergebnis.seiten == 3
+    assert _seiten(puffer.getvalue()) == 3
+    assert fortschritt == [1, 2, 3]
+
+
+def test_deterministisch_und_optimiert(tmp_path):
+    pfade = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+    for pfad in pfade:
+        exportiere_pdf_buendel(_anlagen(2), pfad)
+    # Ohne Zeitstempel: gleiche Anlagen ergeben gleiche Dateien
+    assert pfade[0].read_bytes() == pfade[1].read_bytes()
+
+    optimiert = tmp_path / "optimiert.pdf"
+    assert exportiere_pdf_buendel(_anlagen(2), optimiert, optimiere=True).seiten == 2
+    assert _seiten(optimiert.read_bytes()) == 2
+
+
+def test_leer():
+    puffer = io.BytesIO()
+    assert exportiere_pdf_buendel([], puffer).seiten == 0
@@ -0,0 +1,84 @@
+"""Gekachelter PNG-Export (``render.png_kacheln``) gegen ``savefig()``."""
+
+from contextlib import nullcontext
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from schaltplaene.render.export import _ohne_antialiasing
+from schaltplaene.render.png_kacheln import schreibe_png_gekachelt
+from schaltplaene.render.png_palette import reduziere_png
+from schaltplaene.templates.pv_speicher_system_ueberschuss import PvSpeicherSystemUeberschuss
+
+DPI = 150
+
+# Etwa 8 Kacheln bei 150 dpi; die PELine und der gestrichelte HAK-Rahmen
+# kreuzen mehrere Kachelgrenzen
+KACHEL_PIXEL = 150_000
+
+
+@pytest.fixture(scope="module")
+def figur():
+    import matplotlib.pyplot as plt
+
+    fig = PvSpeicherSystemUeberschuss().erstelle_schaltplan().draw(show=False)
+    mpl_fig = fig.getfig()
+    yield mpl_fig, fig.ax.get_default_bbox_extra_artists()
+    plt.close(mpl_fig)
+
+
+def _pixel(png: bytes):
+    return np.asarray(Image.open(BytesIO(png)).convert("RGBA"), dtype=np.int16)
+
+
+def _savefig(mpl_fig, extra, transparent: bool, antialiasing: bool) -> bytes:
+    puffer = BytesIO()
+    with nullcontext() if antialiasing else _ohne_antialiasing(mpl_fig):
+        mpl_fig.savefig(puffer, format="png", dpi=DPI, transparent=transparent,
+                        bbox_inches="tight", bbox_extra_artists=extra, pad_inches=0)
+    return puffer.getvalue()
+
+
+def _gekachelt(mpl_fig, extra, transparent: bool, antialiasing: bool,
+               png_modus: str = "rgba", kachel_pixel: int = KACHEL_PIXEL):
+    puffer = BytesIO()
+    ergebnis = schreibe_png_gekachelt(mpl_fig, puffer, DPI, transparent, png_modus,
+                                      antialiasing, extra, kachel_pixel)
+    return ergebnis, puffer.getvalue()
+
+
+@pytest.mark.parametrize("transparent, antialiasing", [
+    (False, True),
+    (True, True),
+    (True, False),
+])
+def test_kacheln_wie_savefig(figur, transparent, antialiasing):
+    mpl_fig, extra = figur
+    erwartet = _pixel(_savefig(mpl_fig, extra, transparent, antialiasing))
+    ergebnis, png = _gekachelt(mpl_fig, extra, transparent, antialiasing)
+    assert ergebnis.kacheln > 1
+    assert (ergebnis.hoehe, ergebnis.breite) == erwartet.shape[:2]
+    # Der je Kachel verschobene Ursprung kann die Kantenglättung einzelner
+    # Pixel um eine Stufe ändern, Strichmuster und Ecken müssen stimmen
+    assert np.abs(_pixel(png) - erwartet).max() <= 1
+
+
+def test_eine_kachel_identisch(figur):
+    mpl_fig, extra = figur
+    erwartet = _pixel(_savefig(mpl_fig, extra, False, True))
+    ergebnis, png = _gekachelt(mpl_fig, extra, False, True, kachel_pixel=10**12)
+    assert ergebnis.kacheln == 1
+    assert np.array_equal(_pixel(png), erwartet)
+
+
+@pytest.mark.parametrize("transparent", [False, True])
+def test_palette_wie_reduziere_png(figur, transparent):
+    # Gleiche Palette und Zuordnung wie ungekachelt, auch mit Kantenglättung
+    mpl_fig, extra = figur
+    erwartet = reduziere_png(_savefig(mpl_fig, extra, transparent, True), "palette")
+    ergebnis, png = _gekachelt(mpl_fig, extra, transparent, True, "palette")
+    assert ergebnis.kacheln > 1
+    assert Image.open(BytesIO(png)).mode == "P"
+    assert np.array_equal(_pixel(png), _pixel(erwartet))
@@ -0,0 +1,49 @@
+"""Gezieltes Aktualisieren des SVG (``render.skelett.SvgRender``)."""
+
+import pytest
+
+from schaltplaene.templates.pv_speicher_system_ueberschuss import PvSpeicherSystemUeberschuss
+
+
+def _vollstaendig(titel=None, **parameter) -> bytes:
+    """SVG eines vollständigen Durchlaufs, dem ``svg_render()`` entspricht."""
+    return PvSpeicherSystemUeberschuss(**parameter).exportiere(
+        ("svg",), titel=titel, renderer="svg", symbole=True, kompakt=True)["svg"]
+
+
+def test_erzeuge_wie_vollstaendig():
+    assert PvSpeicherSystemUeberschuss().svg_render().svg == _vollstaendig()
+
+
+@pytest.mark.parametrize("aenderungen", [
+    {"wechselrichter_kw": 12.5},
+    {"z1_zaehler_nr": "1EMH0012345678", "titel": "Anlage Musterstraße 1"},
+    # Breitere Beschriftung verschiebt die Bildgröße (viewBox)
+    {"pv_leistung": "123456789 kWp (Ost/West)"},
+    # Leerer Wert ändert die Geometrie: neues Skelett
+    {"z1_zaehler_nr": ""},
+    # Sonderzeichen (Zeilenumbruch): vollständig neu gezeichnet
+    {"titel": "PV-Anlage mit Speicher\nEntwurf"},
+])
+def test_aktualisiere_wie_vollstaendig(aenderungen):
+    render = PvSpeicherSystemUeberschuss().svg_render()
+    parameter = dict(aenderungen)
+    titel = parameter.pop("titel", None)
+    assert render.aktualisiere(**aenderungen).svg == _vollstaendig(titel, **parameter)
+
+
+def test_aktualisiere_nutzt_skelett():
+    render = PvSpeicherSystemUeberschuss().svg_render()
+    neu = render.aktualisiere(wechselrichter_kw=12.5)
+    assert neu.skelett is render.skelett
+    assert neu.teile[0] is render.teile[0]
+
+
+def test_aktualisiere_ohne_aenderung():
+    render = PvSpeicherSystemUeberschuss().svg_render()
+    assert render.aktualisiere(wechselrichter_kw=10.0) is render
+
+
+def test_aktualisiere_unbekannter_parameter():
+    with pytest.raises(ValueError):
+        PvSpeicherSystemUeberschuss().svg_render().aktualisiere(unbekannt=1)
@@ -0,0 +1,69 @@
+"""Verkleinern von SVG-Daten (``render.svg_kompakt.kompaktiere_svg``)."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from schaltplaene.render.svg_kompakt import _pfad_absolut, kompaktiere_svg, zahl
+from schaltplaene.templates.pv_speicher_system_ueberschuss import PvSpeicherSystemUeberschuss
+
+_SVG = "{http://www.w3.org/2000/svg}"
+
+
+@pytest.fixture(scope="module", params=["svg", "matplotlib"])
+def svg(request) -> bytes:
+    return PvSpeicherSystemUeberschuss().exportiere(
+        ("svg",), titel="Anlage Musterstraße 1", renderer=request.param)["svg"]
+
+
+def _pfade(svg: bytes) -> list:
+    """Alle Pfade in Dokumentreihenfolge mit absoluten Koordinaten."""
+    return [_pfad_absolut(pfad.get("d")) for pfad in ET.fromstring(svg).iter(f"{_SVG}path")
+            if pfad.get("d")]
+
+
+def _texte(svg: bytes) -> list[str]:
+    return ["".join(text.itertext()) for text in ET.fromstring(svg).iter(f"{_SVG}text")]
+
+
+@pytest.mark.parametrize("stellen", [1, 2, 3])
+def test_geometrie_innerhalb_der_toleranz(svg, stellen):
+    kompakt = kompaktiere_svg(svg, stellen=stellen)
+    assert kompakt.nachher < kompakt.vorher
+
+    # Höchstens eine halbe Einheit der letzten Stelle, auch bei relativen Befehlen
+    toleranz = 0.5 * 10 ** -stellen + 1e-9
+    vorher, nachher = _pfade(svg), _pfade(kompakt.svg)
+    assert len(vorher) == len(nachher)
+    for pfad_vorher, pfad_nachher in zip(vorher, nachher):
+        assert [b for b, _ in pfad_vorher] == [b for b, _ in pfad_nachher]
+        for (befehl, werte_vorher), (_, werte_nachher) in zip(pfad_vorher, pfad_nachher):
+            abweichung = max((abs(a - b) for a, b in zip(werte_vorher, werte_nachher)), default=0)
+            assert abweichung <= toleranz, (befehl, werte_vorher, werte_nachher)
+
+
+def test_texte_unveraendert(svg):
+    assert _texte(kompaktiere_svg(svg).svg) == _texte(svg)
+
+
+def test_ohne_relative_pfade_und_gruppen(svg):
+    kompakt = kompaktiere_svg(svg, relativ=False, stile=False)
+    assert all(b.isupper() for pfad in _pfade(kompakt.svg) for b, _ in pfad)
+    assert len(kompakt.svg) > len(kompaktiere_svg(svg).svg)
+
+
+@pytest.mark.parametrize("wert, stellen, text", [
+    (111.60000000000001, 2, "111.6"),
+    (0.5, 2, ".5"),
+    (-0.5, 2, "-.5"),
+    (-0.001, 2, "0"),
+    (12.345, 1, "12.3"),
+    (3.0, 2, "3"),
+])
+def test_zahl(wert, stellen, text):
+    assert zahl(wert, stellen) == text
+
+
+def test_kein_svg():
+    with pytest.raises(ValueError):
+        kompaktiere_svg(b"<html/>")